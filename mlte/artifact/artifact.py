@@ -7,7 +7,7 @@ Artifact protocol implementation.
 from __future__ import annotations
 
 import abc
-from typing import Optional
+from typing import Optional, Sequence
 
 import mlte._private.meta as meta
 from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
@@ -29,6 +29,13 @@ class Artifact(metaclass=abc.ABCMeta):
     operations with them, namely persistence.
     """
 
+    LAZY_BLOBS: bool = False
+    """
+    Whether from_model() accepts models with large payloads left in the store's blob area,
+    reading them on first access. Subclasses that override from_model() must handle such
+    models before enabling it.
+    """
+
     @classmethod
     def __subclasshook__(cls, subclass):
         return meta.has_callables(subclass, "to_model", "from_model")
@@ -151,6 +158,63 @@ class Artifact(metaclass=abc.ABCMeta):
                 parents=parents,
             )
 
+    @staticmethod
+    def save_all(
+        artifacts: Sequence[Artifact],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> None:
+        """
+        Save several artifacts to the configured global session at once.
+        :param artifacts: The artifacts to save
+        :param force: Indicates that existing artifacts may be overwritten
+        :param parents: Indicates whether organizational elements for the
+        artifacts are created implicitly on write (default: False)
+
+        This is equivalent to calling:
+            Artifact.save_all_with(artifacts, session().context, session().store)
+        """
+        Artifact.save_all_with(
+            artifacts,
+            session().context,
+            session().artifact_store,
+            force=force,
+            parents=parents,
+        )
+
+    @staticmethod
+    def save_all_with(
+        artifacts: Sequence[Artifact],
+        context: Context,
+        store: ArtifactStore,
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> None:
+        """
+        Save several artifacts with the given context and store configuration, with a single
+        write to the store instead of one per artifact.
+        :param artifacts: The artifacts to save
+        :param context: The context in which to save the artifacts
+        :param store: The store in which to save the artifacts
+        :param force: Indicates that existing artifacts may be overwritten
+        :param parents: Indicates whether organizational elements for the
+        artifacts are created implicitly on write (default: False)
+        """
+        for artifact in artifacts:
+            artifact.pre_save_hook(context, store)
+
+        artifact_models = [artifact.to_model() for artifact in artifacts]
+        with ManagedArtifactSession(store.session()) as handle:
+            handle.write_artifacts_with_header(
+                context.model,
+                context.version,
+                artifact_models,
+                force=force,
+                parents=parents,
+            )
+
     @classmethod
     def load(cls, identifier: Optional[str] = None) -> Artifact:
         """
@@ -189,6 +253,7 @@ class Artifact(metaclass=abc.ABCMeta):
                     context.model,
                     context.version,
                     identifier,
+                    resolve_blobs=not cls.LAZY_BLOBS,
                 )
             )
 
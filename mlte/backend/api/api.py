@@ -8,6 +8,7 @@ from fastapi import APIRouter
 
 from mlte.backend.api.endpoints import (
     artifact,
+    blob,
     catalog_entry,
     context,
     group,
@@ -45,3 +46,8 @@ api_router.include_router(
     prefix=f"{_ARTIFACT_PREFIX}/artifact",
     tags=["artifact"],
 )
+api_router.include_router(
+    blob.router,
+    prefix=f"/{ResourceType.MODEL.value}" "/{model_id}/blob",
+    tags=["blob"],
+)
@@ -6,8 +6,8 @@ Authentication handling.
 
 import logging
 
+from mlte.backend.core.state import state
 from mlte.store.user.store_session import UserStoreSession
-from mlte.user import passwords
 
 
 def authenticate_user(
@@ -23,7 +23,9 @@ def authenticate_user(
             f"Error reading user; type is: {ex.__class__.__name__}, error is: {ex}"
         )
         return False
-    if not passwords.verify_password(password, user.hashed_password):
+    if not state.password_verifier.verify(
+        username, password, user.hashed_password
+    ):
         # print(f"Could not verify password <{password}> vs hashed <{user.hashed_password}>")
         return False
     else:
@@ -6,6 +6,7 @@ Setup of OAuth based authorization checks.
 
 import logging
 from json import JSONDecodeError
+from typing import Optional
 
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
@@ -19,6 +20,7 @@ from mlte.backend.api.models.artifact_model import USER_ME_ID
 from mlte.backend.core import state_stores
 from mlte.backend.core.config import settings
 from mlte.backend.core.state import state
+from mlte.backend.core.user_cache import CachedUser
 from mlte.store.user.store import UserStore
 from mlte.user.model import (
     BasicUser,
@@ -85,8 +87,15 @@ def get_username_from_token(token: str, key: str) -> str:
     return decoded_token.username
 
 
-def is_authorized(current_user: BasicUser, resource: Permission) -> bool:
-    """Checks if the current user is authorized to access the current resource."""
+def is_authorized(
+    current_user: BasicUser,
+    resource: Permission,
+    cached_user: Optional[CachedUser] = None,
+) -> bool:
+    """
+    Checks if the current user is authorized to access the current resource.
+    If the user's permissions were indexed in the cache, they are looked up instead of scanned.
+    """
     # print(
     #    f"Checking authorization for user {current_user.username} to resource {resource}"
     # )
@@ -106,6 +115,8 @@ def is_authorized(current_user: BasicUser, resource: Permission) -> bool:
         # Check to find if the current user has permissions through any of its groups.
         # print(current_user.groups)
         logging.info(f"Checking authorization for resource: {resource}")
+        if cached_user is not None:
+            return cached_user.grants_access(resource)
         for group in current_user.groups:
             # print(group)
             for permission in group.permissions:
@@ -151,15 +162,19 @@ async def get_authorized_user(
             error_decription=f"Could not decode token: {ex}",
         )
 
-    # Check if user in token exists.
-    user = None
-    with state_stores.user_store_session() as user_store:
-        user = user_store.user_mapper.read(username)
-    if user is None:
-        raise HTTPAuthException(
-            error="invalid_token",
-            error_decription="Username in token was not found.",
-        )
+    # Check if user in token exists, unless it was recently found for the same token.
+    cached_user = state.user_cache.get(username, token)
+    if cached_user is None:
+        user = None
+        with state_stores.user_store_session() as user_store:
+            user = user_store.user_mapper.read(username)
+        if user is None:
+            raise HTTPAuthException(
+                error="invalid_token",
+                error_decription="Username in token was not found.",
+            )
+        cached_user = state.user_cache.put(username, token, user)
+    user = cached_user.user
 
     # Check if user is enabled to be used.
     if user.disabled:
@@ -168,7 +183,7 @@ async def get_authorized_user(
         )
 
     # Check proper authorizations.
-    if not is_authorized(user, resource):
+    if not is_authorized(user, resource, cached_user):
         raise HTTPException(
             status_code=codes.FORBIDDEN,
             detail="User is not authorized to access this resource.",
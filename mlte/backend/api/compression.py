@@ -0,0 +1,263 @@
+"""
+mlte/backend/api/compression.py
+
+Compression of response bodies, negotiated with clients through Accept-Encoding.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Callable, Dict, List, Optional
+
+from anyio import to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mlte.backend.api.etag import ETAG_HEADER
+from mlte.backend.api.models.artifact_model import NDJSON_MEDIA_TYPE
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    # Optional; only gzip is offered without it.
+    zstandard = None  # type: ignore[assignment]
+
+COMPRESSED_MEDIA_TYPES = {"application/json", NDJSON_MEDIA_TYPE}
+"""Media types of the responses that are compressed; blobs are left as they are, as they are often compressed already."""
+
+THREAD_MINIMUM_SIZE = 256 * 1024
+"""Chunks at least this large are compressed in a thread, so they don't block the event loop."""
+
+
+class Compressor:
+    """Compresses the chunks of a single response body."""
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses a chunk, returning all the output available so far."""
+        raise NotImplementedError("Can't compress without a specific encoding.")
+
+    def finish(self, data: bytes) -> bytes:
+        """Compresses the last chunk, and ends the compressed stream."""
+        raise NotImplementedError("Can't compress without a specific encoding.")
+
+
+class GzipCompressor(Compressor):
+    """Compresses with gzip."""
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(
+            level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        # Flushed, so each streamed chunk can be decoded as soon as it arrives.
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class ZstdCompressor(Compressor):
+    """Compresses with zstd, which is faster than gzip for similar ratios."""
+
+    def __init__(self) -> None:
+        self._compressor = zstandard.ZstdCompressor().compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        result: bytes = self._compressor.compress(
+            data
+        ) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return result
+
+    def finish(self, data: bytes) -> bytes:
+        result: bytes = (
+            self._compressor.compress(data) + self._compressor.flush()
+        )
+        return result
+
+
+def get_encodings() -> List[str]:
+    """Returns the supported encodings, preferred first."""
+    return ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Chooses the encoding of a response from the Accept-Encoding header of its request.
+    :param accept_encoding: The value of the header, if any
+    :return: The preferred supported encoding the client accepts, or None to send the body as is
+    """
+    if not accept_encoding:
+        return None
+
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    candidates = [
+        encoding
+        for encoding in get_encodings()
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0
+    ]
+    if len(candidates) == 0:
+        return None
+    # Python's sort is stable, so ties keep the server's preference.
+    return sorted(
+        candidates,
+        key=lambda encoding: -accepted.get(encoding, accepted.get("*", 0.0)),
+    )[0]
+
+
+class CompressionMiddleware:
+    """Compresses JSON responses with the best encoding that the client accepts, including streamed ones."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int, level: int) -> None:
+        self.app = app
+        """The wrapped application."""
+
+        self.minimum_size = minimum_size
+        """Bodies smaller than this are not compressed, unless they are streamed."""
+
+        self.level = level
+        """The gzip compression level."""
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("Accept-Encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(
+            send,
+            encoding,
+            lambda: (
+                ZstdCompressor()
+                if encoding == "zstd"
+                else GzipCompressor(self.level)
+            ),
+            self.minimum_size,
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Compresses the body messages of one response, holding back its start until it knows whether to."""
+
+    def __init__(
+        self,
+        send: Send,
+        encoding: str,
+        create_compressor: Callable[[], Compressor],
+        minimum_size: int,
+    ) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._create_compressor = create_compressor
+        self._minimum_size = minimum_size
+
+        self._start: Optional[Message] = None
+        """The start message, sent with the first body message."""
+
+        self._compressor: Optional[Compressor] = None
+        """The compressor, once the response is known to be compressed."""
+
+        self._passthrough = False
+        """Whether the response is sent as is."""
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            media_type = (
+                headers.get("content-type", "").partition(";")[0].strip()
+            )
+            if (
+                message["status"] < 200
+                or message["status"] in (204, 206, 304)
+                or "content-encoding" in headers
+                or media_type not in COMPRESSED_MEDIA_TYPES
+            ):
+                self._passthrough = True
+                await self._send(message)
+            else:
+                self._start = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self._start is None:
+            await self._send_compressed(body, more_body)
+            return
+
+        start, self._start = self._start, None
+        if not more_body and len(body) < self._minimum_size:
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+
+        headers = MutableHeaders(raw=start["headers"])
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get(ETAG_HEADER)
+        if etag is not None and not etag.startswith("W/"):
+            # The compressed body is a different representation, so its tag can only match weakly.
+            headers[ETAG_HEADER] = f"W/{etag}"
+        self._compressor = self._create_compressor()
+        if more_body:
+            del headers["Content-Length"]
+            await self._send(start)
+            await self._send_compressed(body, more_body)
+            return
+
+        # The whole body is in one message, so its compressed length can be sent upfront.
+        data = await self._compress(body, more_body)
+        headers["Content-Length"] = str(len(data))
+        await self._send(start)
+        await self._send(
+            {"type": "http.response.body", "body": data, "more_body": False}
+        )
+
+    async def _send_compressed(self, body: bytes, more_body: bool) -> None:
+        """Sends the next chunk of the body, compressed."""
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": await self._compress(body, more_body),
+                "more_body": more_body,
+            }
+        )
+
+    async def _compress(self, body: bytes, more_body: bool) -> bytes:
+        """Compresses the next chunk of the body, in a thread if it is large."""
+        assert self._compressor is not None
+        compress = (
+            self._compressor.compress if more_body else self._compressor.finish
+        )
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            return await to_thread.run_sync(compress, body)
+        return compress(body)
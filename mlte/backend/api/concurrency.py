@@ -0,0 +1,122 @@
+"""
+mlte/backend/api/concurrency.py
+
+Separate thread limits for classes of endpoints, so heavy requests can't take all the threads.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import typing
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, TypeVar
+
+from anyio import CapacityLimiter, to_thread
+from anyio.lowlevel import RunVar
+from strenum import StrEnum
+
+from mlte.backend.core.config import settings
+
+T = TypeVar("T")
+
+_SENTINEL = object()
+"""Marks the end of an iterator consumed in a thread."""
+
+
+class EndpointClass(StrEnum):
+    """Classes of endpoints that run with their own limit of threads."""
+
+    SEARCH = "search"
+    """Endpoints that list or search over many items, and can take long."""
+
+    WRITE = "write"
+    """Endpoints that write large or many items."""
+
+
+def _get_size(endpoint_class: EndpointClass) -> int:
+    """Returns the configured number of threads for a class of endpoints."""
+    if endpoint_class == EndpointClass.SEARCH:
+        return settings.SEARCH_THREADS
+    return settings.WRITE_THREADS
+
+
+_limiters: Dict[EndpointClass, RunVar[CapacityLimiter]] = {
+    endpoint_class: RunVar(f"{endpoint_class}_limiter")
+    for endpoint_class in EndpointClass
+}
+"""The limiters of each class; they are kept per event loop, as anyio does for its default one."""
+
+
+def get_limiter(endpoint_class: EndpointClass) -> CapacityLimiter:
+    """
+    Gets the limiter of threads for a class of endpoints, for the current event loop.
+    :param endpoint_class: The class of endpoints
+    :return: The limiter
+    """
+    try:
+        return _limiters[endpoint_class].get()
+    except LookupError:
+        limiter = CapacityLimiter(_get_size(endpoint_class))
+        _limiters[endpoint_class].set(limiter)
+        return limiter
+
+
+def run_in(
+    endpoint_class: EndpointClass,
+) -> Callable[[Callable[..., T]], Callable[..., typing.Awaitable[T]]]:
+    """
+    Decorator for a blocking endpoint, to run it in a thread limited by its class of endpoints
+    instead of the threadpool shared by all other endpoints.
+    :param endpoint_class: The class of endpoints
+    :return: The decorator
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., typing.Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            return await to_thread.run_sync(
+                functools.partial(func, *args, **kwargs),
+                limiter=get_limiter(endpoint_class),
+            )
+
+        # Resolve annotations here, as they are evaluated against the wrapper's module otherwise.
+        hints = typing.get_type_hints(func, include_extras=True)
+        signature = inspect.signature(func)
+        setattr(
+            wrapper,
+            "__signature__",
+            signature.replace(
+                parameters=[
+                    parameter.replace(
+                        annotation=hints.get(
+                            parameter.name, parameter.annotation
+                        )
+                    )
+                    for parameter in signature.parameters.values()
+                ],
+                return_annotation=hints.get(
+                    "return", signature.return_annotation
+                ),
+            ),
+        )
+        return wrapper
+
+    return decorator
+
+
+async def iterate_in(
+    endpoint_class: EndpointClass, items: Iterator[T]
+) -> AsyncIterator[T]:
+    """
+    Iterates over a blocking iterator in threads limited by a class of endpoints, as
+    streaming responses would otherwise do in the shared threadpool.
+    :param endpoint_class: The class of endpoints
+    :param items: The iterator
+    :return: An async iterator over the same items
+    """
+    limiter = get_limiter(endpoint_class)
+    while True:
+        item = await to_thread.run_sync(next, items, _SENTINEL, limiter=limiter)
+        if item is _SENTINEL:
+            break
+        yield typing.cast(T, item)
@@ -6,19 +6,31 @@ API definition for MLTE artifacts.
 
 from __future__ import annotations
 
-from typing import List
+from typing import Iterator, List, Optional, Union
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
+from fastapi import Query as QueryParam
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from typing_extensions import Annotated
 
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
+from mlte._private.fixed_json import json
 from mlte.artifact.model import ArtifactModel
 from mlte.backend.api.auth.authorization import AuthorizedUser
+from mlte.backend.api.concurrency import EndpointClass, iterate_in, run_in
 from mlte.backend.api.error_handlers import raise_http_internal_error
+from mlte.backend.api.etag import etag_response
 from mlte.backend.api.models.artifact_model import (
+    NDJSON_MEDIA_TYPE,
+    NEXT_CURSOR_HEADER,
     WriteArtifactRequest,
     WriteArtifactResponse,
+    WriteArtifactsRequest,
+    WriteArtifactsResponse,
 )
+from mlte.backend.api.responses import FastJSONResponse
 from mlte.backend.core import state_stores
 from mlte.store.query import Query
 
@@ -27,6 +39,7 @@ router = APIRouter()
 
 
 @router.post("")
+@run_in(EndpointClass.WRITE)
 def write_artifact(
     model_id: str,
     version_id: str,
@@ -63,23 +76,73 @@ def write_artifact(
             raise_http_internal_error(ex)
 
 
-@router.get("/{artifact_id}")
+@router.post("/batch")
+@run_in(EndpointClass.WRITE)
+def write_artifacts(
+    model_id: str,
+    version_id: str,
+    request: WriteArtifactsRequest,
+    current_user: AuthorizedUser,
+) -> WriteArtifactsResponse:
+    """
+    Write several artifacts at once; either all of them are written or none is.
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param request: The artifacts write request
+    :return: The created artifacts
+    """
+    with state_stores.artifact_store_session() as artifact_store:
+        try:
+            artifacts = artifact_store.write_artifacts_with_header(
+                model_id,
+                version_id,
+                request.artifacts,
+                force=request.force,
+                parents=request.parents,
+                user=current_user.username,
+            )
+            return WriteArtifactsResponse(artifacts=artifacts)
+        except errors.ErrorNotFound as e:
+            raise HTTPException(
+                status_code=codes.NOT_FOUND, detail=f"{e} not found."
+            )
+        except errors.ErrorAlreadyExists as e:
+            raise HTTPException(
+                status_code=codes.ALREADY_EXISTS, detail=f"{e} already exists."
+            )
+        except Exception as ex:
+            raise_http_internal_error(ex)
+
+
+@router.get("/{artifact_id}", response_model=ArtifactModel)
 def read_artifact(
     model_id: str,
     version_id: str,
     artifact_id: str,
     current_user: AuthorizedUser,
-) -> ArtifactModel:
+    resolve_blobs: bool = True,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[ArtifactModel, Response]:
     """
     Read an artifact by identifier.
     :param model_id: The model identifier
     :param version_id: The version identifier
     :param artifact_id: The identifier for the artifact
-    :return: The read artifact
+    :param resolve_blobs: Whether to include a value payload stored as a blob, or only its digest
+    :param if_none_match: The tags of the artifact the client already has
+    :return: The read artifact, or a 304 if the client has it already
     """
     with state_stores.artifact_store_session() as handle:
         try:
-            return handle.read_artifact(model_id, version_id, artifact_id)
+            return etag_response(
+                handle.read_artifact(
+                    model_id,
+                    version_id,
+                    artifact_id,
+                    resolve_blobs=resolve_blobs,
+                ),
+                if_none_match,
+            )
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -88,46 +151,108 @@ def read_artifact(
             raise_http_internal_error(ex)
 
 
-@router.get("")
+@router.get("", response_model=List[ArtifactModel])
+@run_in(EndpointClass.SEARCH)
 def read_artifacts(
     model_id: str,
     version_id: str,
     current_user: AuthorizedUser,
-    limit: int = 100,
+    limit: Annotated[int, QueryParam(ge=1)] = 100,
     offset: int = 0,
-) -> List[ArtifactModel]:
+    cursor: Optional[str] = None,
+    ids: Annotated[Optional[List[str]], QueryParam()] = None,
+    resolve_blobs: bool = True,
+    accept: Annotated[Optional[str], Header()] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[List[ArtifactModel], Response]:
     """
-    Read artifacts with limit and offset.
+    Read artifacts with limit and either offset or cursor, or stream all of them as NDJSON.
     :param model_id: The model identifier
     :param version_id: The version identifier
     :param limit: The limit on returned artifacts
-    :param offset: The offset on returned artifacts
-    :return: The read artifacts
+    :param offset: The offset on returned artifacts; can't be given with a cursor
+    :param cursor: The cursor to the page of artifacts to return, taken from a previous response
+    :param ids: The identifiers of the artifacts to read, all of which must exist; if given, the
+    pagination parameters do not apply
+    :param resolve_blobs: Whether to include value payloads stored as blobs when reading by identifiers
+    :param accept: The accepted media types; if it is NDJSON, all artifacts are streamed, and the other
+    parameters do not apply
+    :param if_none_match: The tags of the artifacts the client already has; not used when streaming
+    :return: The read artifacts, or a 304 if the client has them already; if there are more, the cursor
+    to the next page is in the response headers
     """
+    if _accepts_ndjson(accept):
+        return _stream_artifacts(model_id, version_id, Query())
+    if ids is None and cursor is not None and offset > 0:
+        raise HTTPException(
+            status_code=codes.BAD_REQUEST,
+            detail="Only one of cursor and offset can be given.",
+        )
+
     with state_stores.artifact_store_session() as handle:
         try:
-            return handle.read_artifacts(model_id, version_id, limit, offset)
+            if ids is not None:
+                return etag_response(
+                    handle.read_artifacts_by_ids(
+                        model_id, version_id, ids, resolve_blobs=resolve_blobs
+                    ),
+                    if_none_match,
+                )
+            if cursor is None and offset > 0:
+                return etag_response(
+                    handle.read_artifacts(model_id, version_id, limit, offset),
+                    if_none_match,
+                )
+
+            artifacts, next_cursor = handle.read_artifacts_page(
+                model_id, version_id, limit, cursor
+            )
+            return etag_response(
+                artifacts,
+                if_none_match,
+                (
+                    {NEXT_CURSOR_HEADER: next_cursor}
+                    if next_cursor is not None
+                    else None
+                ),
+            )
+        except errors.ErrorNotFound as e:
+            raise HTTPException(
+                status_code=codes.NOT_FOUND, detail=f"{e} not found."
+            )
+        except errors.InvalidCursorError as e:
+            raise HTTPException(status_code=codes.BAD_REQUEST, detail=f"{e}")
         except Exception as ex:
             raise_http_internal_error(ex)
 
 
 # TODO: this uses post to take advantge of the Query model. However, this is not corret REST syntax,
 # and it forces us to use write permissions to reach this endpoint. This should be fixed.
-@router.post("/search")
+@router.post(
+    "/search",
+    response_model=List[ArtifactModel],
+    response_class=FastJSONResponse,
+)
+@run_in(EndpointClass.SEARCH)
 def search_artifacts(
     model_id: str,
     version_id: str,
     query: Query,
     current_user: AuthorizedUser,
-) -> List[ArtifactModel]:
+    accept: Annotated[Optional[str], Header()] = None,
+) -> Union[List[ArtifactModel], StreamingResponse]:
     """
     Search artifacts.
 
     :param model_id: The model identifier
     :param version_id: The version identifier
     :param query: The artifact query
+    :param accept: The accepted media types; if it is NDJSON, results are streamed
     :return: The read artifacts
     """
+    if _accepts_ndjson(accept):
+        return _stream_artifacts(model_id, version_id, query)
+
     with state_stores.artifact_store_session() as handle:
         try:
             return handle.search_artifacts(model_id, version_id, query)
@@ -158,3 +283,47 @@ def delete_artifact(
             )
         except Exception as ex:
             raise_http_internal_error(ex)
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _accepts_ndjson(accept: Optional[str]) -> bool:
+    """Checks if the client asked for a response streamed as NDJSON."""
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+def _stream_artifacts(
+    model_id: str, version_id: str, query: Query
+) -> StreamingResponse:
+    """
+    Stream the artifacts that match a query as NDJSON, one artifact per line,
+    so only one artifact at a time is held in memory.
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param query: The artifact query
+    :return: The streaming response
+    """
+    try:
+        artifacts = state_stores.artifact_store_stream(
+            lambda handle: handle.iter_artifacts(model_id, version_id, query)
+        )
+    except errors.ErrorNotFound as e:
+        raise HTTPException(
+            status_code=codes.NOT_FOUND, detail=f"{e} not found."
+        )
+    except Exception as ex:
+        raise_http_internal_error(ex)
+
+    return StreamingResponse(
+        iterate_in(EndpointClass.SEARCH, _to_lines(artifacts)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+def _to_lines(artifacts: Iterator[ArtifactModel]) -> Iterator[str]:
+    """Serializes each artifact as a line of NDJSON."""
+    for artifact in artifacts:
+        yield f"{json.dumps(artifact.to_json())}\n"
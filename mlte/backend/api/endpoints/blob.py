@@ -0,0 +1,114 @@
+"""
+mlte/backend/api/endpoints/blob.py
+
+API definition for the blobs with large value payloads of MLTE models.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from typing import IO
+
+from anyio import to_thread
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+import mlte.backend.api.codes as codes
+import mlte.store.error as errors
+from mlte.backend.api.auth.authorization import AuthorizedUser
+from mlte.backend.api.concurrency import EndpointClass, get_limiter
+from mlte.backend.api.error_handlers import raise_http_internal_error
+from mlte.backend.api.models.artifact_model import BLOB_MEDIA_TYPE
+from mlte.backend.core import state_stores
+from mlte.store.artifact.blob import BLOB_CHUNK_SIZE
+
+SPOOL_SIZE = 4 * 1024 * 1024
+"""Uploaded blobs larger than this are spooled to a temporary file instead of memory."""
+
+# The router exported by this submodule
+router = APIRouter()
+
+
+@router.post(
+    "",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                BLOB_MEDIA_TYPE: {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            },
+            "required": True,
+        }
+    },
+)
+async def write_blob(
+    model_id: str,
+    request: Request,
+    current_user: AuthorizedUser,
+) -> str:
+    """
+    Write a blob, sent as the raw request body.
+    :param model_id: The model identifier
+    :param request: The request, with the raw blob data as its body
+    :return: The digest that identifies the blob
+    """
+    # The body is received as it arrives and spooled, so it is never held whole in memory.
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE) as spool:
+        async for chunk in request.stream():
+            # Once the spool rolls over to a file, writing blocks, so it is done in a thread.
+            await run_in_threadpool(spool.write, chunk)
+        await run_in_threadpool(spool.seek, 0)
+        return await to_thread.run_sync(
+            _write_spooled_blob,
+            model_id,
+            spool,
+            limiter=get_limiter(EndpointClass.WRITE),
+        )
+
+
+@router.get("/{digest}", response_class=StreamingResponse)
+def read_blob(
+    model_id: str,
+    digest: str,
+    current_user: AuthorizedUser,
+) -> StreamingResponse:
+    """
+    Read a blob by digest, streamed as raw bytes.
+    :param model_id: The model identifier
+    :param digest: The digest that identifies the blob
+    :return: The raw blob data
+    """
+    try:
+        chunks = state_stores.artifact_store_stream(
+            lambda handle: handle.iter_blob(model_id, digest)
+        )
+    except errors.ErrorNotFound as e:
+        raise HTTPException(
+            status_code=codes.NOT_FOUND, detail=f"{e} not found."
+        )
+    except Exception as ex:
+        raise_http_internal_error(ex)
+
+    return StreamingResponse(chunks, media_type=BLOB_MEDIA_TYPE)
+
+
+def _write_spooled_blob(model_id: str, spool: IO[bytes]) -> str:
+    """
+    Write a blob from its spooled data, in chunks.
+    :param model_id: The model identifier
+    :param spool: The file with the blob data
+    :return: The digest that identifies the blob
+    """
+    with state_stores.artifact_store_session() as handle:
+        try:
+            return handle.write_blob_stream(
+                model_id, iter(lambda: spool.read(BLOB_CHUNK_SIZE), b"")
+            )
+        except errors.ErrorNotFound as e:
+            raise HTTPException(
+                status_code=codes.NOT_FOUND, detail=f"{e} not found."
+            )
+        except Exception as ex:
+            raise_http_internal_error(ex)
@@ -6,15 +6,19 @@ Test Catalog Entry CRUD endpoint.
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
+from typing_extensions import Annotated
 
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
 from mlte.backend.api.auth.authorization import AuthorizedUser
+from mlte.backend.api.concurrency import EndpointClass, run_in
 from mlte.backend.api.error_handlers import raise_http_internal_error
+from mlte.backend.api.etag import etag_response
 from mlte.backend.api.models.catalog import CatalogReply
+from mlte.backend.api.responses import FastJSONResponse
 from mlte.backend.core import state_stores
 from mlte.catalog.model import CatalogEntry
 from mlte.store.query import Query
@@ -103,22 +107,29 @@ def edit_catalog_entry(
             raise_http_internal_error(e)
 
 
-@router.get("/{catalog_id}/entry/{catalog_entry_id}")
+@router.get(
+    "/{catalog_id}/entry/{catalog_entry_id}", response_model=CatalogEntry
+)
 def read_catalog_entry(
     *,
     catalog_id: str,
     catalog_entry_id: str,
     current_user: AuthorizedUser,
-) -> CatalogEntry:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[CatalogEntry, Response]:
     """
     Read a MLTE entry.
     :param catalog_entry_id: The entry name
-    :return: The read entry
+    :param if_none_match: The tags of the entry the client already has
+    :return: The read entry, or a 304 if the client has it already
     """
     with state_stores.catalog_stores_session() as catalog_stores:
         try:
-            return catalog_stores.get_session(catalog_id).entry_mapper.read(
-                catalog_entry_id
+            return etag_response(
+                catalog_stores.get_session(catalog_id).entry_mapper.read(
+                    catalog_entry_id
+                ),
+                if_none_match,
             )
         except errors.ErrorNotFound as e:
             raise HTTPException(
@@ -161,21 +172,27 @@ def delete_catalog_entry(
             raise_http_internal_error(e)
 
 
-@router.get("/{catalog_id}/entry")
+@router.get("/{catalog_id}/entry", response_model=List[CatalogEntry])
+@run_in(EndpointClass.SEARCH)
 def list_catalog_entries(
     *,
     catalog_id: str,
     current_user: AuthorizedUser,
-) -> List[CatalogEntry]:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[List[CatalogEntry], Response]:
     """
     List MLTE catalog entries, with details for each entry.
-    :return: A collection of entries with their details.
+    :param if_none_match: The tags of the entries the client already has
+    :return: A collection of entries with their details, or a 304 if the client has them already.
     """
     with state_stores.catalog_stores_session() as catalog_stores:
         try:
-            return catalog_stores.get_session(
-                catalog_id
-            ).entry_mapper.list_details()
+            return etag_response(
+                catalog_stores.get_session(
+                    catalog_id
+                ).entry_mapper.list_details(),
+                if_none_match,
+            )
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -184,42 +201,50 @@ def list_catalog_entries(
             raise_http_internal_error(e)
 
 
-@router.get("s")
+@router.get("s", response_model=List[CatalogReply])
 def list_catalogs(
     *,
     current_user: AuthorizedUser,
-) -> List[CatalogReply]:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[List[CatalogReply], Response]:
     """
     List MLTE catalogs, returning their ids.
-    :return: A collection of catalog ids.
+    :param if_none_match: The tags of the list the client already has
+    :return: A collection of catalog ids, or a 304 if the client has it already.
     """
     with state_stores.catalog_stores_session() as catalog_stores:
         catalog_stores.sessions
         try:
-            return [
-                CatalogReply(
-                    id=catalog_id,
-                    read_only=catalog.read_only,
-                    type=catalog.get_uri().type.value,
-                )
-                for catalog_id, catalog in catalog_stores.sessions.items()
-            ]
+            return etag_response(
+                [
+                    CatalogReply(
+                        id=catalog_id,
+                        read_only=catalog.read_only,
+                        type=catalog.get_uri().type.value,
+                    )
+                    for catalog_id, catalog in catalog_stores.sessions.items()
+                ],
+                if_none_match,
+            )
         except Exception as e:
             raise_http_internal_error(e)
 
 
-@router.get("s/entry")
+@router.get("s/entry", response_model=List[CatalogEntry])
+@run_in(EndpointClass.SEARCH)
 def list_catalog_entries_all_catalogs(
     *,
     current_user: AuthorizedUser,
-) -> List[CatalogEntry]:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[List[CatalogEntry], Response]:
     """
     List MLTE catalog entries, with details for each entry.
-    :return: A collection of entries with their details.
+    :param if_none_match: The tags of the entries the client already has
+    :return: A collection of entries with their details, or a 304 if the client has them already.
     """
     with state_stores.catalog_stores_session() as catalog_stores:
         try:
-            return catalog_stores.list_details()
+            return etag_response(catalog_stores.list_details(), if_none_match)
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -228,7 +253,8 @@ def list_catalog_entries_all_catalogs(
             raise_http_internal_error(e)
 
 
-@router.post("s/entry/search")
+@router.post("s/entry/search", response_class=FastJSONResponse)
+@run_in(EndpointClass.SEARCH)
 def search(
     *,
     query: Query,
@@ -6,15 +6,18 @@ Endpoints for artifact organization context.
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
+from typing_extensions import Annotated
 
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
 from mlte.backend.api.auth.authorization import AuthorizedUser
 from mlte.backend.api.error_handlers import raise_http_internal_error
+from mlte.backend.api.etag import etag_response
 from mlte.backend.core import state_stores
+from mlte.backend.core.state import state
 from mlte.context.model import Model, Version
 from mlte.store.user.policy import Policy
 from mlte.user.model import ResourceType
@@ -59,28 +62,31 @@ def create_model(
                 handle,
                 current_user,
             )
+            state.user_cache.invalidate()
         except Exception as ex:
             raise_http_internal_error(ex)
 
     return created_model
 
 
-@router.get("/{model_id}")
+@router.get("/{model_id}", response_model=Model)
 def read_model(
     *,
     model_id: str,
     current_user: AuthorizedUser,
-) -> Model:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[Model, Response]:
     """
     Read a MLTE model.
     :param model_id: The model identifier
-    :return: The read model
+    :param if_none_match: The tags of the model the client already has
+    :return: The read model, or a 304 if the client has it already
     """
     try:
         with state_stores.artifact_store_session() as handle:
             model = handle.read_model(model_id)
 
-        return model
+        return etag_response(model, if_none_match)
     except errors.ErrorNotFound as e:
         raise HTTPException(
             status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -89,17 +95,19 @@ def read_model(
         raise_http_internal_error(ex)
 
 
-@router.get("")
+@router.get("", response_model=List[str])
 def list_models(
     current_user: AuthorizedUser,
-) -> List[str]:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[List[str], Response]:
     """
     List MLTE models.
-    :return: A collection of model identifiers
+    :param if_none_match: The tags of the list the client already has
+    :return: A collection of model identifiers, or a 304 if the client has it already
     """
     with state_stores.artifact_store_session() as handle:
         try:
-            return handle.list_models()
+            return etag_response(handle.list_models(), if_none_match)
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -137,6 +145,7 @@ def delete_model(
         # Now delete related permissions and groups.
         try:
             Policy.remove(ResourceType.MODEL, model_id, handle)
+            state.user_cache.invalidate()
         except Exception as ex:
             raise_http_internal_error(ex)
 
@@ -171,22 +180,26 @@ def create_version(
             raise_http_internal_error(ex)
 
 
-@router.get("/{model_id}/version/{version_id}")
+@router.get("/{model_id}/version/{version_id}", response_model=Version)
 def read_version(
     *,
     model_id: str,
     version_id,
     current_user: AuthorizedUser,
-) -> Version:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[Version, Response]:
     """
     Read a MLTE version.
     :param model_id: The model identifier
     :param version_id: The version identifier
-    :return: The read version
+    :param if_none_match: The tags of the version the client already has
+    :return: The read version, or a 304 if the client has it already
     """
     with state_stores.artifact_store_session() as handle:
         try:
-            return handle.read_version(model_id, version_id)
+            return etag_response(
+                handle.read_version(model_id, version_id), if_none_match
+            )
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -195,19 +208,21 @@ def read_version(
             raise_http_internal_error(ex)
 
 
-@router.get("/{model_id}/version")
+@router.get("/{model_id}/version", response_model=List[str])
 def list_versions(
     model_id: str,
     current_user: AuthorizedUser,
-) -> List[str]:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Union[List[str], Response]:
     """
     List MLTE versions for the provided model.
     :param model_id: The model identifier
-    :return: A collection of version identifiers
+    :param if_none_match: The tags of the list the client already has
+    :return: A collection of version identifiers, or a 304 if the client has it already
     """
     with state_stores.artifact_store_session() as handle:
         try:
-            return handle.list_versions(model_id)
+            return etag_response(handle.list_versions(model_id), if_none_match)
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
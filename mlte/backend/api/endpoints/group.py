@@ -13,8 +13,11 @@ from fastapi import APIRouter, HTTPException
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
 from mlte.backend.api.auth.authorization import AuthorizedUser
+from mlte.backend.api.concurrency import EndpointClass, run_in
 from mlte.backend.api.error_handlers import raise_http_internal_error
+from mlte.backend.api.responses import FastJSONResponse
 from mlte.backend.core import state_stores
+from mlte.backend.core.state import state
 from mlte.user.model import Group, Permission
 
 # The router exported by this submodule
@@ -34,7 +37,9 @@ def create_group(
     """
     with state_stores.user_store_session() as user_store:
         try:
-            return user_store.group_mapper.create(group)
+            created_group = user_store.group_mapper.create(group)
+            state.user_cache.invalidate()
+            return created_group
         except errors.ErrorAlreadyExists as e:
             raise HTTPException(
                 status_code=codes.ALREADY_EXISTS, detail=f"{e} already exists."
@@ -56,7 +61,9 @@ def edit_group(
     """
     with state_stores.user_store_session() as user_store:
         try:
-            return user_store.group_mapper.edit(group)
+            edited_group = user_store.group_mapper.edit(group)
+            state.user_cache.invalidate()
+            return edited_group
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -102,7 +109,8 @@ def list_groups(
             raise_http_internal_error(e)
 
 
-@router.get("s/details")
+@router.get("s/details", response_class=FastJSONResponse)
+@run_in(EndpointClass.SEARCH)
 def list_group_details(
     current_user: AuthorizedUser,
 ) -> List[Group]:
@@ -130,7 +138,9 @@ def delete_group(
     """
     with state_stores.user_store_session() as user_store:
         try:
-            return user_store.group_mapper.delete(group_name)
+            deleted_group = user_store.group_mapper.delete(group_name)
+            state.user_cache.invalidate()
+            return deleted_group
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -50,8 +50,9 @@ def create_token_response(access_token: jwt.EncodedToken) -> TokenResponse:
     )
 
 
+# Not async, so the store access and password check run in the threadpool instead of blocking other requests.
 @router.post(f"{TOKEN_ENDPOINT_URL}")
-async def login_for_access_token(
+def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
 ) -> TokenResponse:
     """
@@ -13,16 +13,18 @@ from fastapi import APIRouter, HTTPException
 
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
-from mlte.backend.api.auth import authorization
 from mlte.backend.api.auth.authorization import AuthorizedUser
+from mlte.backend.api.concurrency import EndpointClass, run_in
 from mlte.backend.api.error_handlers import raise_http_internal_error
 from mlte.backend.api.models.artifact_model import USER_ME_ID
+from mlte.backend.api.responses import FastJSONResponse
 from mlte.backend.core import state_stores
+from mlte.backend.core.state import state
 from mlte.store.user.policy import Policy
 from mlte.user.model import (
     BasicUser,
     MethodType,
-    Permission,
+    PermissionIndex,
     ResourceType,
     RoleType,
     UserWithPassword,
@@ -51,7 +53,7 @@ def read_user_me(
 
 
 @router.get("/me/models")
-def list_user_models_me(
+async def list_user_models_me(
     *,
     current_user: AuthorizedUser,
 ) -> List[str]:
@@ -61,7 +63,7 @@ def list_user_models_me(
     """
     parameters = locals().copy()
     parameters["username"] = USER_ME_ID
-    return list_user_models(**parameters)
+    return await list_user_models(**parameters)
 
 
 # -----------------------------------------------------------------------------
@@ -117,6 +119,8 @@ def create_user(
                 BasicUser(**new_user.to_json()),
             )
 
+            state.user_cache.invalidate()
+
             stored_user = user_store.user_mapper.read(new_user.username)
             return stored_user
         except errors.ErrorAlreadyExists as e:
@@ -152,7 +156,9 @@ def edit_user(
                 user.groups = current_groups
 
             # Edit the user.
-            return user_store.user_mapper.edit(user)
+            edited_user = user_store.user_mapper.edit(user)
+            state.user_cache.invalidate()
+            return edited_user
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -201,7 +207,8 @@ def list_users(
             raise_http_internal_error(e)
 
 
-@router.get("s/details")
+@router.get("s/details", response_class=FastJSONResponse)
+@run_in(EndpointClass.SEARCH)
 def list_users_details(
     current_user: AuthorizedUser,
 ) -> List[BasicUser]:
@@ -240,6 +247,7 @@ def delete_user(
 
             # Now delete related permissions and groups.
             Policy.remove(ResourceType.USER, username, user_store)
+            state.user_cache.invalidate()
 
             return deleted_user
         except errors.ErrorNotFound as e:
@@ -251,6 +259,7 @@ def delete_user(
 
 
 @router.get("/{username}/models")
+@run_in(EndpointClass.SEARCH)
 def list_user_models(
     *,
     username: str,
@@ -268,20 +277,15 @@ def list_user_models(
         with state_stores.user_store_session() as user_store:
             try:
                 # Get all models, and filter out only the ones the user has read permissions for.
-                user_models: List[str] = []
-                user = BasicUser(
-                    **user_store.user_mapper.read(username).to_json()
-                )
+                user = user_store.user_mapper.read(username)
                 all_models = artifact_store.list_models()
-                for model_id in all_models:
-                    permission = Permission(
-                        resource_type=ResourceType.MODEL,
-                        resource_id=model_id,
-                        method=MethodType.GET,
-                    )
-                    if authorization.is_authorized(user, permission):
-                        user_models.append(model_id)
-                return user_models
+                if user.role == RoleType.ADMIN:
+                    return all_models
+                return PermissionIndex.from_groups(
+                    user.groups
+                ).filter_resource_ids(
+                    ResourceType.MODEL, MethodType.GET, all_models
+                )
 
             except errors.ErrorNotFound as e:
                 raise HTTPException(
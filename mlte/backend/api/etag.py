@@ -0,0 +1,91 @@
+"""
+mlte/backend/api/etag.py
+
+Entity tags for responses of read endpoints, so clients can revalidate what they already have.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Optional
+
+import pydantic
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+
+import mlte.backend.api.codes as codes
+from mlte.backend.api.responses import FastJSONResponse
+
+ETAG_HEADER = "ETag"
+"""Header with the tag of the returned content."""
+
+IF_NONE_MATCH_HEADER = "If-None-Match"
+"""Header with the tags of the content the client already has."""
+
+CACHE_CONTROL = "private, no-cache"
+"""Lets clients keep responses, but only use them after revalidating their tag."""
+
+
+def get_etag(body: bytes) -> str:
+    """
+    Computes the tag of a serialized response body.
+    :param body: The body
+    :return: The tag, quoted as sent in headers
+    """
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Checks if a tag is one of the tags in an If-None-Match header.
+    :param etag: The tag of the current content
+    :param if_none_match: The value of the header, if any
+    :return: True if the client already has the current content
+    """
+    if if_none_match is None:
+        return False
+    # Weak tags match as well, as per the weak comparison required for If-None-Match.
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in tags)
+
+
+def etag_response(
+    content: Any,
+    if_none_match: Optional[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Serializes the content of a read endpoint and tags it with a hash of the result. If the client
+    already has content with the same tag, only a 304 is returned.
+    :param content: The content, as the endpoint would return it
+    :param if_none_match: The value of the If-None-Match header of the request, if any
+    :param headers: Additional headers of the response
+    :return: The response
+    """
+    response = FastJSONResponse(_to_jsonable(content), headers=headers)
+    etag = get_etag(bytes(response.body))
+    if etag_matches(etag, if_none_match):
+        return Response(
+            status_code=codes.NOT_MODIFIED,
+            headers={
+                **(headers or {}),
+                ETAG_HEADER: etag,
+                "Cache-Control": CACHE_CONTROL,
+            },
+        )
+
+    response.headers[ETAG_HEADER] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def _to_jsonable(content: Any) -> Any:
+    """
+    Converts content to JSON-compatible data, as FastAPI does for responses; models are
+    dumped by pydantic directly, which is much faster for long lists of them.
+    """
+    if isinstance(content, pydantic.BaseModel):
+        return content.model_dump(mode="json", by_alias=True)
+    if isinstance(content, list):
+        return [_to_jsonable(item) for item in content]
+    return jsonable_encoder(content)
@@ -8,12 +8,23 @@ for additional meta-models like these. This worked well for write request;
 should the other endpoints be refactored to look more like this one?
 """
 
+from typing import List
+
 from mlte.artifact.model import ArtifactModel
 from mlte.model.base_model import BaseModel
 
 USER_ME_ID = "me"
 """Special ID used to identify the currently logged in user."""
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+"""Response header with the opaque cursor for the next page of a listing."""
+
+BLOB_MEDIA_TYPE = "application/octet-stream"
+"""Media type of blobs, which are sent and received as raw bytes."""
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+"""Media type to request artifact listings streamed as newline-delimited JSON."""
+
 
 class WriteArtifactRequest(BaseModel):
     """Defines the data in a POST request to write an artifact."""
@@ -33,3 +44,23 @@ class WriteArtifactResponse(BaseModel):
 
     artifact: ArtifactModel
     """The model for the artifact that was written."""
+
+
+class WriteArtifactsRequest(BaseModel):
+    """Defines the data in a POST request to write several artifacts at once."""
+
+    artifacts: List[ArtifactModel]
+    """The models for the artifacts to write."""
+
+    force: bool = False
+    """Indicates that existing artifacts may be overwritten."""
+
+    parents: bool = False
+    """Indicates whether organizational elements should be created."""
+
+
+class WriteArtifactsResponse(BaseModel):
+    """Defines the data in a response to writing several artifacts."""
+
+    artifacts: List[ArtifactModel]
+    """The models for the artifacts that were written."""
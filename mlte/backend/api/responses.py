@@ -0,0 +1,39 @@
+"""
+mlte/backend/api/responses.py
+
+Response classes for endpoints that return large JSON bodies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+
+
+def _import_orjson() -> Optional[ModuleType]:
+    """Imports orjson, which is optional; responses are rendered with the standard json module without it."""
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:  # pragma: no cover
+        return None
+
+
+_orjson = _import_orjson()
+"""The orjson module, if installed."""
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    A JSON response rendered with orjson if it is installed, which is several times faster
+    than the standard json module for large lists. Note that orjson renders NaN and infinite
+    values as null, where the standard renderer fails.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if _orjson is None:
+            return super().render(content)
+        result: bytes = _orjson.dumps(content)
+        return result
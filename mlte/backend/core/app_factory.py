@@ -6,6 +6,9 @@ Web application factory.
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -14,7 +17,17 @@ from mlte.backend.api.auth.http_auth_exception import (
     HTTPTokenException,
     json_content_exception_handler,
 )
+from mlte.backend.api.compression import CompressionMiddleware
+from mlte.backend.api.models.artifact_model import NEXT_CURSOR_HEADER
 from mlte.backend.core.config import settings
+from mlte.backend.core.state import state
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Lifecycle of the application: the stores are set up before it starts, and closed when it shuts down."""
+    yield
+    state.close_stores()
 
 
 def create(allowed_origins: list[str] = []) -> FastAPI:
@@ -27,6 +40,7 @@ def create(allowed_origins: list[str] = []) -> FastAPI:
         docs_url=f"{settings.API_PREFIX}/docs",
         redoc_url=f"{settings.API_PREFIX}/redoc",
         openapi_url=f"{settings.API_PREFIX}/openapi.json",
+        lifespan=lifespan,
     )
 
     # Inject routes
@@ -41,6 +55,14 @@ def create(allowed_origins: list[str] = []) -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=[NEXT_CURSOR_HEADER],
+        )
+
+    if settings.COMPRESSION_MINIMUM_SIZE >= 0:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            level=settings.COMPRESSION_LEVEL,
         )
 
     # Add proper exception handling for Token responses, to be OAuth compliant.
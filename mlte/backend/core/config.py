@@ -6,7 +6,7 @@ Configuration management for FastAPI application.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -51,6 +51,9 @@ class Settings(BaseSettings):
             ) from None
         return v
 
+    BACKEND_WORKERS: int = 1
+    """The number of worker processes serving requests."""
+
     STORE_URI: str = StoreURI.get_default_prefix(StoreType.LOCAL_MEMORY)
     """The store URI string; defaults to in-memory store."""
 
@@ -80,10 +83,70 @@ class Settings(BaseSettings):
     )
     """The secret key used to encode/decode JWT tokens."""
 
+    AUTH_CACHE_TTL: float = 30
+    """Seconds an authenticated user and its permissions are cached for between requests; 0 disables the cache."""
+
+    PASSWORD_VERIFY_WORKERS: int = 4
+    """Maximum number of password hashes checked at the same time."""
+
+    PASSWORD_CACHE_TTL: float = 0
+    """Seconds a successful login is remembered, skipping the hash check for the same credentials; 0 disables it."""
+
+    SEARCH_THREADS: int = 8
+    """Maximum number of threads used at the same time by endpoints that list or search many items."""
+
+    WRITE_THREADS: int = 8
+    """Maximum number of threads used at the same time by endpoints that write large or many items."""
+
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    """Responses of at least this many bytes are compressed for clients that accept it; negative disables compression."""
+
+    COMPRESSION_LEVEL: int = 6
+    """The gzip level (1-9) compressed responses use; zstd uses its own default level."""
+
+    DB_POOL_SIZE: Optional[int] = None
+    """Number of connections kept open to a relational DB store; the DB engine's default if not set."""
+
+    DB_MAX_OVERFLOW: Optional[int] = None
+    """Connections that can be opened to a relational DB store beyond the pool size; the engine's default if not set."""
+
+    DB_POOL_RECYCLE: Optional[int] = None
+    """Seconds after which pooled DB connections are replaced; never if not set."""
+
+    DB_POOL_PRE_PING: bool = False
+    """Whether to check that pooled DB connections are alive before using them."""
+
+    DB_READ_URIS: List[str] = []
+    """URIs of read replicas of a relational DB artifact store; if set, reads are spread over them, and only writes go to the store URI."""
+
+    DB_READ_YOUR_WRITES: bool = True
+    """Whether a request that wrote to a relational DB artifact store reads from the primary DB afterwards, so it sees its own writes."""
+
     model_config = SettingsConfigDict(
         case_sensitive=True, env_file=".env.backend"
     )
 
+    def get_db_pool_options(self) -> Dict[str, Any]:
+        """Returns the options set for the connection pool of relational DB stores; URI options take precedence."""
+        options = {
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": self.DB_POOL_PRE_PING or None,
+        }
+        return {
+            name: value for name, value in options.items() if value is not None
+        }
+
+    def get_db_read_options(self) -> Dict[str, Any]:
+        """Returns the options set for reading from replicas of a relational DB artifact store, if any."""
+        if len(self.DB_READ_URIS) == 0:
+            return {}
+        return {
+            "read_uris": self.DB_READ_URIS,
+            "read_your_writes": self.DB_READ_YOUR_WRITES,
+        }
+
 
 # The exported settings object
 settings = Settings()
@@ -0,0 +1,96 @@
+"""
+mlte/backend/core/password_verifier.py
+
+Verification of user passwords in a bounded pool, with an optional cache of recently verified credentials.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+from mlte.user import passwords
+
+
+class PasswordVerifier:
+    """
+    Verifies passwords against their hashes, running at most a fixed number of hash checks at a time.
+    Successful verifications can be remembered for a short while, so repeated logins skip the hash check.
+    """
+
+    def __init__(
+        self, max_workers: int, cache_ttl: float, max_size: int = 1024
+    ) -> None:
+        self.cache_ttl = cache_ttl
+        """Seconds successful verifications are remembered; 0 disables caching."""
+
+        self.max_size = max_size
+        """Maximum number of remembered verifications; the oldest are dropped first."""
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password"
+        )
+        """Pool the hash checks run in; bcrypt releases the GIL, so threads run them in parallel."""
+
+        self._secret = secrets.token_bytes(32)
+        """Key for the MACs of remembered credentials, so plain passwords are never kept."""
+
+        self._verified: OrderedDict[str, Tuple[bytes, float]] = OrderedDict()
+        """MAC of the last verified credentials per username, and when they expire."""
+
+        self._lock = threading.Lock()
+        """Lock for the remembered verifications."""
+
+    def verify(
+        self, username: str, password: str, hashed_password: str
+    ) -> bool:
+        """
+        Verifies that a plain password matches the hashed one of a user.
+        :param username: The username
+        :param password: The plain password
+        :param hashed_password: The stored hash of the user's password
+        :return: True if the password matches
+        """
+        # The stored hash is part of the MAC, so changing the password forgets old verifications.
+        mac = hmac.new(
+            self._secret,
+            f"{username}\0{hashed_password}\0{password}".encode("utf-8"),
+            hashlib.sha256,
+        ).digest()
+        if self._is_verified(username, mac):
+            return True
+
+        verified = self._executor.submit(
+            passwords.verify_password, password, hashed_password
+        ).result()
+        if verified and self.cache_ttl > 0:
+            with self._lock:
+                self._verified[username] = (
+                    mac,
+                    time.monotonic() + self.cache_ttl,
+                )
+                self._verified.move_to_end(username)
+                while len(self._verified) > self.max_size:
+                    self._verified.popitem(last=False)
+        return verified
+
+    def _is_verified(self, username: str, mac: bytes) -> bool:
+        """Checks if the same credentials were verified for a user and did not expire."""
+        with self._lock:
+            entry = self._verified.get(username)
+            if entry is None:
+                return False
+            if time.monotonic() >= entry[1]:
+                del self._verified[username]
+                return False
+            return hmac.compare_digest(entry[0], mac)
+
+    def shutdown(self) -> None:
+        """Stops the pool, once the checks in progress finish."""
+        self._executor.shutdown(wait=True)
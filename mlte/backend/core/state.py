@@ -8,6 +8,9 @@ from __future__ import annotations
 
 from typing import Optional
 
+from mlte.backend.core.config import settings
+from mlte.backend.core.password_verifier import PasswordVerifier
+from mlte.backend.core.user_cache import UserCache
 from mlte.store.artifact.store import ArtifactStore
 from mlte.store.catalog.catalog_group import CatalogStoreGroup
 from mlte.store.catalog.store import CatalogStore
@@ -38,6 +41,19 @@ class State:
         self._jwt_secret_key: str = ""
         """Secret key used to sign authentication tokens."""
 
+        self._user_cache = UserCache(settings.AUTH_CACHE_TTL)
+        """Cache of authenticated users, invalidated whenever users or their permissions change."""
+
+        previous_verifier: Optional[PasswordVerifier] = getattr(
+            self, "_password_verifier", None
+        )
+        if previous_verifier is not None:
+            previous_verifier.shutdown()
+        self._password_verifier: PasswordVerifier = PasswordVerifier(
+            settings.PASSWORD_VERIFY_WORKERS, settings.PASSWORD_CACHE_TTL
+        )
+        """Verifier for user passwords, shared so hash checks are bounded across requests."""
+
     def set_artifact_store(self, store: ArtifactStore):
         """Set the globally-configured backend artifact store."""
         self._artifact_store = store
@@ -66,6 +82,17 @@ class State:
         """Sets the globally used token secret key."""
         self._jwt_secret_key = token_key
 
+    def close_stores(self):
+        """Closes all configured stores, releasing their resources; called when the application shuts down."""
+        for store in [
+            self._artifact_store,
+            self._user_store,
+            self._custom_list_store,
+        ]:
+            if store is not None:
+                store.close()
+        self._catalog_stores.close()
+
     @property
     def artifact_store(self) -> ArtifactStore:
         """Get the globally-configured backend artifact store."""
@@ -85,6 +112,16 @@ class State:
         """Get the globally-configured backend catalog store group."""
         return self._catalog_stores
 
+    @property
+    def user_cache(self) -> UserCache:
+        """Get the cache of authenticated users."""
+        return self._user_cache
+
+    @property
+    def password_verifier(self) -> PasswordVerifier:
+        """Get the verifier for user passwords."""
+        return self._password_verifier
+
     @property
     def token_key(self) -> str:
         """Get the globally-configured token secret key."""
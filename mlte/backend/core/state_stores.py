@@ -4,14 +4,17 @@ mlte/backend/core/state_stores.py
 Managed store sessions obtained from the global state context.
 """
 
+import itertools
 from contextlib import contextmanager
-from typing import Generator
+from typing import Callable, Generator, Iterator, TypeVar
 
 from mlte.backend.core.state import state
 from mlte.store.artifact.store import ArtifactStoreSession
 from mlte.store.catalog.catalog_group import CatalogStoreGroupSession
 from mlte.store.user.store_session import UserStoreSession
 
+T = TypeVar("T")
+
 
 @contextmanager
 def artifact_store_session() -> Generator[ArtifactStoreSession, None, None]:
@@ -26,6 +29,34 @@ def artifact_store_session() -> Generator[ArtifactStoreSession, None, None]:
         session.close()
 
 
+def artifact_store_stream(
+    produce: Callable[[ArtifactStoreSession], Iterator[T]]
+) -> Iterator[T]:
+    """
+    Start iterating over items produced with a store session that stays open until the iteration ends,
+    so they can be sent in a streaming response after the endpoint returns. The first item is produced
+    right away, so errors such as a missing element are raised here and not in the middle of the response.
+    :param produce: Function that returns the iterator over the items, given the session
+    :return: The iterator over the items
+    """
+    session: ArtifactStoreSession = state.artifact_store.session()
+    try:
+        items = produce(session)
+        first = list(itertools.islice(items, 1))
+    except BaseException:
+        session.close()
+        raise
+
+    def stream() -> Iterator[T]:
+        try:
+            yield from first
+            yield from items
+        finally:
+            session.close()
+
+    return stream()
+
+
 @contextmanager
 def user_store_session() -> Generator[UserStoreSession, None, None]:
     """
@@ -0,0 +1,90 @@
+"""
+mlte/backend/core/user_cache.py
+
+Short-lived cache of authenticated users and their permissions, to authorize requests without reading the user store.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from mlte.user.model import Permission, PermissionIndex, User
+
+
+class CachedUser:
+    """A user read from the store, with its permissions indexed for authorization checks."""
+
+    def __init__(self, user: User, expiration: float) -> None:
+        self.user = user
+        """The user, as read from the store."""
+
+        self.expiration = expiration
+        """Time (as in time.monotonic()) after which the entry must be read again."""
+
+        self.permissions = PermissionIndex.from_groups(user.groups)
+        """The permissions of all groups of the user."""
+
+    def grants_access(self, resource: Permission) -> bool:
+        """
+        Checks if any permission of the user grants access to a resource.
+        :param resource: The requested resource and method
+        :return: True if access is granted
+        """
+        return self.permissions.grants_access(resource)
+
+
+class UserCache:
+    """A cache of users keyed by username and token, with entries that expire after a while."""
+
+    def __init__(self, ttl: float, max_size: int = 1024) -> None:
+        self.ttl = ttl
+        """Seconds entries are kept; 0 disables caching."""
+
+        self.max_size = max_size
+        """Maximum number of entries; the oldest are dropped first."""
+
+        self._entries: OrderedDict[Tuple[str, str], CachedUser] = OrderedDict()
+        """The cached users."""
+
+        self._lock = threading.Lock()
+        """Lock for the entries, as endpoints run in several threads."""
+
+    def get(self, username: str, token: str) -> Optional[CachedUser]:
+        """
+        Gets a user, if it is cached and did not expire.
+        :param username: The username
+        :param token: The token the user was authenticated with
+        :return: The cached user, or None
+        """
+        with self._lock:
+            entry = self._entries.get((username, token))
+            if entry is not None and time.monotonic() >= entry.expiration:
+                del self._entries[(username, token)]
+                entry = None
+            return entry
+
+    def put(self, username: str, token: str, user: User) -> CachedUser:
+        """
+        Caches a user that was just read from the store.
+        :param username: The username
+        :param token: The token the user was authenticated with
+        :param user: The user
+        :return: The cached user
+        """
+        entry = CachedUser(user, time.monotonic() + self.ttl)
+        if self.ttl <= 0:
+            return entry
+
+        with self._lock:
+            self._entries[(username, token)] = entry
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self) -> None:
+        """Drops all entries; called whenever users, groups or permissions change."""
+        with self._lock:
+            self._entries.clear()
@@ -4,15 +4,22 @@ mlte/backend/main.py
 Entry point for MLTE artifact store server.
 """
 
+import hashlib
 import logging
+import os
 import sys
-from typing import Any, Dict, List
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
 
 import uvicorn
+from fastapi import FastAPI
 from pydantic.networks import HttpUrl
 
 import mlte._private.hosts as util
 import mlte.backend.core.app_factory as app_factory
+from mlte._private.fixed_json import json
 from mlte.backend.core.config import settings
 from mlte.backend.core.state import state
 from mlte.store.artifact import factory as artifact_store_factory
@@ -21,6 +28,12 @@ from mlte.store.catalog.sample_catalog import SampleCatalog
 from mlte.store.custom_list.initial_custom_lists import InitialCustomLists
 from mlte.store.user import factory as user_store_factory
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Not available on Windows; concurrent backends are not serialized there.
+    fcntl = None  # type: ignore[assignment]
+
 # Application exit codes
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
@@ -46,6 +59,7 @@ def run(
     catalog_uris: Dict[str, str],
     allowed_origins: List[str],
     jwt_secret: str,
+    workers: int = 1,
 ) -> int:
     """
     Run the artifact store application.
@@ -55,6 +69,7 @@ def run(
     :param catalog_uris: A dict of URIs for catalog stores
     :param allowed_origins: A list of allowed CORS origins
     :param jwt_secret: A secret random string key used to sign tokens
+    :param workers: The number of worker processes serving requests
     :return: Return code
     """
     # TODO(Kyle): use log level from arguments.
@@ -65,27 +80,99 @@ def run(
     _ = _validate_origins(allowed_origins)
     logging.info(f"Allowed origins: {allowed_origins}")
 
+    logging.info(
+        f"Backend using artifact and user store URI of type: {StoreURI.from_string(store_uri).type}"
+    )
+
+    if workers > 1:
+        if StoreURI.from_string(store_uri).type == StoreType.LOCAL_MEMORY:
+            raise RuntimeError(
+                "Cannot run backend with several workers and an in-memory store, as each would have its own data."
+            )
+
+        # Write the default data once, then let each worker build its own stores without it.
+        with _seed_lock(store_uri):
+            setup_state(store_uri, catalog_uris, jwt_secret, seed=True)
+        state.close_stores()
+        state.reset()
+
+        # Workers are new processes, which read their configuration from the environment.
+        os.environ["STORE_URI"] = store_uri
+        os.environ["CATALOG_URIS"] = json.dumps(catalog_uris)
+        os.environ["ALLOWED_ORIGINS"] = json.dumps(allowed_origins)
+        os.environ["JWT_SECRET_KEY"] = jwt_secret
+        # Caches of users and logins are not shared, so changes to users or permissions made
+        # in one worker would not be seen by the others until they expire; they are disabled.
+        os.environ["AUTH_CACHE_TTL"] = "0"
+        os.environ["PASSWORD_CACHE_TTL"] = "0"
+        uvicorn.run(
+            f"{__name__}:create_worker_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+        )
+        return EXIT_SUCCESS
+
     # The global FastAPI application
     app = app_factory.create(allowed_origins)
+    with _seed_lock(store_uri):
+        setup_state(store_uri, catalog_uris, jwt_secret, seed=True)
 
-    logging.info(
-        f"Backend using artifact and user store URI of type: {StoreURI.from_string(store_uri).type}"
+    # Run the server
+    uvicorn.run(app, host=host, port=port)
+    return EXIT_SUCCESS
+
+
+def create_worker_app() -> FastAPI:
+    """
+    Create the application for a worker process, with its own stores, configured from the environment.
+    :return: The application
+    """
+    app = app_factory.create(settings.ALLOWED_ORIGINS)
+    setup_state(
+        settings.STORE_URI,
+        settings.CATALOG_URIS,
+        settings.JWT_SECRET_KEY,
+        seed=False,
     )
+    return app
 
+
+def setup_state(
+    store_uri: str,
+    catalog_uris: Dict[str, str],
+    jwt_secret: str,
+    seed: bool = True,
+) -> None:
+    """
+    Create the stores, and set them and the token key in the global state.
+    :param store_uri: The store URI string
+    :param catalog_uris: A dict of URIs for catalog stores
+    :param jwt_secret: A secret random string key used to sign tokens
+    :param seed: Whether to write the default data: users, permissions, sample catalog and initial
+    custom lists; if several processes share the stores, only one of them should, holding a lock
+    """
     # Initialize the backing artifact store instance
-    artifact_store = artifact_store_factory.create_artifact_store(store_uri)
+    artifact_store = artifact_store_factory.create_artifact_store(
+        store_uri,
+        **settings.get_db_pool_options(),
+        **settings.get_db_read_options(),
+    )
     if artifact_store.uri.type == StoreType.REMOTE_HTTP:
         raise RuntimeError("Cannot run backend with remote HTTP store.")
     state.set_artifact_store(artifact_store)
 
     # Initialize the backing user store instance. Assume same store as artifact one for now.
     # TODO: allow for separate config of uri here
-    user_store = user_store_factory.create_user_store(store_uri)
+    user_store = user_store_factory.create_user_store(
+        store_uri, add_default_data=seed, **settings.get_db_pool_options()
+    )
     state.set_user_store(user_store)
 
     # First add the sample catalog store.
     sample_catalog = SampleCatalog.setup_sample_catalog(
-        stores_uri=artifact_store.uri
+        stores_uri=artifact_store.uri, reset=seed
     )
     state.add_catalog_store(
         store=sample_catalog, id=SampleCatalog.SAMPLE_CATALOG_ID
@@ -107,16 +194,33 @@ def run(
         or parsed_uri.type == StoreType.LOCAL_FILESYSTEM
     ):
         custom_list_store = InitialCustomLists.setup_custom_list_store(
-            stores_uri=artifact_store.uri
+            stores_uri=artifact_store.uri, add_initial_lists=seed
         )
         state.set_custom_list_store(custom_list_store)
 
     # Set the token signing key.
     state.set_token_key(jwt_secret)
 
-    # Run the server
-    uvicorn.run(app, host=host, port=port)
-    return EXIT_SUCCESS
+
+@contextmanager
+def _seed_lock(store_uri: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock while writing default data to the stores with the given URI, so
+    backends started at the same time on the same stores don't write it concurrently.
+    :param store_uri: The store URI string
+    """
+    digest = hashlib.sha256(store_uri.encode("utf-8")).hexdigest()[:16]
+    # Not fs_storage.file_lock, as the stores take those while seeding and they must not nest.
+    with open(
+        Path(tempfile.gettempdir(), f".mlte-seed-{digest}.lock"), "a"
+    ) as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
 
 def main() -> int:
@@ -127,6 +231,7 @@ def main() -> int:
         settings.CATALOG_URIS,
         settings.ALLOWED_ORIGINS,
         settings.JWT_SECRET_KEY,
+        settings.BACKEND_WORKERS,
     )
 
 
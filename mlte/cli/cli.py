@@ -16,6 +16,18 @@ import mlte.frontend as frontend
 from mlte._private.fixed_json import json
 from mlte.backend.core.config import settings as backend_settings
 from mlte.frontend.config import settings as frontend_settings
+from mlte.store.artifact import factory as artifact_store_factory
+from mlte.store.artifact.underlying.fs import LocalFileSystemStore
+from mlte.store.base import StoreType, StoreURI
+from mlte.store.common.fs_codec import DEFAULT_CODEC, get_codec
+from mlte.store.common.fs_storage import (
+    CODEC_OPTION,
+    FSYNC_OPTION,
+    FsyncPolicy,
+    parse_options,
+    parse_root_path,
+    reencode_files,
+)
 
 # CLI exit codes
 EXIT_SUCCESS = 0
@@ -56,7 +68,13 @@ def _prepare_parser():
 
     # Attach subparsers
     subparser = base_parser.add_subparsers(help="Subcommands:")
-    for attach_to in [_attach_backend_parser, _attach_frontend_parser]:
+    for attach_to in [
+        _attach_backend_parser,
+        _attach_frontend_parser,
+        _attach_index_parser,
+        _attach_blobs_parser,
+        _attach_migrate_parser,
+    ]:
         attach_to(subparser)
     return base_parser
 
@@ -107,6 +125,12 @@ def _attach_backend_parser(
         default=backend_settings.JWT_SECRET_KEY,
         help="A secret random string key used to sign tokens",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=backend_settings.BACKEND_WORKERS,
+        help=f"The number of worker processes serving requests; more than one needs a persistent store (default: {backend_settings.BACKEND_WORKERS})",
+    )
 
 
 def _attach_frontend_parser(
@@ -133,6 +157,157 @@ def _attach_frontend_parser(
     )
 
 
+def _attach_index_parser(
+    subparser: argparse._SubParsersAction[argparse.ArgumentParser],
+):
+    """Attach the file system store index subparser to the base parser."""
+    parser: argparse.ArgumentParser = subparser.add_parser(
+        "index",
+        help="Check the artifact indexes of a local file system store.",
+    )
+    parser.set_defaults(func=check_index)
+
+    # Additional arguments.
+    parser.add_argument(
+        "--store-uri",
+        type=str,
+        default=backend_settings.STORE_URI,
+        help=f"The URI for the file system store (default: {backend_settings.STORE_URI}).",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the indexes that are not consistent with the stored artifacts.",
+    )
+
+
+def _attach_blobs_parser(
+    subparser: argparse._SubParsersAction[argparse.ArgumentParser],
+):
+    """Attach the blob cleanup subparser to the base parser."""
+    parser: argparse.ArgumentParser = subparser.add_parser(
+        "blobs",
+        help="Check a local file system or relational DB store for blobs that no artifact references.",
+    )
+    parser.set_defaults(func=check_blobs)
+
+    # Additional arguments.
+    parser.add_argument(
+        "--store-uri",
+        type=str,
+        default=backend_settings.STORE_URI,
+        help=f"The URI for the file system or relational DB store (default: {backend_settings.STORE_URI}).",
+    )
+    parser.add_argument(
+        "--remove",
+        action="store_true",
+        help="Remove the blobs that no artifact references. The store should not be written to meanwhile.",
+    )
+
+
+def _attach_migrate_parser(
+    subparser: argparse._SubParsersAction[argparse.ArgumentParser],
+):
+    """Attach the file system store encoding migration subparser to the base parser."""
+    parser: argparse.ArgumentParser = subparser.add_parser(
+        "migrate",
+        help="Re-encode all files of a local file system store with the codec in its URI.",
+    )
+    parser.set_defaults(func=migrate_encoding)
+
+    # Additional arguments.
+    parser.add_argument(
+        "--store-uri",
+        type=str,
+        default=backend_settings.STORE_URI,
+        help=f"The URI for the file system store, with the target codec, e.g. fs://store?codec=zstd (default: {backend_settings.STORE_URI}).",
+    )
+
+
+# -----------------------------------------------------------------------------
+# Commands
+# -----------------------------------------------------------------------------
+
+
+def check_index(store_uri: str, rebuild: bool) -> int:
+    """
+    Check the artifact index of every version in a local file system store.
+    :param store_uri: The URI for the store
+    :param rebuild: Whether to rebuild inconsistent indexes
+    :return: The exit code; failure if inconsistencies were found and not fixed
+    """
+    uri = StoreURI.from_string(store_uri)
+    if uri.type != StoreType.LOCAL_FILESYSTEM:
+        print(f"Only file system stores have an artifact index: {store_uri}")
+        return EXIT_FAILURE
+
+    inconsistent = False
+    session = LocalFileSystemStore(uri).session()
+    for model_id in session.list_models():
+        for version_id in session.list_versions(model_id):
+            problems = session.check_index(model_id, version_id, rebuild)
+            for problem in problems:
+                print(f"{model_id}/{version_id}: {problem}")
+            inconsistent = inconsistent or len(problems) > 0
+    session.close()
+
+    if inconsistent and rebuild:
+        print("Inconsistent indexes were rebuilt.")
+    return EXIT_FAILURE if inconsistent and not rebuild else EXIT_SUCCESS
+
+
+def check_blobs(store_uri: str, remove: bool) -> int:
+    """
+    Find the blobs of every model in a local store that no artifact references, left behind
+    by artifacts that were deleted or overwritten.
+    :param store_uri: The URI for the store
+    :param remove: Whether to remove the unreferenced blobs
+    :return: The exit code; failure if unreferenced blobs were found and not removed
+    """
+    uri = StoreURI.from_string(store_uri)
+    if uri.type not in [StoreType.LOCAL_FILESYSTEM, StoreType.RELATIONAL_DB]:
+        print(
+            f"Only file system and relational DB stores can be checked for blobs: {store_uri}"
+        )
+        return EXIT_FAILURE
+
+    unreferenced = False
+    store = artifact_store_factory.create_artifact_store(store_uri)
+    session = store.session()
+    for model_id in session.list_models():
+        for digest in session.sweep_blobs(model_id, remove):
+            print(f"{model_id}: blob {digest} is not referenced.")
+            unreferenced = True
+    session.close()
+    store.close()
+
+    if unreferenced and remove:
+        print("Unreferenced blobs were removed.")
+    return EXIT_FAILURE if unreferenced and not remove else EXIT_SUCCESS
+
+
+def migrate_encoding(store_uri: str) -> int:
+    """
+    Re-encode, in place, all stored files of a local file system store.
+    :param store_uri: The URI for the store, which selects the codec to use
+    :return: The exit code
+    """
+    uri = StoreURI.from_string(store_uri)
+    if uri.type != StoreType.LOCAL_FILESYSTEM:
+        print(f"Only file system stores can be re-encoded: {store_uri}")
+        return EXIT_FAILURE
+
+    options = parse_options(uri)
+    codec = get_codec(options.get(CODEC_OPTION, DEFAULT_CODEC))
+    count = reencode_files(
+        parse_root_path(uri),
+        codec,
+        FsyncPolicy(options.get(FSYNC_OPTION, FsyncPolicy.NONE)),
+    )
+    print(f"Re-encoded {count} files with the '{codec.name}' codec.")
+    return EXIT_SUCCESS
+
+
 # -----------------------------------------------------------------------------
 # Entry Point
 # -----------------------------------------------------------------------------
@@ -6,16 +6,18 @@ CPU utilization measurement for local training processes.
 
 from __future__ import annotations
 
-import subprocess
 import time
-from subprocess import SubprocessError
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Optional, Type
 
 from mlte._private.platform import is_windows
 from mlte.evidence.metadata import EvidenceMetadata
 from mlte.measurement.process_measurement import ProcessMeasurement
+from mlte.measurement.process_monitor import Metric, ProcessSamples
+from mlte.measurement.utility.process_tree import CPUSampler, summarize_children
+from mlte.measurement.utility.statistics import percentile
 from mlte.spec.condition import Condition
 from mlte.value.base import ValueBase
+from mlte.value.types.time_series import TimeSeries
 
 # -----------------------------------------------------------------------------
 # CPUStatistics
@@ -35,6 +37,11 @@ class CPUStatistics(ValueBase):
         avg: float,
         min: float,
         max: float,
+        p50: Optional[float] = None,
+        p95: Optional[float] = None,
+        p99: Optional[float] = None,
+        children: Optional[List[Dict[str, Any]]] = None,
+        series: Optional[TimeSeries] = None,
     ):
         """
         Initialize a CPUStatistics instance.
@@ -43,6 +50,11 @@ class CPUStatistics(ValueBase):
         :param avg: The average utilization
         :param min: The minimum utilization
         :param max: The maximum utilization
+        :param p50: The median utilization, if known
+        :param p95: The 95th percentile of utilization, if known
+        :param p99: The 99th percentile of utilization, if known
+        :param children: The utilization of each descendant process, if they were measured
+        :param series: The utilization over time, if it was kept
         """
         super().__init__(self, evidence_metadata)
 
@@ -55,13 +67,97 @@ class CPUStatistics(ValueBase):
         self.max = max
         """The maximum CPU utilization, as a proportion."""
 
+        self.p50 = p50
+        """The median CPU utilization, as a proportion."""
+
+        self.p95 = p95
+        """The 95th percentile of CPU utilization, as a proportion."""
+
+        self.p99 = p99
+        """The 99th percentile of CPU utilization, as a proportion."""
+
+        self.children = children
+        """
+        The pid, name, and average, minimum and maximum utilization of each descendant process,
+        while it was running; None if only the process itself was measured.
+        """
+
+        self.series = series
+        """The utilization over time, downsampled; None if it was not kept."""
+
+    @staticmethod
+    def from_samples(
+        evidence_metadata: EvidenceMetadata,
+        samples: List[float],
+        children: Optional[List[Dict[str, Any]]] = None,
+    ) -> CPUStatistics:
+        """
+        Summarize samples of CPU utilization.
+
+        :param evidence_metadata: The generating measurement's metadata
+        :param samples: The utilization samples, as proportions; there must be at least one
+        :param children: The utilization of each descendant process, if they were measured
+
+        :return: The statistics of the samples
+        """
+        return CPUStatistics(
+            evidence_metadata,
+            avg=sum(samples) / len(samples),
+            min=min(samples),
+            max=max(samples),
+            p50=percentile(samples, 50),
+            p95=percentile(samples, 95),
+            p99=percentile(samples, 99),
+            children=children,
+        )
+
+    @staticmethod
+    def from_series(
+        evidence_metadata: EvidenceMetadata,
+        series: TimeSeries,
+        children: Optional[List[Dict[str, Any]]] = None,
+    ) -> CPUStatistics:
+        """
+        Summarize a series of CPU utilization, keeping the series.
+
+        :param evidence_metadata: The generating measurement's metadata
+        :param series: The utilization over time, as proportions; there must be at least one point
+        :param children: The utilization of each descendant process, if they were measured
+
+        :return: The statistics of the series; percentiles are estimates
+        """
+        assert series.mean is not None, "Broken precondition."
+        assert series.min is not None and series.max is not None
+        return CPUStatistics(
+            evidence_metadata,
+            avg=series.mean,
+            min=series.min,
+            max=series.max,
+            p50=series.percentile(50),
+            p95=series.percentile(95),
+            p99=series.percentile(99),
+            children=children,
+            series=series,
+        )
+
     def serialize(self) -> Dict[str, Any]:
         """
         Serialize an CPUStatistics to a JSON object.
 
         :return: The JSON object
         """
-        return {"avg": self.avg, "min": self.min, "max": self.max}
+        return {
+            "avg": self.avg,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.p50,
+            "p95": self.p95,
+            "p99": self.p99,
+            "children": self.children,
+            "series": (
+                self.series.serialize() if self.series is not None else None
+            ),
+        }
 
     @staticmethod
     def deserialize(
@@ -80,6 +176,16 @@ class CPUStatistics(ValueBase):
             avg=data["avg"],
             min=data["min"],
             max=data["max"],
+            # Values stored before percentiles were measured don't have them.
+            p50=data.get("p50"),
+            p95=data.get("p95"),
+            p99=data.get("p99"),
+            children=data.get("children"),
+            series=(
+                TimeSeries.deserialize(evidence_metadata, data["series"])
+                if data.get("series") is not None
+                else None
+            ),
         )
 
     def __str__(self) -> str:
@@ -88,6 +194,15 @@ class CPUStatistics(ValueBase):
         s += f"Average: {self.avg:.2f}%\n"
         s += f"Minimum: {self.min:.2f}%\n"
         s += f"Maximum: {self.max:.2f}%"
+        for name, value in [
+            ("P50", self.p50),
+            ("P95", self.p95),
+            ("P99", self.p99),
+        ]:
+            if value is not None:
+                s += f"\n{name}: {value:.2f}%"
+        for child in self.children or []:
+            s += f"\nChild {child['pid']} ({child['name']}): average {child['avg']:.2f}%, maximum {child['max']:.2f}%"
         return s
 
     @classmethod
@@ -106,6 +221,24 @@ class CPUStatistics(ValueBase):
         )
         return condition
 
+    @classmethod
+    def p95_utilization_less_than(cls, threshold: float) -> Condition:
+        """
+        Construct and invoke a condition for the 95th percentile of CPU utilization,
+        which unlike the maximum is not affected by short spikes.
+
+        :param threshold: The threshold value for the 95th percentile of utilization, as percentage
+
+        :return: The Condition that can be used to validate a Value.
+        """
+        condition: Condition = Condition.build_condition(
+            bool_exp=lambda stats: stats.p95 is not None
+            and stats.p95 < threshold,
+            success=f"95th percentile of utilization below threshold {threshold:.2f}",
+            failure=f"95th percentile of utilization exceeds threshold {threshold:.2f}, or was not measured",
+        )
+        return condition
+
     @classmethod
     def average_utilization_less_than(cls, threshold: float) -> Condition:
         """
@@ -143,59 +276,69 @@ class LocalProcessCPUUtilization(ProcessMeasurement):
                 f"Measurement {self.metadata.identifier} is not supported on Windows."
             )
 
-    def __call__(self, pid: int, poll_interval: int = 1) -> CPUStatistics:
+    def __call__(
+        self, pid: int, poll_interval: float = 1, include_children: bool = False
+    ) -> CPUStatistics:
         """
         Monitor the CPU utilization of process at `pid` until exit.
 
         :param pid: The process identifier
-        :param poll_interval: The poll interval in seconds
+        :param poll_interval: The poll interval in seconds; sampling is cheap, so it can be well below a second
+        :param include_children: Whether to add the utilization of all descendants of the process,
+        such as data loading workers, found again on every sample; each is also reported on its own
 
         :return: The collection of CPU usage statistics
         """
-        stats = []
-        while True:
-            util = _get_cpu_usage(pid)
-            if util < 0.0:
-                break
-            stats.append(util / 100.0)
-            time.sleep(poll_interval)
-
-        return CPUStatistics(
+        sampler = CPUSampler(pid, include_children)
+        # Series keep bounded memory, however long the process runs.
+        stats = TimeSeries(self.metadata)
+        children: Dict[int, TimeSeries] = {}
+        next_sample = time.monotonic()
+        with self._watch_exit(pid) as watcher:
+            while True:
+                # Samples are taken at a fixed rate, so the time spent sampling does not add up.
+                next_sample += poll_interval
+                if watcher.wait(max(0.0, next_sample - time.monotonic())):
+                    break
+                utils = sampler.sample()
+                if utils is None:
+                    break
+                timestamp = time.time()
+                stats.append(timestamp, sum(utils.values()))
+                for process_pid, util in utils.items():
+                    if process_pid not in children:
+                        children[process_pid] = TimeSeries(self.metadata)
+                    children[process_pid].append(timestamp, util)
+
+        if stats.count == 0:
+            raise RuntimeError(
+                f"Process {pid} exited before its CPU utilization could be sampled; try a shorter poll interval."
+            )
+        return CPUStatistics.from_series(
             self.metadata,
-            avg=sum(stats) / len(stats),
-            min=min(stats),
-            max=max(stats),
+            stats,
+            (
+                summarize_children(children, sampler.tree)
+                if include_children
+                else None
+            ),
         )
 
-    @classmethod
-    def value(self) -> Type[CPUStatistics]:
-        """Returns the class type object for the Value produced by the Measurement."""
-        return CPUStatistics
-
-
-# -----------------------------------------------------------------------------
-# Helpers
-# -----------------------------------------------------------------------------
+    def required_metrics(self) -> List[Metric]:
+        """Returns the metrics this measurement is computed from, when subscribed to a ProcessMonitor."""
+        return [Metric.CPU]
 
+    def summarize(self, samples: ProcessSamples) -> CPUStatistics:
+        """
+        Compute the CPU utilization from the samples of a ProcessMonitor.
 
-def _get_cpu_usage(pid: int) -> float:
-    """
-    Get the current CPU usage for the process with `pid`.
+        :param samples: The samples, including those of CPU utilization
 
-    :param pid: The identifier of the process
+        :return: The collection of CPU usage statistics
+        """
+        return CPUStatistics.from_series(self.metadata, samples.get(Metric.CPU))
 
-    :return: The current CPU utilization as percentage
-    """
-    try:
-        stdout = subprocess.check_output(
-            ["ps", "-p", f"{pid}", "-o", "%cpu"], stderr=subprocess.DEVNULL
-        ).decode("utf-8")
-        return float(stdout.strip().split("\n")[1].strip())
-    except SubprocessError:
-        return -1.0
-    except ValueError:
-        return -1.0
-    except FileNotFoundError as e:
-        raise RuntimeError(
-            f"External program needed to get CPU usage was not found: {e}"
-        )
+    @classmethod
+    def value(self) -> Type[CPUStatistics]:
+        """Returns the class type object for the Value produced by the Measurement."""
+        return CPUStatistics
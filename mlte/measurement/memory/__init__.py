@@ -1,7 +1,8 @@
 from .local_process_memory_consumption import (
     LocalProcessMemoryConsumption,
     MemoryStatistics,
+    MemoryType,
 )
 
 # TODO(Kyle): Find a more elegant way to do this
-__all__ = ["LocalProcessMemoryConsumption", "MemoryStatistics"]
+__all__ = ["LocalProcessMemoryConsumption", "MemoryStatistics", "MemoryType"]
@@ -6,16 +6,48 @@ Memory consumption measurement for local training processes.
 
 from __future__ import annotations
 
+import functools
 import subprocess
 import time
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import psutil
+from strenum import StrEnum
 
 from mlte.evidence.metadata import EvidenceMetadata
 from mlte.measurement.process_measurement import ProcessMeasurement
+from mlte.measurement.process_monitor import Metric, ProcessSamples
+from mlte.measurement.utility.process_tree import (
+    ProcessTree,
+    summarize_children,
+)
 from mlte.spec.condition import Condition
 from mlte.value.base import ValueBase
+from mlte.value.types.time_series import TimeSeries
+
+# -----------------------------------------------------------------------------
+# Memory Type
+# -----------------------------------------------------------------------------
+
+
+class MemoryType(StrEnum):
+    """The ways to count the memory of a process."""
+
+    RSS = "rss"
+    """Resident set size: all pages in memory, including those shared with other processes."""
+
+    PSS = "pss"
+    """Proportional set size: private pages, and an even share of each shared page (Linux only)."""
+
+    USS = "uss"
+    """Unique set size: only the pages that would be freed if the process exited."""
+
+    MIXED = "mixed"
+    """
+    PSS or USS for the processes where it could be read, and RSS for the others; the type
+    used for each descendant process is reported with it.
+    """
+
 
 # -----------------------------------------------------------------------------
 # Memory Statistics
@@ -35,6 +67,9 @@ class MemoryStatistics(ValueBase):
         avg: int,
         min: int,
         max: int,
+        memory_type: Optional[MemoryType] = None,
+        children: Optional[List[Dict[str, Any]]] = None,
+        series: Optional[TimeSeries] = None,
     ):
         """
         Initialize a MemoryStatistics instance.
@@ -43,6 +78,9 @@ class MemoryStatistics(ValueBase):
         :param avg: The average memory consumption, in KB
         :param min: The minimum memory consumption, in KB
         :param max: The maximum memory consumption, in KB
+        :param memory_type: How memory was counted, if known
+        :param children: The consumption of each descendant process, if they were measured
+        :param series: The consumption over time, in KB, if it was kept
         """
         super().__init__(self, evidence_metadata)
 
@@ -55,13 +93,34 @@ class MemoryStatistics(ValueBase):
         self.max = max
         """The maximum memory consumption (KB)."""
 
+        self.memory_type = memory_type
+        """How memory was counted; values stored without it counted RSS."""
+
+        self.children = children
+        """
+        The pid, name, average, minimum and maximum consumption (KB), and memory type of each
+        descendant process, while it was running; None if only the process itself was measured.
+        """
+
+        self.series = series
+        """The consumption over time (KB), downsampled; None if it was not kept."""
+
     def serialize(self) -> Dict[str, Any]:
         """
         Serialize an MemoryStatistics to a JSON object.
 
         :return: The JSON object
         """
-        return {"avg": self.avg, "min": self.min, "max": self.max}
+        return {
+            "avg": self.avg,
+            "min": self.min,
+            "max": self.max,
+            "memory_type": self.memory_type,
+            "children": self.children,
+            "series": (
+                self.series.serialize() if self.series is not None else None
+            ),
+        }
 
     @staticmethod
     def deserialize(
@@ -80,6 +139,17 @@ class MemoryStatistics(ValueBase):
             avg=data["avg"],
             min=data["min"],
             max=data["max"],
+            memory_type=(
+                MemoryType(data["memory_type"])
+                if data.get("memory_type") is not None
+                else None
+            ),
+            children=data.get("children"),
+            series=(
+                TimeSeries.deserialize(evidence_metadata, data["series"])
+                if data.get("series") is not None
+                else None
+            ),
         )
 
     def __str__(self) -> str:
@@ -88,6 +158,10 @@ class MemoryStatistics(ValueBase):
         s += f"Average: {self.avg}\n"
         s += f"Minimum: {self.min}\n"
         s += f"Maximum: {self.max}"
+        if self.memory_type is not None:
+            s += f"\nType: {self.memory_type.upper()}"
+        for child in self.children or []:
+            s += f"\nChild {child['pid']} ({child['name']}): average {child['avg']:.0f}, maximum {child['max']}"
         return s
 
     @classmethod
@@ -139,27 +213,100 @@ class LocalProcessMemoryConsumption(ProcessMeasurement):
         """
         super().__init__(self, identifier)
 
-    def __call__(self, pid: int, poll_interval: int = 1) -> MemoryStatistics:
+    def __call__(
+        self,
+        pid: int,
+        poll_interval: float = 1,
+        include_children: bool = False,
+        memory_type: Optional[MemoryType] = None,
+    ) -> MemoryStatistics:
         """
         Monitor memory consumption of process at `pid` until exit.
 
         :param pid: The process identifier
         :param poll_interval: The poll interval, in seconds
+        :param include_children: Whether to add the consumption of all descendants of the process,
+        such as data loading workers, found again on every sample; each is also reported on its own
+        :param memory_type: How to count memory; by default RSS for a single process, and PSS for a
+        process tree, as the RSS of processes sharing pages counts those pages several times. Where PSS
+        or USS can't be read, such as for processes of other users, RSS is used instead, and the
+        type reported is the one actually used
         :return: The captured statistics
         """
-        stats = []
-        while True:
-            kb = _get_memory_usage_psutil(pid)
-            if kb == 0:
-                break
-            stats.append(kb)
-            time.sleep(poll_interval)
+        if memory_type is None:
+            memory_type = MemoryType.PSS if include_children else MemoryType.RSS
+
+        tree = ProcessTree(pid, include_children)
+        # Series keep bounded memory, however long the process runs.
+        stats = TimeSeries(self.metadata)
+        children: Dict[int, TimeSeries] = {}
+        types: Dict[int, MemoryType] = {}
+        with self._watch_exit(pid) as watcher:
+            while True:
+                usage = _get_memory_usage_tree(tree, memory_type)
+                if usage is None:
+                    break
+                timestamp = time.time()
+                stats.append(timestamp, sum(kb for kb, _ in usage.values()))
+                for process_pid, (kb, used_type) in usage.items():
+                    if process_pid not in children:
+                        children[process_pid] = TimeSeries(self.metadata)
+                        types[process_pid] = used_type
+                    children[process_pid].append(timestamp, kb)
+                    types[process_pid] = _combine_types(
+                        types[process_pid], used_type
+                    )
+                if watcher.wait(poll_interval):
+                    break
+
+        if stats.mean is None or stats.min is None or stats.max is None:
+            raise RuntimeError(
+                f"Process {pid} exited before its memory consumption could be sampled."
+            )
+        return MemoryStatistics(
+            self.metadata,
+            avg=int(stats.mean),
+            min=int(stats.min),
+            max=int(stats.max),
+            memory_type=functools.reduce(_combine_types, types.values()),
+            children=(
+                [
+                    {
+                        **child,
+                        "avg": int(child["avg"]),
+                        "min": int(child["min"]),
+                        "max": int(child["max"]),
+                        "memory_type": types[child["pid"]],
+                    }
+                    for child in summarize_children(children, tree)
+                ]
+                if include_children
+                else None
+            ),
+            series=stats,
+        )
 
+    def required_metrics(self) -> List[Metric]:
+        """Returns the metrics this measurement is computed from, when subscribed to a ProcessMonitor."""
+        return [Metric.RSS]
+
+    def summarize(self, samples: ProcessSamples) -> MemoryStatistics:
+        """
+        Compute the memory consumption from the samples of a ProcessMonitor, counted as RSS.
+
+        :param samples: The samples, including those of RSS
+        :return: The captured statistics
+        """
+        stats = samples.get(Metric.RSS)
+        assert stats.mean is not None, "Broken precondition."
+        assert stats.min is not None and stats.max is not None
         return MemoryStatistics(
             self.metadata,
-            avg=int(sum(stats) / len(stats)),
-            min=min(stats),
-            max=max(stats),
+            avg=int(stats.mean),
+            min=int(stats.min),
+            max=int(stats.max),
+            memory_type=MemoryType.RSS,
+            series=stats,
         )
 
     @classmethod
@@ -206,16 +353,48 @@ def _get_memory_usage_pmap(pid: int) -> int:
         )
 
 
-def _get_memory_usage_psutil(pid: int) -> int:
+def _get_memory_usage_tree(
+    tree: ProcessTree, memory_type: MemoryType
+) -> Optional[Dict[int, Tuple[int, MemoryType]]]:
     """
-    Get the current memory usage for the process with `pid`.
+    Get the current memory usage of each process in a tree.
 
-    :param pid: The identifier of the process
-    :return: The current memory usage in KB
+    :param tree: The processes
+    :param memory_type: How to count memory
+    :return: The current memory usage of each process in KB and how it was counted, by pid;
+    or None if the root process exited
     """
-    try:
-        curr_proc = psutil.Process(pid)
-        mem_in_kb = curr_proc.memory_info().rss / 1024
-        return int(mem_in_kb)
-    except psutil.NoSuchProcess:
-        return 0
+    usage = {}
+    for process in tree.refresh():
+        try:
+            usage[process.pid] = _get_memory_usage(process, memory_type)
+        except psutil.NoSuchProcess:
+            continue
+    return usage if tree.pid in usage else None
+
+
+def _get_memory_usage(
+    process: psutil.Process, memory_type: MemoryType
+) -> Tuple[int, MemoryType]:
+    """
+    Get the current memory usage of a process.
+
+    :param process: The process
+    :param memory_type: How to count memory; RSS is used where it can't be counted that way
+    :return: The current memory usage in KB, and how it was counted
+    """
+    if memory_type != MemoryType.RSS:
+        try:
+            # Reads /proc/<pid>/smaps on Linux, which is slower than the RSS alone.
+            info = process.memory_full_info()
+            value = getattr(info, memory_type.value, None)
+            if value is not None:
+                return int(value / 1024), memory_type
+        except psutil.AccessDenied:
+            pass
+    return int(process.memory_info().rss / 1024), MemoryType.RSS
+
+
+def _combine_types(a: MemoryType, b: MemoryType) -> MemoryType:
+    """Returns how a sum of memory counted in two ways is counted."""
+    return a if a == b else MemoryType.MIXED
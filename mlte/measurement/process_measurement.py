@@ -6,14 +6,54 @@ Base class for measurement of external processes asynchronously.
 
 from __future__ import annotations
 
+import contextlib
 import threading
-import time
-from typing import List, Optional
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 from mlte._private import job
 from mlte.measurement.measurement import Measurement
+from mlte.measurement.utility.process_exit import ProcessExitWatcher
 from mlte.value.artifact import Value
 
+if TYPE_CHECKING:
+    from mlte.measurement.process_monitor import Metric, ProcessSamples
+
+# -----------------------------------------------------------------------------
+# MeasurementFuture
+# -----------------------------------------------------------------------------
+
+
+class MeasurementFuture(Future[Value]):
+    """
+    The eventual value of a process measurement evaluated in the background. It can be waited for
+    along with others with concurrent.futures.wait() or as_completed(). It stays pending until the
+    measurement finishes, so it can be cancelled at any time before, which also stops the measurement.
+    """
+
+    def __init__(self, measurement: ProcessMeasurement) -> None:
+        """
+        Initialize a pending future.
+
+        :param measurement: The measurement being evaluated
+        """
+        super().__init__()
+
+        self.measurement = measurement
+        """The measurement being evaluated."""
+
+    def cancel(self) -> bool:
+        """
+        Cancel the future, and stop the measurement.
+
+        :return: False if the measurement already finished, True otherwise
+        """
+        cancelled = super().cancel()
+        if cancelled:
+            self.measurement.cancel()
+        return cancelled
+
+
 # -----------------------------------------------------------------------------
 # ProcessMeasurement
 # -----------------------------------------------------------------------------
@@ -52,48 +92,161 @@ class ProcessMeasurement(Measurement):
         """
         super().__init__(instance, identifier)
         self.thread: Optional[threading.Thread] = None
+        self.future: Optional[MeasurementFuture] = None
         self.stored_value: Optional[Value] = None
         self.error: str = ""
 
-    def evaluate_async(self, pid: int, *args, **kwargs):
+        self._stop = threading.Event()
+        """Set to stop the evaluation in progress."""
+
+        self._watchers: List[ProcessExitWatcher] = []
+        """The watchers the evaluation in progress waits on, to wake them when stopped."""
+
+    def evaluate(self, *args, **kwargs) -> Value:
+        """
+        Evaluate a measurement and return a value with semantics.
+
+        :return: The resulting value of measurement execution, with semantics
+        """
+        self._start()
+        try:
+            value = self.__call__(*args, **kwargs)
+        except Exception as e:
+            self._finish(None, f"Could not evaluate process: {e}")
+            raise
+        self._finish(value, "")
+        return value
+
+    def evaluate_async(self, pid: int, *args, **kwargs) -> MeasurementFuture:
         """
         Monitor an external process at `pid` in a separate thread until it stops.
         Equivalent to evaluate(), but does not return the value immediately as it works in the background.
 
         :param pid: The process identifier
+        :return: A future for the resulting value; cancelling it stops the measurement
         """
 
         # Evaluate the measurement
-        self.error = ""
-        self.stored_value = None
+        future = self._start()
         self.thread = threading.Thread(
             target=lambda: self._run_call(pid, *args, **kwargs)
         )
         self.thread.start()
+        return future
+
+    def cancel(self) -> None:
+        """
+        Stop the evaluation in progress, which returns as soon as it notices. Measurements that sample
+        until their process exits return what they sampled so far, unless their future was cancelled.
+        """
+        self._stop.set()
+        for watcher in list(self._watchers):
+            watcher.wake()
+
+    def _start(self) -> MeasurementFuture:
+        """
+        Prepare a new evaluation.
+
+        :return: The future for its value
+        """
+        self.error = ""
+        self.stored_value = None
+        self._stop = threading.Event()
+        self.future = MeasurementFuture(self)
+        return self.future
+
+    def _finish(self, value: Optional[Value], error: str) -> None:
+        """
+        Store the results of an evaluation, and resolve its future unless it was cancelled.
+
+        :param value: The resulting value, if any
+        :param error: The error raised by the evaluation, or an empty string
+        """
+        self.stored_value, self.error = value, error
+        if (
+            self.future is None
+            or self.future.done()
+            or not self.future.set_running_or_notify_cancel()
+        ):
+            return
+        if error != "":
+            self.future.set_exception(RuntimeError(error))
+        elif value is None:
+            self.future.set_exception(
+                Exception("No valid value was returned from measurement.")
+            )
+        else:
+            self.future.set_result(value)
 
     def _run_call(self, pid, *args, **kwargs):
         """
         Runs the internall __call__ method that should implement the measurement, and stores its results when it finishes.
         """
         try:
-            self.stored_value = self.__call__(pid, *args, **kwargs)
+            value = self.__call__(pid, *args, **kwargs)
         except Exception as e:
-            self.error = f"Could not evaluate process: {e}"
+            self._finish(None, f"Could not evaluate process: {e}")
+        else:
+            self._finish(value, "")
+
+    @contextlib.contextmanager
+    def _watch_exit(self, pid: int) -> Iterator[ProcessExitWatcher]:
+        """
+        Watch a process for the evaluation in progress; waits on the watcher end as soon as the
+        process exits, or the evaluation is cancelled.
+
+        :param pid: The process identifier
+        :return: The watcher
+        """
+        with ProcessExitWatcher(pid) as watcher:
+            self._watchers.append(watcher)
+            try:
+                # Checked after registering, so a concurrent cancel() is not missed.
+                if self._stop.is_set():
+                    watcher.wake()
+                yield watcher
+            finally:
+                self._watchers.remove(watcher)
+
+    def required_metrics(self) -> List[Metric]:
+        """
+        The metrics of a ProcessMonitor this measurement can be computed from, when subscribed to it.
+        Measurements that don't support it return none.
+
+        :return: The metrics
+        """
+        return []
+
+    def summarize(self, samples: ProcessSamples) -> Value:
+        """
+        Compute the measurement from the samples of a ProcessMonitor it subscribed to.
+
+        :param samples: The samples, including those of the required metrics
+        :return: The resulting value of measurement execution, with semantics
+        """
+        raise NotImplementedError(
+            f"Measurement {self.metadata.identifier} can't be computed from samples."
+        )
 
-    def wait_for_output(self, poll_interval: int = 1) -> Value:
+    def wait_for_output(
+        self, poll_interval: float = 1, timeout: Optional[float] = None
+    ) -> Value:
         """
-        Needed to get the output of a measurement executed in parallel using evaluate_async. Waits for the thread to finish.
+        Needed to get the output of a measurement executed in parallel using evaluate_async, or computed
+        by a ProcessMonitor it subscribed to. Waits for the measurement to finish.
 
-        :param poll_interval: The poll interval in seconds
+        :param poll_interval: Not used, as the wait ends as soon as the measurement finishes; kept for compatibility
+        :param timeout: The maximum time to wait in seconds, after which concurrent.futures.TimeoutError is raised;
+        waits until the measurement finishes by default
         :return: The resulting value of measurement execution, with semantics
         """
-        # Wait for thread to finish, and return results once it is done.
-        if self.thread is None:
+        # Wait for the measurement to finish, and return results once it is done.
+        if self.future is not None:
+            return self.future.result(timeout)
+        if self.stored_value is None and self.error == "":
             raise Exception(
                 "Can't wait for value, no process is currently running."
             )
-        while self.thread.is_alive():
-            time.sleep(poll_interval)
 
         # If an exception was raised, return it here as an exception as well.
         if self.error != "":
@@ -0,0 +1,293 @@
+"""
+mlte/measurement/process_monitor.py
+
+Measurement that samples several metrics of an external process in a single loop, for other measurements to share.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional
+
+import psutil
+from strenum import StrEnum
+
+from mlte.evidence.metadata import EvidenceMetadata
+from mlte.measurement.process_measurement import (
+    MeasurementFuture,
+    ProcessMeasurement,
+)
+from mlte.measurement.utility.process_tree import CPUSampler
+from mlte.value.types.opaque import Opaque
+from mlte.value.types.time_series import DEFAULT_MAX_POINTS, TimeSeries
+
+# -----------------------------------------------------------------------------
+# Metrics
+# -----------------------------------------------------------------------------
+
+
+class Metric(StrEnum):
+    """The metrics a ProcessMonitor can sample."""
+
+    CPU = "cpu"
+    """CPU utilization since the previous sample, as a proportion of one CPU."""
+
+    RSS = "rss"
+    """Resident set size, in KB."""
+
+    READ_BYTES = "read_bytes"
+    """Bytes read from storage so far."""
+
+    WRITE_BYTES = "write_bytes"
+    """Bytes written to storage so far."""
+
+    CONTEXT_SWITCHES = "context_switches"
+    """Voluntary and involuntary context switches so far."""
+
+    THREADS = "threads"
+    """Number of threads."""
+
+    FDS = "fds"
+    """Number of open file descriptors (not available on Windows)."""
+
+
+class ProcessSamples:
+    """Samples of several metrics of a process, taken at the same times and kept in bounded memory."""
+
+    def __init__(
+        self,
+        evidence_metadata: EvidenceMetadata,
+        metrics: List[Metric],
+        max_points: int = DEFAULT_MAX_POINTS,
+    ):
+        """
+        Initialize an empty set of samples.
+
+        :param evidence_metadata: The metadata of the measurement taking the samples
+        :param metrics: The metrics that are sampled
+        :param max_points: The maximum number of points kept of each metric
+        """
+        self.count = 0
+        """The number of samples taken."""
+
+        self.series: Dict[Metric, TimeSeries] = {
+            metric: TimeSeries(evidence_metadata, max_points=max_points)
+            for metric in metrics
+        }
+        """The values of each metric over time; values that could not be read are left out."""
+
+    def append(
+        self, timestamp: float, sample: Dict[Metric, Optional[float]]
+    ) -> None:
+        """
+        Add a sample of all metrics.
+
+        :param timestamp: The time of the sample, in seconds since the epoch
+        :param sample: The value of each metric
+        """
+        self.count += 1
+        for metric, series in self.series.items():
+            value = sample.get(metric)
+            if value is not None:
+                series.append(timestamp, value)
+
+    def get(self, metric: Metric) -> TimeSeries:
+        """
+        Get the values read for a metric.
+
+        :param metric: The metric
+        :return: The values that could be read, over time; there is at least one
+        """
+        if metric not in self.series:
+            raise RuntimeError(f"Metric {metric} was not sampled.")
+        series = self.series[metric]
+        if series.count == 0:
+            raise RuntimeError(f"No values of metric {metric} could be read.")
+        return series
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the samples to a JSON object.
+
+        :return: The number of samples, and the serialized series of each metric
+        """
+        return {
+            "count": self.count,
+            "metrics": {
+                str(m): series.serialize() for m, series in self.series.items()
+            },
+        }
+
+
+# -----------------------------------------------------------------------------
+# ProcessMonitor
+# -----------------------------------------------------------------------------
+
+
+class ProcessMonitor(ProcessMeasurement):
+    """
+    Samples several metrics of a local process in a single loop until it exits. Other process
+    measurements can subscribe to it, so they are computed from the same samples instead of each
+    polling the process on its own.
+    """
+
+    def __init__(self, identifier: str, metrics: Optional[List[Metric]] = None):
+        """
+        Initialize a new ProcessMonitor measurement.
+
+        :param identifier: A unique identifier for the measurement
+        :param metrics: The metrics to sample, besides those needed by subscribers; all by default
+        """
+        super().__init__(self, identifier)
+
+        self.metrics: List[Metric] = (
+            list(Metric) if metrics is None else list(metrics)
+        )
+        """The metrics that are sampled."""
+
+        self.subscribers: List[ProcessMeasurement] = []
+        """The measurements computed from the samples."""
+
+        self._started_subscribers = False
+        """Whether the subscribers were prepared for the evaluation in progress."""
+
+    def subscribe(self, measurement: ProcessMeasurement) -> None:
+        """
+        Compute a measurement from the samples of this monitor. Once the monitor is evaluated,
+        the value of the measurement is obtained with its wait_for_output().
+
+        :param measurement: The measurement; it must support being computed from samples
+        """
+        needed = measurement.required_metrics()
+        if len(needed) == 0:
+            raise ValueError(
+                f"Measurement {measurement.metadata.identifier} can't be computed from the samples of a ProcessMonitor."
+            )
+        self.subscribers.append(measurement)
+        for metric in needed:
+            if metric not in self.metrics:
+                self.metrics.append(metric)
+
+    def _start(self) -> MeasurementFuture:
+        """
+        Prepare a new evaluation, and one of each subscribed measurement, so their values can be
+        waited for as soon as the monitor is started.
+
+        :return: The future for the value of the monitor
+        """
+        for subscriber in self.subscribers:
+            subscriber._start()
+        self._started_subscribers = True
+        return super()._start()
+
+    def __call__(self, pid: int, poll_interval: float = 1) -> Opaque:
+        """
+        Sample the metrics of the process at `pid` until exit, and compute the subscribed measurements.
+
+        :param pid: The process identifier
+        :param poll_interval: The poll interval, in seconds
+
+        :return: The number of samples, and the series of each metric, downsampled
+        """
+        if not self._started_subscribers:
+            for subscriber in self.subscribers:
+                subscriber._start()
+        self._started_subscribers = False
+
+        sampler = _ProcessSampler(pid, self.metrics)
+        samples = ProcessSamples(self.metadata, self.metrics)
+        next_sample = time.monotonic()
+        with self._watch_exit(pid) as watcher:
+            while True:
+                # Samples are taken at a fixed rate, so the time spent sampling does not add up.
+                next_sample += poll_interval
+                if watcher.wait(max(0.0, next_sample - time.monotonic())):
+                    break
+                sample = sampler.sample()
+                if sample is None:
+                    break
+                samples.append(time.time(), sample)
+
+        for subscriber in self.subscribers:
+            try:
+                subscriber._finish(subscriber.summarize(samples), "")
+            except Exception as e:
+                subscriber._finish(None, f"Could not evaluate process: {e}")
+
+        if samples.count == 0:
+            raise RuntimeError(
+                f"Process {pid} exited before it could be sampled; try a shorter poll interval."
+            )
+        return Opaque(self.metadata, samples.to_dict())
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+class _ProcessSampler:
+    """Reads the metrics of a process, all at once."""
+
+    def __init__(self, pid: int, metrics: List[Metric]) -> None:
+        """
+        Start sampling a process.
+
+        :param pid: The identifier of the process
+        :param metrics: The metrics to read
+        """
+        self.metrics = metrics
+        """The metrics to read."""
+
+        self.cpu = CPUSampler(pid)
+        """The sampler of the CPU utilization, which follows the process."""
+
+    def sample(self) -> Optional[Dict[Metric, Optional[float]]]:
+        """
+        Take a sample.
+
+        :return: The value of each metric, None for those that can't be read; or None if the process exited
+        """
+        cpu: Optional[float] = None
+        if Metric.CPU in self.metrics:
+            utils = self.cpu.sample()
+            cpu = None if utils is None else utils.get(self.cpu.tree.pid)
+        else:
+            self.cpu.tree.refresh()
+        process = self.cpu.tree.root
+        if process is None:
+            return None
+
+        try:
+            # Reads each of the process' files in /proc once, for all metrics.
+            with process.oneshot():
+                return {
+                    metric: (
+                        cpu if metric == Metric.CPU else _read(process, metric)
+                    )
+                    for metric in self.metrics
+                }
+        except psutil.NoSuchProcess:
+            return None
+
+
+def _read(process: psutil.Process, metric: Metric) -> Optional[float]:
+    """Returns the value of a metric other than CPU, or None if it can't be read for the process."""
+    try:
+        if metric == Metric.RSS:
+            return int(process.memory_info().rss / 1024)
+        if metric == Metric.READ_BYTES:
+            return int(process.io_counters().read_bytes)
+        if metric == Metric.WRITE_BYTES:
+            return int(process.io_counters().write_bytes)
+        if metric == Metric.CONTEXT_SWITCHES:
+            switches = process.num_ctx_switches()
+            return int(switches.voluntary + switches.involuntary)
+        if metric == Metric.THREADS:
+            return int(process.num_threads())
+        if metric == Metric.FDS:
+            return int(process.num_fds())
+    except (psutil.AccessDenied, AttributeError):
+        # Some metrics need privileges, or are not available on every platform.
+        return None
+    raise ValueError(f"Unknown metric {metric}.")
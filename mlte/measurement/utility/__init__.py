@@ -1,4 +1,5 @@
 from .collection import flatten
 from .execution import concurrently
+from .statistics import percentile
 
-__all__ = ["concurrently", "flatten"]
+__all__ = ["concurrently", "flatten", "percentile"]
@@ -0,0 +1,139 @@
+"""
+mlte/measurement/utility/process_exit.py
+
+Utilities to wait for local processes to exit, for measurements of local processes.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import threading
+import time
+from types import TracebackType
+from typing import Optional, Tuple, Type
+
+import psutil
+
+POLL_INTERVAL = 0.05
+"""Seconds between checks for the exit of a process, where it can't be waited for without polling."""
+
+
+class ProcessExitWatcher:
+    """
+    Waits for a process to exit, or until it is woken. On Linux, the wait uses a pidfd of the
+    process, so it ends as soon as the process exits; elsewhere, the process is polled.
+    """
+
+    def __init__(self, pid: int) -> None:
+        """
+        Start watching a process.
+
+        :param pid: The identifier of the process
+        """
+        self.pid = pid
+        """The pid of the process."""
+
+        self.exited = False
+        """Whether the process was seen to exit."""
+
+        self._woken = threading.Event()
+        """Set when the watcher is woken."""
+
+        self._pidfd: Optional[int] = None
+        """A file descriptor that becomes readable when the process exits, if supported."""
+
+        self._wakeup: Optional[Tuple[int, int]] = None
+        """The read and write ends of a pipe written to wake a wait on the pidfd."""
+
+        self._process: Optional[psutil.Process] = None
+        """The process, to poll it where pidfds are not supported."""
+
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is not None:
+            try:
+                self._pidfd = pidfd_open(pid)
+                self._wakeup = os.pipe()
+                return
+            except ProcessLookupError:
+                self.exited = True
+                return
+            except OSError:
+                # The kernel is too old, or pidfds are not allowed.
+                self._pidfd = None
+        try:
+            self._process = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            self.exited = True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the process to exit.
+
+        :param timeout: The maximum time to wait, in seconds; waits until the process exits by default
+        :return: True if the process exited or the watcher was woken, False if the wait timed out
+        """
+        if self.exited or self._woken.is_set():
+            return True
+        if self._pidfd is not None and self._wakeup is not None:
+            readable, _, _ = select.select(
+                [self._pidfd, self._wakeup[0]], [], [], timeout
+            )
+            if self._pidfd in readable:
+                self.exited = True
+            return len(readable) > 0
+        return self._poll(timeout)
+
+    def wake(self) -> None:
+        """Wake the waits in progress and all later ones, so they return at once."""
+        self._woken.set()
+        if self._wakeup is not None:
+            os.write(self._wakeup[1], b"\0")
+
+    def close(self) -> None:
+        """Release the file descriptors used to wait."""
+        for fd in [self._pidfd, *(self._wakeup or ())]:
+            if fd is not None:
+                os.close(fd)
+        self._pidfd = None
+        self._wakeup = None
+
+    def __enter__(self) -> ProcessExitWatcher:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _poll(self, timeout: Optional[float]) -> bool:
+        """Waits for the process to exit, checking on it every POLL_INTERVAL seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if not self._is_running():
+                self.exited = True
+                return True
+            remaining = (
+                POLL_INTERVAL
+                if deadline is None
+                else min(POLL_INTERVAL, deadline - time.monotonic())
+            )
+            if remaining <= 0:
+                return False
+            if self._woken.wait(remaining):
+                return True
+
+    def _is_running(self) -> bool:
+        """Checks if the process is still running; zombies, which await their parent, are not."""
+        if self._process is None:
+            return False
+        try:
+            return bool(
+                self._process.is_running()
+                and self._process.status() != psutil.STATUS_ZOMBIE
+            )
+        except psutil.NoSuchProcess:
+            return False
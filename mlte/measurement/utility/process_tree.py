@@ -0,0 +1,184 @@
+"""
+mlte/measurement/utility/process_tree.py
+
+Utilities to follow a process and the processes it starts, for measurements of local processes.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+from mlte.value.types.time_series import TimeSeries
+
+
+class ProcessTree:
+    """
+    A process, and optionally all of its descendants. Descendants are discovered again
+    on each refresh, so workers and subprocesses started during a measurement are included.
+    """
+
+    def __init__(self, pid: int, include_children: bool = False) -> None:
+        """
+        Start following a process.
+
+        :param pid: The identifier of the root process
+        :param include_children: Whether to follow the descendants of the process as well
+        """
+        self.pid = pid
+        """The pid of the root process."""
+
+        self.include_children = include_children
+        """Whether the descendants of the root process are followed."""
+
+        self.root: Optional[psutil.Process] = None
+        """The root process, or None if it exited."""
+
+        self.processes: Dict[int, psutil.Process] = {}
+        """The processes found in the last refresh, by pid."""
+
+        self.names: Dict[int, str] = {}
+        """The names of all processes found so far, by pid."""
+
+        try:
+            self.root = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            self.root = None
+
+    def refresh(self) -> List[psutil.Process]:
+        """
+        Find the processes currently in the tree.
+
+        :return: The running processes, root first; empty once the root process exited
+        """
+        if self.root is None or not _is_running(self.root):
+            self.root = None
+            self.processes = {}
+            return []
+
+        found = [self.root]
+        if self.include_children:
+            try:
+                found += self.root.children(recursive=True)
+            except psutil.NoSuchProcess:
+                # The root exited while its children were listed.
+                pass
+
+        processes: Dict[int, psutil.Process] = {}
+        for process in found:
+            if not _is_running(process):
+                continue
+            # Keep the objects of known processes, so they remember their state; they compare
+            # equal only if they are the same process, not another one that reused the pid.
+            known = self.processes.get(process.pid)
+            if known is not None and known == process:
+                process = known
+            processes[process.pid] = process
+            if process.pid not in self.names:
+                self.names[process.pid] = _get_name(process)
+        self.processes = processes
+        return list(processes.values())
+
+
+class CPUSampler:
+    """
+    Samples the CPU utilization of a process, or of a process tree, over each interval between samples,
+    from the CPU time each process accumulated. psutil reads these times from /proc/<pid>/stat on Linux,
+    without spawning processes. The time used by a descendant after the last sample it was seen in is missed.
+    """
+
+    def __init__(self, pid: int, include_children: bool = False) -> None:
+        """
+        Start sampling a process.
+
+        :param pid: The identifier of the process
+        :param include_children: Whether to sample the descendants of the process as well
+        """
+        self.tree = ProcessTree(pid, include_children)
+        """The processes being sampled."""
+
+        self.cpu_times: Dict[int, float] = {}
+        """The CPU time used by each process at the last sample, in seconds."""
+
+        self.wall_time = time.monotonic()
+        """The time of the last sample."""
+
+        self.cpu_times = self._read_cpu_times(self.tree.refresh())
+
+    def sample(self) -> Optional[Dict[int, float]]:
+        """
+        Take a sample.
+
+        :return: The CPU utilization of each process since the previous sample, as a proportion of one CPU,
+        by pid; or None if the process exited, or its CPU time can't be read
+        """
+        processes = self.tree.refresh()
+        cpu_times = self._read_cpu_times(processes)
+        if self.tree.pid not in cpu_times:
+            return None
+
+        wall_time = time.monotonic()
+        elapsed = max(wall_time - self.wall_time, 1e-9)
+        # Processes found for the first time started after the previous sample, with no CPU time then.
+        utils = {
+            pid: (cpu_time - self.cpu_times.get(pid, 0.0)) / elapsed
+            for pid, cpu_time in cpu_times.items()
+        }
+        self.cpu_times, self.wall_time = cpu_times, wall_time
+        return utils
+
+    @staticmethod
+    def _read_cpu_times(processes: List[psutil.Process]) -> Dict[int, float]:
+        """Returns the CPU time used so far by each of the processes that can be read, in seconds."""
+        cpu_times = {}
+        for process in processes:
+            try:
+                times = process.cpu_times()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            cpu_times[process.pid] = float(times.user + times.system)
+        return cpu_times
+
+
+def summarize_children(
+    samples: Dict[int, TimeSeries], tree: ProcessTree
+) -> List[Dict[str, Any]]:
+    """
+    Summarize the samples taken for each descendant of a process tree.
+
+    :param samples: The samples taken while each process was running, by pid; the root process is skipped
+    :param tree: The tree the samples were taken from
+
+    :return: The pid, name, and average, minimum and maximum of the samples of each descendant
+    """
+    return [
+        {
+            "pid": pid,
+            "name": tree.names.get(pid, ""),
+            "avg": series.mean,
+            "min": series.min,
+            "max": series.max,
+        }
+        for pid, series in sorted(samples.items())
+        if pid != tree.pid and series.count > 0
+    ]
+
+
+def _is_running(process: psutil.Process) -> bool:
+    """Checks if a process is still running; zombies, which await their parent, are not."""
+    try:
+        return bool(
+            process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+        )
+    except psutil.NoSuchProcess:
+        return False
+
+
+def _get_name(process: psutil.Process) -> str:
+    """Returns the name of a process, or an empty string if it can't be read."""
+    try:
+        return str(process.name())
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return ""
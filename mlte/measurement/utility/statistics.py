@@ -0,0 +1,30 @@
+"""
+mlte/measurement/utility/statistics.py
+
+Utilities to summarize the samples taken by measurements.
+"""
+
+from typing import Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Compute a percentile of some values, interpolating linearly between the closest ones.
+
+    :param values: The values, in any order; there must be at least one
+    :param q: The percentile, between 0 and 100
+
+    :return: The value below which `q` percent of the values fall
+    """
+    if len(values) == 0:
+        raise ValueError("Can't compute a percentile of no values.")
+    if not 0 <= q <= 100:
+        raise ValueError(f"Percentile must be between 0 and 100, got {q}.")
+
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (
+        position - lower
+    )
@@ -0,0 +1,218 @@
+"""
+mlte/store/artifact/blob.py
+
+Content-addressed storage of large value payloads, outside of the artifact bodies.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import re
+import typing
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+)
+
+from mlte._private.fixed_json import json
+from mlte.artifact.model import ArtifactModel
+from mlte.value.model import (
+    ArrayValueModel,
+    ImageValueModel,
+    OpaqueValueModel,
+    ValueModel,
+    ValueType,
+)
+
+# Only needed for type checking, as the store itself uses these helpers.
+if TYPE_CHECKING:
+    from mlte.store.artifact.store import ArtifactStoreSession
+
+BLOB_THRESHOLD = 64 * 1024
+"""Payloads of at least this many bytes are written to the blob area instead of inline."""
+
+BLOB_CHUNK_SIZE = 64 * 1024
+"""Size of the chunks blobs are read in when they are streamed."""
+
+_DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+"""Format of a valid digest: a hex SHA-256."""
+
+BlobValueModel = typing.Union[
+    ImageValueModel, ArrayValueModel, OpaqueValueModel
+]
+"""Value types with payloads that can be stored as blobs."""
+
+BLOB_VALUE_TYPES = [ValueType.IMAGE, ValueType.ARRAY, ValueType.OPAQUE]
+"""The value types of BlobValueModel."""
+
+
+def get_digest(data: bytes) -> str:
+    """
+    Computes the content address of a blob.
+    :param data: The blob data
+    :return: The digest identifying it
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def is_digest(digest: str) -> bool:
+    """Checks that a string is a well-formed digest, so it is safe to use it as a path or key."""
+    return _DIGEST_PATTERN.match(digest) is not None
+
+
+class ChunkDigest:
+    """Computes the digest of a blob while its chunks are passed through, as it is being written."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = chunks
+        """The chunks of blob data."""
+
+        self._hash = hashlib.sha256()
+        """The hash of the chunks seen so far; same as get_digest() once all are seen."""
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            self._hash.update(chunk)
+            yield chunk
+
+    @property
+    def digest(self) -> str:
+        """The digest identifying the blob, valid once all chunks were iterated."""
+        return self._hash.hexdigest()
+
+
+# -----------------------------------------------------------------------------
+# Payload encoding
+# -----------------------------------------------------------------------------
+
+
+def encode_payload(value: BlobValueModel) -> Optional[bytes]:
+    """
+    Gets the bytes to store as a blob for a value's payload.
+    :param value: The value with the payload
+    :return: The encoded payload, or None if it can't be stored as a blob without changing it
+    """
+    if isinstance(value, ImageValueModel):
+        image = base64.decodebytes(value.data.encode("utf-8"))
+        if base64.encodebytes(image).decode("utf-8") != value.data:
+            # Not written by Image.to_model(); keep it as is so reads return the same string.
+            return None
+        return image
+    return json.dumps(value.data, separators=(",", ":")).encode("utf-8")
+
+
+def decode_payload(value_type: ValueType, data: bytes) -> Any:
+    """
+    Converts a blob back to the payload of a value of the given type.
+    :param value_type: The type of value the blob belongs to
+    :param data: The blob data
+    :return: The payload, as it is kept in the value model
+    """
+    if value_type == ValueType.IMAGE:
+        return base64.encodebytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def get_blob_references(artifacts: Iterable[ArtifactModel]) -> Set[str]:
+    """
+    Gets the blobs artifacts, as they were stored, refer to for their value payloads.
+    :param artifacts: The artifacts, without resolving their blobs
+    :return: The digests of the blobs
+    """
+    digests = set()
+    for artifact in artifacts:
+        value = _get_blob_value(artifact)
+        if value is not None and value.blob is not None:
+            digests.add(value.blob)
+    return digests
+
+
+def _get_blob_value(artifact: ArtifactModel) -> Optional[BlobValueModel]:
+    """Returns the value model of an artifact if it is of a type with a blob-able payload."""
+    if not isinstance(artifact.body, ValueModel):
+        return None
+    if not isinstance(
+        artifact.body.value,
+        (ImageValueModel, ArrayValueModel, OpaqueValueModel),
+    ):
+        return None
+    return artifact.body.value
+
+
+# -----------------------------------------------------------------------------
+# Artifact conversion
+# -----------------------------------------------------------------------------
+
+
+def offload_blobs(
+    session: ArtifactStoreSession,
+    model_id: str,
+    artifact: ArtifactModel,
+    before_write: Optional[Callable[[], None]] = None,
+) -> ArtifactModel:
+    """
+    Moves a large value payload to the blob area of a model, leaving only its digest in the artifact.
+    :param session: The session for the store to write the blob to
+    :param model_id: The model the artifact belongs to
+    :param artifact: The artifact to write
+    :param before_write: Called before a blob is written, such as to create the model it is written to
+    :return: The artifact as it should be stored; the original one if nothing was moved
+    """
+    value = _get_blob_value(artifact)
+    if value is None or value.blob is not None:
+        return artifact
+
+    payload = encode_payload(value)
+    if payload is None or len(payload) < BLOB_THRESHOLD:
+        return artifact
+
+    if before_write is not None:
+        before_write()
+    digest = session.write_blob(model_id, payload)
+    return _replace_value(
+        artifact,
+        value.model_copy(update={"data": type(value.data)(), "blob": digest}),
+    )
+
+
+def inline_blobs(
+    session: ArtifactStoreSession, model_id: str, artifact: ArtifactModel
+) -> ArtifactModel:
+    """
+    Reads back the payload of a value from the blob area of a model, if it was stored there.
+    :param session: The session for the store to read the blob from
+    :param model_id: The model the artifact belongs to
+    :param artifact: The artifact as it was stored
+    :return: The artifact with its whole payload; the same one if it was not stored as a blob
+    """
+    value = _get_blob_value(artifact)
+    if value is None or value.blob is None:
+        return artifact
+
+    return _replace_value(
+        artifact,
+        value.model_copy(
+            update={
+                "data": decode_payload(
+                    value.value_type, session.read_blob(model_id, value.blob)
+                ),
+                "blob": None,
+            }
+        ),
+    )
+
+
+def _replace_value(
+    artifact: ArtifactModel, value: BlobValueModel
+) -> ArtifactModel:
+    """Returns a copy of a value artifact with a different value, leaving the original untouched."""
+    body = typing.cast(ValueModel, artifact.body)
+    return artifact.model_copy(
+        update={"body": body.model_copy(update={"value": value})}
+    )
@@ -0,0 +1,56 @@
+"""
+mlte/store/artifact/cursor.py
+
+Opaque cursors used to page through artifact listings.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from typing import Any, Dict
+
+import mlte.store.error as errors
+from mlte._private.fixed_json import json
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """
+    Encode a store-specific position into an opaque cursor string.
+    :param position: The values that identify where the next page starts
+    :return: The URL-safe cursor
+    """
+    data = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii")
+
+
+def decode_cursor(cursor: str, *keys: str) -> Dict[str, Any]:
+    """
+    Decode a cursor string back into the position it represents.
+    :param cursor: The cursor, as returned by encode_cursor
+    :param keys: The keys the position must contain
+    :raises InvalidCursorError: If the cursor is malformed or lacks a required key
+    :return: The decoded position
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise errors.InvalidCursorError(f"Malformed cursor: {cursor}")
+
+    if not isinstance(position, dict) or any(
+        key not in position for key in keys
+    ):
+        raise errors.InvalidCursorError(
+            f"Cursor does not belong to this store: {cursor}"
+        )
+    return position
+
+
+def check_page_limit(limit: int) -> None:
+    """
+    Check that a page can hold artifacts, so the cursor to the next one advances.
+    :param limit: The maximum number of artifacts in the page
+    :raises ValueError: If the limit is less than one
+    """
+    if limit < 1:
+        raise ValueError(f"Page limit must be at least 1, got {limit}.")
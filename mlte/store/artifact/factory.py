@@ -12,10 +12,11 @@ from mlte.store.artifact.underlying.rdbs.store import RelationalDBArtifactStore
 from mlte.store.base import StoreType, StoreURI
 
 
-def create_artifact_store(uri: str) -> ArtifactStore:
+def create_artifact_store(uri: str, **kwargs) -> ArtifactStore:
     """
     Create a MLTE artifact store instance.
     :param uri: The URI for the store instance
+    :param kwargs: Options for the DB engine of relational DB stores, such as its connection pool
     :return: The store instance
     """
     parsed_uri = StoreURI.from_string(uri)
@@ -26,7 +27,7 @@ def create_artifact_store(uri: str) -> ArtifactStore:
     if parsed_uri.type == StoreType.REMOTE_HTTP:
         return HttpArtifactStore(uri=parsed_uri)
     if parsed_uri.type == StoreType.RELATIONAL_DB:
-        return RelationalDBArtifactStore(parsed_uri)
+        return RelationalDBArtifactStore(parsed_uri, **kwargs)
     else:
         raise Exception(
             f"Store can't be created, unknown URI prefix received for uri {parsed_uri}"
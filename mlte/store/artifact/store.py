@@ -7,10 +7,26 @@ MLTE artifact store interface implementation.
 from __future__ import annotations
 
 import time
-from typing import List, Optional, cast
-
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
+
+import mlte.store.artifact.util as storeutil
 from mlte.artifact.model import ArtifactModel
 from mlte.context.model import Model, Version
+from mlte.store.artifact.blob import BLOB_CHUNK_SIZE, offload_blobs
+from mlte.store.artifact.cursor import (
+    check_page_limit,
+    decode_cursor,
+    encode_cursor,
+)
 from mlte.store.base import ManagedSession, Store, StoreSession
 from mlte.store.query import Query
 
@@ -154,14 +170,75 @@ class ArtifactStoreSession(StoreSession):
         """
         artifact.header.timestamp = int(time.time())
         artifact.header.creator = user
+        create_parents = self._parents_creator(model_id, version_id, parents)
         return self.write_artifact(
             model_id,
             version_id,
-            artifact,
+            offload_blobs(self, model_id, artifact, create_parents),
             force=force,
             parents=parents,
         )
 
+    def write_artifacts_with_header(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+        user: Optional[str] = None,
+    ) -> List[ArtifactModel]:
+        """
+        Write several artifacts, generating their timestamps and adding creator. Internally calls the actual
+        write_artifacts implementation.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifacts: The artifacts
+        :param force: Overwrite artifacts if they already exist
+        :param parents: Indicates whether organizational elements
+        for artifacts should be implictly created (default: False)
+        """
+        timestamp = int(time.time())
+        for artifact in artifacts:
+            artifact.header.timestamp = timestamp
+            artifact.header.creator = user
+        create_parents = self._parents_creator(model_id, version_id, parents)
+        return self.write_artifacts(
+            model_id,
+            version_id,
+            [
+                offload_blobs(self, model_id, artifact, create_parents)
+                for artifact in artifacts
+            ],
+            force=force,
+            parents=parents,
+        )
+
+    def _parents_creator(
+        self, model_id: str, version_id: str, parents: bool
+    ) -> Optional[Callable[[], None]]:
+        """
+        Gets a function that creates the parents of artifacts before their blobs are written, as blobs
+        need the model to exist. Otherwise parents are created by the artifact write itself.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param parents: Whether organizational elements for artifacts should be implictly created
+        :return: A function that creates the parents the first time it is called, or None if they are not created
+        """
+        if not parents:
+            return None
+
+        created = False
+
+        def create_parents() -> None:
+            nonlocal created
+            if not created:
+                storeutil.create_parents(self, model_id, version_id)
+                created = True
+
+        return create_parents
+
     def write_artifact(
         self,
         model_id: str,
@@ -184,23 +261,81 @@ class ArtifactStoreSession(StoreSession):
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        """
+        Write several artifacts at once. By default they are written one at a time, stopping
+        at the first error; stores that can write all or none of them in a single transaction
+        or request override this.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifacts: The artifacts
+        :param force: Overwrite artifacts if they already exist
+        :param parents: Indicates whether organizational elements
+        for artifacts should be implictly created (default: False)
+        :raises ErrorAlreadyExists: If an artifact exists, or is repeated, and force is not set
+        :return: The written artifacts
+        """
+        return [
+            self.write_artifact(
+                model_id, version_id, artifact, force=force, parents=parents
+            )
+            for artifact in artifacts
+        ]
+
     def read_artifact(
         self,
         model_id: str,
         version_id: str,
         artifact_id: str,
+        *,
+        resolve_blobs: bool = True,
     ) -> ArtifactModel:
         """
         Read an artifact.
         :param model_id: The identifier for the model
         :param version_id: The identifier for the model version
         :param artifact_id: The artifact identifier
+        :param resolve_blobs: Whether to read a value payload stored as a blob; if False, it
+        is left as a digest reference, to be read later with read_blob()
         :return: The artifact
         """
         raise NotImplementedError(
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    def read_artifacts_by_ids(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+        *,
+        resolve_blobs: bool = True,
+    ) -> List[ArtifactModel]:
+        """
+        Read several artifacts at once. By default they are read one at a time;
+        stores that can read them in a single query or request override this.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifact_ids: The artifact identifiers
+        :param resolve_blobs: Whether to read value payloads stored as blobs
+        :raises ErrorNotFound: If any of the artifacts does not exist
+        :return: The artifacts, in the same order as the identifiers
+        """
+        return [
+            self.read_artifact(
+                model_id, version_id, artifact_id, resolve_blobs=resolve_blobs
+            )
+            for artifact_id in artifact_ids
+        ]
+
     def read_artifacts(
         self,
         model_id: str,
@@ -209,7 +344,7 @@ class ArtifactStoreSession(StoreSession):
         offset: int = 0,
     ) -> List[ArtifactModel]:
         """
-        Read artifacts withi limit and offset.
+        Read artifacts within limit and offset.
         :param model_id: The identifier for the model
         :param version_id: The identifier for the model version
         :param limit: The limit on artifacts to read
@@ -220,6 +355,33 @@ class ArtifactStoreSession(StoreSession):
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    def read_artifacts_page(
+        self,
+        model_id: str,
+        version_id: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ArtifactModel], Optional[str]]:
+        """
+        Read a page of artifacts, starting where a previous page ended.
+        Stores that can seek directly to a position override this; by default the cursor wraps an offset.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param limit: The maximum number of artifacts in the page
+        :param cursor: The cursor returned with the previous page, or None for the first page
+        :return: The read artifacts, and the cursor for the next page, or None if this was the last one
+        """
+        check_page_limit(limit)
+        offset = (
+            0 if cursor is None else decode_cursor(cursor, "offset")["offset"]
+        )
+
+        # Read one extra artifact to know if there is a next page.
+        artifacts = self.read_artifacts(model_id, version_id, limit + 1, offset)
+        if len(artifacts) <= limit:
+            return artifacts, None
+        return artifacts[:limit], encode_cursor({"offset": offset + limit})
+
     def search_artifacts(
         self,
         model_id: str,
@@ -237,6 +399,33 @@ class ArtifactStoreSession(StoreSession):
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    def iter_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        page_size: int = 100,
+    ) -> Iterator[ArtifactModel]:
+        """
+        Iterate over the artifacts in a version, optionally filtered, without reading all of them at once.
+        By default artifacts are read one page at a time; stores that can do better override this.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param query: The artifact query to apply
+        :param page_size: The number of artifacts to read at a time
+        :return: An iterator over the artifacts that satisfy the filter
+        """
+        cursor: Optional[str] = None
+        while True:
+            artifacts, cursor = self.read_artifacts_page(
+                model_id, version_id, page_size, cursor
+            )
+            for artifact in artifacts:
+                if query.filter.match(artifact):
+                    yield artifact
+            if cursor is None:
+                return
+
     def delete_artifact(
         self,
         model_id: str,
@@ -254,6 +443,107 @@ class ArtifactStoreSession(StoreSession):
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    # -------------------------------------------------------------------------
+    # Interface: Blobs
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, model_id: str, data: bytes) -> str:
+        """
+        Write a large value payload to the blob area of a model. Blobs are content-addressed,
+        so writing the same data again does not store it twice.
+        :param model_id: The identifier for the model
+        :param data: The blob data
+        :return: The digest that identifies the blob
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def read_blob(self, model_id: str, digest: str) -> bytes:
+        """
+        Read a blob from the blob area of a model.
+        :param model_id: The identifier for the model
+        :param digest: The digest that identifies the blob
+        :return: The blob data
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def list_blobs(self, model_id: str) -> List[str]:
+        """
+        List the blobs in the blob area of a model.
+        :param model_id: The identifier for the model
+        :return: The digests of the blobs
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def delete_blob(self, model_id: str, digest: str) -> None:
+        """
+        Delete a blob from the blob area of a model.
+        :param model_id: The identifier for the model
+        :param digest: The digest that identifies the blob
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def list_blob_references(self, model_id: str) -> Set[str]:
+        """
+        List the blobs referenced by the artifacts of a model, in any of its versions.
+        :param model_id: The identifier for the model
+        :return: The digests of the referenced blobs
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def sweep_blobs(self, model_id: str, remove: bool = False) -> List[str]:
+        """
+        Find the blobs of a model that no artifact references anymore, as their artifacts were
+        deleted or overwritten. Blobs are shared by all artifacts with the same payload, so they
+        are not removed with each artifact. Removing them while artifacts are being written to
+        the model may remove a blob written just before the artifact that refers to it.
+        :param model_id: The identifier for the model
+        :param remove: Whether to remove the unreferenced blobs
+        :return: The digests of the unreferenced blobs, before removing them
+        """
+        referenced = self.list_blob_references(model_id)
+        unreferenced = sorted(
+            digest
+            for digest in self.list_blobs(model_id)
+            if digest not in referenced
+        )
+        if remove:
+            for digest in unreferenced:
+                self.delete_blob(model_id, digest)
+        return unreferenced
+
+    def write_blob_stream(self, model_id: str, chunks: Iterable[bytes]) -> str:
+        """
+        Write a blob received in chunks, such as the body of a request.
+        By default the chunks are joined; stores that can write incrementally override this.
+        :param model_id: The identifier for the model
+        :param chunks: The blob data, in chunks
+        :return: The digest that identifies the blob
+        """
+        return self.write_blob(model_id, b"".join(chunks))
+
+    def iter_blob(
+        self, model_id: str, digest: str, chunk_size: int = BLOB_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Read a blob in chunks, so it can be passed on without holding all of it.
+        By default the blob is read whole; stores that can read incrementally override this.
+        :param model_id: The identifier for the model
+        :param digest: The digest that identifies the blob
+        :param chunk_size: The maximum size of each chunk
+        :return: An iterator over the blob data
+        """
+        yield self.read_blob(model_id, digest)
+
 
 class ManagedArtifactSession(ManagedSession):
     """A simple context manager for store sessions."""
@@ -6,16 +6,23 @@ Implementation of local file system artifact store.
 
 from __future__ import annotations
 
+import os
+import uuid
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Set
 
+import mlte.store.artifact.blob as blob
 import mlte.store.artifact.util as storeutil
 import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
 from mlte.context.model import Model, Version
 from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
+from mlte.store.artifact.underlying.fs_index import (
+    ArtifactIndex,
+    is_header_filter,
+)
 from mlte.store.base import StoreURI
-from mlte.store.common.fs_storage import FileSystemStorage
+from mlte.store.common.fs_storage import FileSystemStorage, FsyncPolicy
 from mlte.store.query import Query
 
 # -----------------------------------------------------------------------------
@@ -29,6 +36,9 @@ class LocalFileSystemStore(ArtifactStore):
     BASE_MODELS_FOLDER = "models"
     """Base folder to store models in."""
 
+    BASE_BLOBS_FOLDER = "blobs"
+    """Base folder to store the blobs of each model in, outside of the model folders."""
+
     def __init__(self, uri: StoreURI) -> None:
         super().__init__(uri=uri)
 
@@ -90,6 +100,8 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         self._ensure_model_exists(model_id)
         model = self._read_model(model_id)
         self.storage.delete_folder(Path(self.storage.base_path, model_id))
+        if self._blobs_path(model_id).exists():
+            self.storage.delete_folder(self._blobs_path(model_id))
         return model
 
     def create_version(self, model_id: str, version: Version) -> Version:
@@ -123,9 +135,11 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         self._ensure_version_exists(model_id, version_id)
 
         version = self._read_version(model_id, version_id)
+        index = self._index(model_id, version_id)
         self.storage.delete_folder(
             Path(self.storage.base_path, model_id, version_id)
         )
+        index.delete()
         return version
 
     # -------------------------------------------------------------------------
@@ -186,35 +200,91 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         if parents:
             storeutil.create_parents(self, model_id, version_id)
 
-        artifacts = self._get_version_artifacts(model_id, version_id)
-        if artifact.header.identifier in artifacts and not force:
-            raise errors.ErrorAlreadyExists(
-                f"Artifact '{artifact.header.identifier}'"
-            )
-
-        self.storage.write_json_to_file(
-            self._artifact_path(
-                model_id, version_id, artifact.header.identifier
-            ),
-            artifact.to_json(),
+        index = self._index(model_id, version_id)
+        path = self._artifact_path(
+            model_id, version_id, artifact.header.identifier
         )
+        with index.lock():
+            if path.exists() and not force:
+                raise errors.ErrorAlreadyExists(
+                    f"Artifact '{artifact.header.identifier}'"
+                )
+
+            self.storage.write_json_to_file(
+                path, artifact.to_json(), self.storage.fsync, self.storage.codec
+            )
+            index.put(artifact)
         return artifact
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        if parents:
+            storeutil.create_parents(self, model_id, version_id)
+
+        index = self._index(model_id, version_id)
+        with index.lock():
+            if not force:
+                storeutil.check_new_artifacts(
+                    [artifact.header.identifier for artifact in artifacts],
+                    {entry.identifier for entry in index.entries()},
+                )
+
+            for artifact in artifacts:
+                self.storage.write_json_to_file(
+                    self._artifact_path(
+                        model_id, version_id, artifact.header.identifier
+                    ),
+                    artifact.to_json(),
+                    self.storage.fsync,
+                    self.storage.codec,
+                )
+            # The index is written once for the whole batch.
+            index.put(*artifacts)
+        return artifacts
+
     def read_artifact(
         self,
         model_id: str,
         version_id: str,
         artifact_id: str,
+        *,
+        resolve_blobs: bool = True,
     ) -> ArtifactModel:
-        artifacts = self._get_version_artifacts(model_id, version_id)
+        self._ensure_model_exists(model_id)
+        self._ensure_version_exists(model_id, version_id)
 
-        self._ensure_artifact_exists(artifact_id, artifacts)
-        return ArtifactModel(
-            **self.storage.read_json_file(
-                self._artifact_path(model_id, version_id, artifact_id)
-            )
+        self._ensure_artifact_exists(model_id, version_id, artifact_id)
+        return self._read_artifact(
+            model_id, version_id, artifact_id, resolve_blobs
         )
 
+    def read_artifacts_by_ids(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+        *,
+        resolve_blobs: bool = True,
+    ) -> List[ArtifactModel]:
+        self._ensure_model_exists(model_id)
+        self._ensure_version_exists(model_id, version_id)
+
+        for artifact_id in artifact_ids:
+            self._ensure_artifact_exists(model_id, version_id, artifact_id)
+        return [
+            self._read_artifact(
+                model_id, version_id, artifact_id, resolve_blobs
+            )
+            for artifact_id in artifact_ids
+        ]
+
     def read_artifacts(
         self,
         model_id: str,
@@ -222,15 +292,12 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         limit: int = 100,
         offset: int = 0,
     ) -> List[ArtifactModel]:
-        artifacts = self._get_version_artifacts(model_id, version_id)
+        # Only the files in the requested page are parsed.
+        entries = self._index(model_id, version_id).entries()
         return [
-            ArtifactModel(
-                **self.storage.read_json_file(
-                    self._artifact_path(model_id, version_id, artifact_id)
-                )
-            )
-            for artifact_id in artifacts
-        ][offset : offset + limit]
+            self._read_artifact(model_id, version_id, entry.identifier)
+            for entry in entries[offset : offset + limit]
+        ]
 
     def search_artifacts(
         self,
@@ -238,55 +305,228 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         version_id: str,
         query: Query = Query(),
     ) -> List[ArtifactModel]:
-        artifacts = self.read_artifacts(model_id, version_id)
+        index = self._index(model_id, version_id)
+        if not is_header_filter(query.filter):
+            # Filters on tags or properties need the full artifact bodies.
+            return [
+                artifact
+                for artifact in (
+                    self._read_artifact(model_id, version_id, entry.identifier)
+                    for entry in index.entries()
+                )
+                if query.filter.match(artifact)
+            ]
+
         return [
-            artifact for artifact in artifacts if query.filter.match(artifact)
+            self._read_artifact(model_id, version_id, entry.identifier)
+            for entry in index.entries()
+            if query.filter.match(entry)
         ]
 
+    def iter_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        page_size: int = 100,
+    ) -> Iterator[ArtifactModel]:
+        # Files are parsed one at a time as they are consumed, so there are no pages to read.
+        entries = self._index(model_id, version_id).entries()
+        if not is_header_filter(query.filter):
+            # Filters on tags or properties need the full artifact bodies.
+            for entry in entries:
+                artifact = self._read_artifact(
+                    model_id, version_id, entry.identifier
+                )
+                if query.filter.match(artifact):
+                    yield artifact
+            return
+
+        for entry in entries:
+            if query.filter.match(entry):
+                yield self._read_artifact(
+                    model_id, version_id, entry.identifier
+                )
+
     def delete_artifact(
         self,
         model_id: str,
         version_id: str,
         artifact_id: str,
     ) -> ArtifactModel:
-        artifact = self.read_artifact(model_id, version_id, artifact_id)
-        self.storage.delete_file(
-            self._artifact_path(
-                model_id, version_id, artifact.header.identifier
+        index = self._index(model_id, version_id)
+        with index.lock():
+            artifact = self.read_artifact(model_id, version_id, artifact_id)
+            self.storage.delete_file(
+                self._artifact_path(
+                    model_id, version_id, artifact.header.identifier
+                ),
+                self.storage.fsync,
             )
-        )
+            index.remove(artifact.header.identifier)
         return artifact
 
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, model_id: str, data: bytes) -> str:
+        self._ensure_model_exists(model_id)
+
+        digest = blob.get_digest(data)
+        path = Path(self._blobs_path(model_id), digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.storage.write_bytes_to_file(path, data, self.storage.fsync)
+        return digest
+
+    def read_blob(self, model_id: str, digest: str) -> bytes:
+        return self._blob_path(model_id, digest).read_bytes()
+
+    def write_blob_stream(self, model_id: str, chunks: Iterable[bytes]) -> str:
+        self._ensure_model_exists(model_id)
+
+        # The digest is only known once all data is written, so stage it under a unique name.
+        folder = self._blobs_path(model_id)
+        folder.mkdir(parents=True, exist_ok=True)
+        staged = Path(folder, f".{uuid.uuid4().hex}.upload")
+        hashed = blob.ChunkDigest(chunks)
+        self.storage.write_chunks_to_file(staged, hashed, self.storage.fsync)
+
+        path = Path(folder, hashed.digest)
+        if path.exists():
+            staged.unlink()
+        else:
+            os.replace(staged, path)
+            if self.storage.fsync == FsyncPolicy.DIR:
+                self.storage.sync_folder(folder)
+        return hashed.digest
+
+    def iter_blob(
+        self,
+        model_id: str,
+        digest: str,
+        chunk_size: int = blob.BLOB_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        with self._blob_path(model_id, digest).open("rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def list_blobs(self, model_id: str) -> List[str]:
+        self._ensure_model_exists(model_id)
+
+        folder = self._blobs_path(model_id)
+        if not folder.exists():
+            return []
+        # Uploads being staged are not blobs yet.
+        return [
+            path.name for path in folder.iterdir() if blob.is_digest(path.name)
+        ]
+
+    def delete_blob(self, model_id: str, digest: str) -> None:
+        self._blob_path(model_id, digest).unlink()
+
+    def list_blob_references(self, model_id: str) -> Set[str]:
+        return blob.get_blob_references(
+            self._read_artifact(
+                model_id, version_id, entry.identifier, resolve_blobs=False
+            )
+            for version_id in self.list_versions(model_id)
+            for entry in self._index(model_id, version_id).entries()
+        )
+
+    # -------------------------------------------------------------------------
+    # Index maintenance
+    # -------------------------------------------------------------------------
+
+    def check_index(
+        self, model_id: str, version_id: str, rebuild: bool = False
+    ) -> List[str]:
+        """
+        Checks that the artifact index for a version is consistent with the artifact files.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the version
+        :param rebuild: Whether to rebuild the index if inconsistencies are found
+        :return: The inconsistencies found, before rebuilding; empty if there were none
+        """
+        index = self._index(model_id, version_id)
+        problems = index.check()
+        if problems and rebuild:
+            index.rebuild()
+        return problems
+
     # -------------------------------------------------------------------------
     # Internal helpers.
     # -------------------------------------------------------------------------
 
     def _ensure_artifact_exists(
-        self, artifact_id: str, artifacts: List[str]
+        self, model_id: str, version_id: str, artifact_id: str
     ) -> None:
         """Throws an ErrorNotFound if the given artifact does not exist."""
-        if artifact_id not in artifacts:
+        if not self._artifact_path(model_id, version_id, artifact_id).exists():
             raise errors.ErrorNotFound(f"Artifact {artifact_id}")
 
-    def _get_version_artifacts(
-        self, model_id: str, version_id: str
-    ) -> List[str]:
+    def _read_artifact(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_id: str,
+        resolve_blobs: bool = True,
+    ) -> ArtifactModel:
+        """Parses the file for an artifact, which is assumed to exist."""
+        artifact = ArtifactModel(
+            **self.storage.read_json_file(
+                self._artifact_path(model_id, version_id, artifact_id)
+            )
+        )
+        if not resolve_blobs:
+            return artifact
+        return blob.inline_blobs(self, model_id, artifact)
+
+    def _blob_path(self, model_id: str, digest: str) -> Path:
+        """
+        Get the path to an existing blob.
+        :param model_id: The model identifier
+        :param digest: The digest that identifies the blob
+        :raises ErrorNotFound: If the model or blob do not exist
+        :return: The path to the blob
         """
-        Get artifacts for a version from storage.
-         :param model_id: The identifier for the model
+        self._ensure_model_exists(model_id)
+
+        path = Path(self._blobs_path(model_id), digest)
+        if not blob.is_digest(digest) or not path.exists():
+            raise errors.ErrorNotFound(f"Blob {digest}")
+        return path
+
+    def _index(self, model_id: str, version_id: str) -> ArtifactIndex:
+        """
+        Get the header index for a version.
+        :param model_id: The identifier for the model
         :param version_id: The identifier for the version
         :raises ErrorNotFound: If the required structural elements are not present
-        :return: The associated artifacts
+        :return: The index for the version
         """
         self._ensure_model_exists(model_id)
         self._ensure_version_exists(model_id, version_id)
 
-        return [
-            a.stem
-            for a in self.storage.list_json_files(
-                self._base_artifact_path(model_id, version_id)
-            )
-        ]
+        return ArtifactIndex(
+            self._base_artifact_path(model_id, version_id),
+            self.storage.fsync,
+            self.storage.codec,
+        )
+
+    def _blobs_path(self, model_id: str) -> Path:
+        """
+        Format a local FS path to the blobs of a model.
+        :param model_id: The model identifier
+        :return: The formatted path
+        """
+        return Path(
+            self.storage.root, LocalFileSystemStore.BASE_BLOBS_FOLDER, model_id
+        )
 
     def _base_artifact_path(self, model_id: str, version_id: str) -> Path:
         """
@@ -0,0 +1,319 @@
+"""
+mlte/store/artifact/underlying/fs_index.py
+
+Sidecar index with artifact header data for the local file system artifact store.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pydantic
+from pydantic import ConfigDict
+
+from mlte.artifact.model import ArtifactModel
+from mlte.artifact.type import ArtifactType
+from mlte.model import BaseModel
+from mlte.store.common.fs_codec import DEFAULT_CODEC, Codec, get_codec
+from mlte.store.common.fs_storage import FsyncPolicy, JsonFileStorage
+from mlte.store.query import (
+    AllFilter,
+    AndFilter,
+    Filter,
+    Filterable,
+    IdentifierFilter,
+    NoneFilter,
+    OrFilter,
+    TypeFilter,
+)
+from mlte.value.model import ValueModel
+
+# -----------------------------------------------------------------------------
+# Index models
+# -----------------------------------------------------------------------------
+
+
+class ArtifactIndexEntry(Filterable):
+    """The header data for an artifact, as kept in the index."""
+
+    identifier: str
+    """The unique identifier for the artifact."""
+
+    type: ArtifactType
+    """The type identfier for the artifact."""
+
+    timestamp: Optional[int] = -1
+    """The timestamp of creation of this artifact, as Unix time."""
+
+    creator: Optional[str] = None
+    """The user that created this artifact."""
+
+    value_class: Optional[str] = None
+    """For values, the full path to the class that implements it."""
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    @staticmethod
+    def from_artifact(artifact: ArtifactModel) -> ArtifactIndexEntry:
+        """Extracts the index data from a full artifact."""
+        return ArtifactIndexEntry(
+            identifier=artifact.header.identifier,
+            type=artifact.header.type,
+            timestamp=artifact.header.timestamp,
+            creator=artifact.header.creator,
+            value_class=(
+                artifact.body.value_class
+                if isinstance(artifact.body, ValueModel)
+                else None
+            ),
+        )
+
+    def get_identifier(self) -> str:
+        return self.identifier
+
+    def get_type(self) -> Any:
+        return self.type
+
+
+class ArtifactIndexModel(BaseModel):
+    """The contents of an index file for a version."""
+
+    folder_mtime: int = 0
+    """Modification time of the version folder, in ns, when the index was last synced with it."""
+
+    artifacts: Dict[str, ArtifactIndexEntry] = {}
+    """The index entries, by artifact identifier."""
+
+
+# -----------------------------------------------------------------------------
+# ArtifactIndex
+# -----------------------------------------------------------------------------
+
+
+class ArtifactIndex:
+    """
+    An index with the headers of all artifacts in a version folder, stored next to it.
+
+    The index is kept up to date by the store on every write and delete. If artifact files
+    are added or removed by other means, the change in the folder's modification time is
+    detected on load and only the new files are parsed. A missing or corrupt index is
+    rebuilt from the artifact files.
+    """
+
+    def __init__(
+        self,
+        version_path: Path,
+        fsync: FsyncPolicy = FsyncPolicy.NONE,
+        codec: Codec = get_codec(DEFAULT_CODEC),
+    ) -> None:
+        self.version_path = version_path
+        """The folder with the artifacts of the version."""
+
+        self.fsync = fsync
+        """How index writes are flushed to disk."""
+
+        self.codec = codec
+        """How the index file is encoded."""
+
+        self._lock_depth = 0
+        """How many times the lock is currently held through this instance."""
+
+        self.index_path = Path(
+            version_path.parent, f".{version_path.name}.index"
+        )
+        """The index file, kept outside the version folder so writing it does not change the folder."""
+
+    def load(
+        self, known: Optional[Dict[str, ArtifactIndexEntry]] = None
+    ) -> ArtifactIndexModel:
+        """
+        Loads the index, bringing it in sync with the version folder if needed.
+        :param known: Entries for artifacts that were just written, so their files are not parsed
+        :return: The index contents
+        """
+        index = self._read()
+        if index is not None and index.folder_mtime == self._folder_mtime():
+            return index
+
+        with self.lock():
+            # Read again, as another writer may have synced it while we waited for the lock.
+            index, synced = self._load_locked(known or {})
+            if synced:
+                self._write(index)
+            return index
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Holds an exclusive lock on the index, to make changes to the version across workers.
+        It can be nested when taken through the same instance.
+        """
+        with ExitStack() as stack:
+            if self._lock_depth == 0:
+                stack.enter_context(JsonFileStorage.lock(self.index_path))
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+
+    def entries(self) -> List[ArtifactIndexEntry]:
+        """Returns the index entries, sorted by identifier as the artifact files are."""
+        index = self.load()
+        return [index.artifacts[id] for id in sorted(index.artifacts.keys())]
+
+    def put(self, *artifacts: ArtifactModel) -> None:
+        """Adds or replaces the entries for artifacts that were just written."""
+        entries = {
+            entry.identifier: entry
+            for entry in map(ArtifactIndexEntry.from_artifact, artifacts)
+        }
+        with self.lock():
+            # Writing the artifact changed the folder, so the index is synced and written only once.
+            index, _ = self._load_locked(entries)
+            index.artifacts.update(entries)
+            self._write(index)
+
+    def remove(self, artifact_id: str) -> None:
+        """Removes the entry for an artifact that was just deleted."""
+        with self.lock():
+            index, _ = self._load_locked({})
+            index.artifacts.pop(artifact_id, None)
+            self._write(index)
+
+    def rebuild(self) -> ArtifactIndexModel:
+        """
+        Discards the current index and builds it again from the artifact files.
+        :return: The rebuilt index contents
+        """
+        with self.lock():
+            index = self._refresh(ArtifactIndexModel(), {})
+            self._write(index)
+            return index
+
+    def delete(self) -> None:
+        """Removes the index file, if any, and its lock."""
+        with JsonFileStorage.lock(self.index_path, remove=True):
+            self.index_path.unlink(missing_ok=True)
+
+    def check(self) -> List[str]:
+        """
+        Compares the stored index against the headers in all artifact files.
+        :return: A description of each inconsistency found; empty if the index is consistent
+        """
+        index = self._read()
+        if index is None:
+            return [f"Index {self.index_path} is missing or corrupt."]
+
+        problems = []
+        artifact_ids = self._artifact_ids()
+        for artifact_id in sorted(set(index.artifacts) - set(artifact_ids)):
+            problems.append(
+                f"Artifact {artifact_id} is indexed but its file does not exist."
+            )
+        for artifact_id in artifact_ids:
+            if artifact_id not in index.artifacts:
+                problems.append(f"Artifact {artifact_id} is not indexed.")
+            elif index.artifacts[artifact_id] != self._read_entry(artifact_id):
+                problems.append(
+                    f"Index entry for artifact {artifact_id} does not match its file."
+                )
+        return problems
+
+    # -------------------------------------------------------------------------
+    # Internal helpers.
+    # -------------------------------------------------------------------------
+
+    def _load_locked(
+        self, known: Dict[str, ArtifactIndexEntry]
+    ) -> Tuple[ArtifactIndexModel, bool]:
+        """
+        Reads the index while holding the lock, syncing it with the version folder in memory.
+        :param known: Entries for artifacts that were just written, so their files are not parsed
+        :return: The index contents, and whether they were synced and must be written
+        """
+        index = self._read()
+        if index is not None and index.folder_mtime == self._folder_mtime():
+            return index, False
+
+        # Files were added or removed without going through the index.
+        return self._refresh(index or ArtifactIndexModel(), known), True
+
+    def _refresh(
+        self,
+        index: ArtifactIndexModel,
+        known: Dict[str, ArtifactIndexEntry],
+    ) -> ArtifactIndexModel:
+        """Drops entries for missing files and parses only files that are not indexed or known."""
+        entries = {**index.artifacts, **known}
+        return ArtifactIndexModel(
+            artifacts={
+                artifact_id: (
+                    entries[artifact_id]
+                    if artifact_id in entries
+                    else self._read_entry(artifact_id)
+                )
+                for artifact_id in self._artifact_ids()
+            },
+        )
+
+    def _read(self) -> Optional[ArtifactIndexModel]:
+        """Reads the index file, returning None if it does not exist or can't be parsed."""
+        if not self.index_path.exists():
+            return None
+        try:
+            return ArtifactIndexModel(
+                **JsonFileStorage.read_json_file(self.index_path)
+            )
+        except (
+            ValueError,
+            TypeError,
+            RuntimeError,
+            pydantic.ValidationError,
+        ) as e:
+            logging.warning(
+                f"Discarding corrupt artifact index {self.index_path}: {e}"
+            )
+            return None
+
+    def _write(self, index: ArtifactIndexModel) -> None:
+        """Writes the index file, replacing the previous one atomically."""
+        index.folder_mtime = self._folder_mtime()
+        JsonFileStorage.write_json_to_file(
+            self.index_path, index.to_json(), self.fsync, self.codec
+        )
+
+    def _read_entry(self, artifact_id: str) -> ArtifactIndexEntry:
+        """Parses an artifact file to get its index entry."""
+        return ArtifactIndexEntry.from_artifact(
+            ArtifactModel(
+                **JsonFileStorage.read_json_file(
+                    Path(
+                        self.version_path,
+                        JsonFileStorage.add_extension(artifact_id),
+                    )
+                )
+            )
+        )
+
+    def _artifact_ids(self) -> List[str]:
+        """Lists the identifiers of the artifact files in the version folder."""
+        return [
+            JsonFileStorage.get_just_filename(path)
+            for path in JsonFileStorage.list_json_files(self.version_path)
+        ]
+
+    def _folder_mtime(self) -> int:
+        return self.version_path.stat().st_mtime_ns
+
+
+def is_header_filter(filter: Filter) -> bool:
+    """Checks if a filter only looks at artifact headers, so it can be evaluated on index entries."""
+    if isinstance(filter, (AndFilter, OrFilter)):
+        return all(is_header_filter(f) for f in filter.filters)
+    return isinstance(
+        filter, (AllFilter, NoneFilter, IdentifierFilter, TypeFilter)
+    )
@@ -7,17 +7,24 @@ Implementation of HTTP artifact store.
 from __future__ import annotations
 
 import typing
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
+import mlte.store.artifact.blob as blob
+from mlte._private.fixed_json import json
 from mlte.artifact.model import ArtifactModel
-from mlte.backend.api.models.artifact_model import WriteArtifactRequest
+from mlte.backend.api.models.artifact_model import (
+    NDJSON_MEDIA_TYPE,
+    NEXT_CURSOR_HEADER,
+    WriteArtifactRequest,
+    WriteArtifactsRequest,
+)
 from mlte.backend.core.config import settings
 from mlte.context.model import Model, Version
 from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
 from mlte.store.base import StoreURI
 from mlte.store.common.http_clients import OAuthHttpClient
 from mlte.store.common.http_storage import HttpStorage
-from mlte.store.query import Query
+from mlte.store.query import AllFilter, Query
 
 API_PREFIX = settings.API_PREFIX
 """API URL prefix."""
@@ -81,15 +88,13 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
 
     def read_model(self, model_id: str) -> Model:
         url = f"{self.url}{API_PREFIX}/model/{model_id}"
-        res = self.client.get(url)
-        self.client.raise_for_response(res)
+        res = self.client.get_cached(url)
 
         return Model(**res.json())
 
     def list_models(self) -> List[str]:
         url = f"{self.url}{API_PREFIX}/model"
-        res = self.client.get(url)
-        self.client.raise_for_response(res)
+        res = self.client.get_cached(url)
 
         return typing.cast(List[str], res.json())
 
@@ -109,15 +114,13 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
 
     def read_version(self, model_id: str, version_id: str) -> Version:
         url = f"{self.url}{API_PREFIX}/model/{model_id}/version/{version_id}"
-        res = self.client.get(url)
-        self.client.raise_for_response(res)
+        res = self.client.get_cached(url)
 
         return Version(**res.json())
 
     def list_versions(self, model_id: str) -> List[str]:
         url = f"{self.url}{API_PREFIX}/model/{model_id}/version"
-        res = self.client.get(url)
-        self.client.raise_for_response(res)
+        res = self.client.get_cached(url)
 
         return typing.cast(List[str], res.json())
 
@@ -152,17 +155,68 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
 
         return ArtifactModel(**(res.json()["artifact"]))
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/batch"
+        res = self.client.post(
+            url,
+            json=WriteArtifactsRequest(
+                artifacts=artifacts, force=force, parents=parents
+            ).to_json(),
+        )
+        self.client.raise_for_response(res)
+
+        return [ArtifactModel(**object) for object in res.json()["artifacts"]]
+
     def read_artifact(
         self,
         model_id: str,
         version_id: str,
         artifact_id: str,
+        *,
+        resolve_blobs: bool = True,
     ) -> ArtifactModel:
+        # Blobs are fetched separately, so the server streams them as raw bytes.
         url = f"{_url(self.url, model_id, version_id)}/artifact/{artifact_id}"
-        res = self.client.get(url)
-        self.client.raise_for_response(res)
+        res = self.client.get_cached(url, params={"resolve_blobs": "false"})
 
-        return ArtifactModel(**res.json())
+        artifact = ArtifactModel(**res.json())
+        if not resolve_blobs:
+            return artifact
+        return blob.inline_blobs(self, model_id, artifact)
+
+    def read_artifacts_by_ids(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+        *,
+        resolve_blobs: bool = True,
+    ) -> List[ArtifactModel]:
+        if len(artifact_ids) == 0:
+            # Without identifiers, the request would list the whole version.
+            return []
+
+        # Blobs are fetched separately, so the server streams them as raw bytes.
+        url = f"{_url(self.url, model_id, version_id)}/artifact"
+        res = self.client.get_cached(
+            url, params={"ids": artifact_ids, "resolve_blobs": "false"}
+        )
+
+        artifacts = [ArtifactModel(**object) for object in res.json()]
+        if not resolve_blobs:
+            return artifacts
+        return [
+            blob.inline_blobs(self, model_id, artifact)
+            for artifact in artifacts
+        ]
 
     def read_artifacts(
         self,
@@ -171,12 +225,30 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
         limit: int = 100,
         offset: int = 0,
     ) -> List[ArtifactModel]:
-        url = f"{_url(self.url, model_id, version_id)}/artifact?limit={limit}&offset={offset}"
-        res = self.client.get(url)
-        self.client.raise_for_response(res)
+        url = f"{_url(self.url, model_id, version_id)}/artifact"
+        res = self.client.get_cached(
+            url, params={"limit": limit, "offset": offset}
+        )
 
         return [ArtifactModel(**object) for object in res.json()]
 
+    def read_artifacts_page(
+        self,
+        model_id: str,
+        version_id: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ArtifactModel], Optional[str]]:
+        url = f"{_url(self.url, model_id, version_id)}/artifact"
+        params: dict[str, typing.Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        res = self.client.get_cached(url, params=params)
+
+        return [
+            ArtifactModel(**object) for object in res.json()
+        ], res.headers.get(NEXT_CURSOR_HEADER)
+
     def search_artifacts(
         self,
         model_id: str,
@@ -190,6 +262,28 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
 
         return [ArtifactModel(**object) for object in res.json()]
 
+    def iter_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        page_size: int = 100,
+    ) -> Iterator[ArtifactModel]:
+        # The whole result is streamed as newline-delimited JSON, so page_size does not apply.
+        url = f"{_url(self.url, model_id, version_id)}/artifact"
+        headers = {"Accept": NDJSON_MEDIA_TYPE}
+        if isinstance(query.filter, AllFilter):
+            stream = self.client.stream("GET", url, headers=headers)
+        else:
+            stream = self.client.stream(
+                "POST", f"{url}/search", headers=headers, json=query.to_json()
+            )
+
+        with stream as res:
+            self.client.raise_for_response(res)
+            for line in self.client.iter_lines(res):
+                yield ArtifactModel(**json.loads(line))
+
     def delete_artifact(
         self,
         model_id: str,
@@ -202,6 +296,39 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
 
         return ArtifactModel(**res.json())
 
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, model_id: str, data: bytes) -> str:
+        url = f"{self.url}{API_PREFIX}/model/{model_id}/blob"
+        res = self.client.post(url, data=data)
+        self.client.raise_for_response(res)
+
+        return typing.cast(str, res.json())
+
+    def read_blob(self, model_id: str, digest: str) -> bytes:
+        return b"".join(self.iter_blob(model_id, digest))
+
+    def write_blob_stream(self, model_id: str, chunks: Iterable[bytes]) -> str:
+        # Sent with chunked transfer encoding, without joining the chunks.
+        url = f"{self.url}{API_PREFIX}/model/{model_id}/blob"
+        res = self.client.post(url, data=iter(chunks))
+        self.client.raise_for_response(res)
+
+        return typing.cast(str, res.json())
+
+    def iter_blob(
+        self,
+        model_id: str,
+        digest: str,
+        chunk_size: int = blob.BLOB_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        url = f"{self.url}{API_PREFIX}/model/{model_id}/blob/{digest}"
+        with self.client.stream("GET", url) as res:
+            self.client.raise_for_response(res)
+            yield from self.client.iter_bytes(res, chunk_size)
+
 
 def _url(base: str, model_id: str, version_id: str) -> str:
     """
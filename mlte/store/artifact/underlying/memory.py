@@ -7,8 +7,9 @@ Implementation of in-memory artifact store.
 from __future__ import annotations
 
 from collections import OrderedDict
-from typing import Dict, List
+from typing import Dict, List, Set
 
+import mlte.store.artifact.blob as blob
 import mlte.store.artifact.util as storeutil
 import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
@@ -43,6 +44,9 @@ class ModelWithVersions:
         self.versions: Dict[str, VersionWithArtifacts] = {}
         """The collection of versions in the model."""
 
+        self.blobs: Dict[str, bytes] = {}
+        """The blobs with large value payloads, by digest."""
+
 
 class MemoryStorage:
     """A simple storage wrapper for the in-memory store."""
@@ -195,17 +199,67 @@ class InMemoryStoreSession(ArtifactStoreSession):
         version.artifacts[artifact.header.identifier] = artifact
         return artifact
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        if parents:
+            storeutil.create_parents(self, model_id, version_id)
+
+        version = self._get_version_with_artifacts(model_id, version_id)
+
+        if not force:
+            storeutil.check_new_artifacts(
+                [artifact.header.identifier for artifact in artifacts],
+                version.artifacts,
+            )
+        version.artifacts.update(
+            (artifact.header.identifier, artifact) for artifact in artifacts
+        )
+        return artifacts
+
     def read_artifact(
         self,
         model_id: str,
         version_id: str,
         artifact_id: str,
+        *,
+        resolve_blobs: bool = True,
     ) -> ArtifactModel:
         version = self._get_version_with_artifacts(model_id, version_id)
 
         if artifact_id not in version.artifacts:
             raise errors.ErrorNotFound(f"Artifact '{artifact_id}'")
-        return version.artifacts[artifact_id]
+        artifact = version.artifacts[artifact_id]
+        if not resolve_blobs:
+            return artifact
+        return blob.inline_blobs(self, model_id, artifact)
+
+    def read_artifacts_by_ids(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+        *,
+        resolve_blobs: bool = True,
+    ) -> List[ArtifactModel]:
+        version = self._get_version_with_artifacts(model_id, version_id)
+
+        for artifact_id in artifact_ids:
+            if artifact_id not in version.artifacts:
+                raise errors.ErrorNotFound(f"Artifact '{artifact_id}'")
+        artifacts = [version.artifacts[id] for id in artifact_ids]
+        if not resolve_blobs:
+            return artifacts
+        return [
+            blob.inline_blobs(self, model_id, artifact)
+            for artifact in artifacts
+        ]
 
     def read_artifacts(
         self,
@@ -215,9 +269,10 @@ class InMemoryStoreSession(ArtifactStoreSession):
         offset: int = 0,
     ) -> List[ArtifactModel]:
         version = self._get_version_with_artifacts(model_id, version_id)
-        return [artifact for artifact in version.artifacts.values()][
-            offset : offset + limit
-        ]
+        return [
+            blob.inline_blobs(self, model_id, artifact)
+            for artifact in version.artifacts.values()
+        ][offset : offset + limit]
 
     def search_artifacts(
         self,
@@ -227,7 +282,7 @@ class InMemoryStoreSession(ArtifactStoreSession):
     ) -> List[ArtifactModel]:
         version = self._get_version_with_artifacts(model_id, version_id)
         return [
-            artifact
+            blob.inline_blobs(self, model_id, artifact)
             for artifact in version.artifacts.values()
             if query.filter.match(artifact)
         ]
@@ -244,7 +299,53 @@ class InMemoryStoreSession(ArtifactStoreSession):
             raise errors.ErrorNotFound(f"Artifact '{artifact_id}'")
         artifact = version.artifacts[artifact_id]
         del version.artifacts[artifact_id]
-        return artifact
+        return blob.inline_blobs(self, model_id, artifact)
+
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, model_id: str, data: bytes) -> str:
+        if model_id not in self.storage.models:
+            raise errors.ErrorNotFound(f"Model {model_id}")
+
+        digest = blob.get_digest(data)
+        self.storage.models[model_id].blobs[digest] = data
+        return digest
+
+    def read_blob(self, model_id: str, digest: str) -> bytes:
+        if model_id not in self.storage.models:
+            raise errors.ErrorNotFound(f"Model {model_id}")
+
+        blobs = self.storage.models[model_id].blobs
+        if digest not in blobs:
+            raise errors.ErrorNotFound(f"Blob {digest}")
+        return blobs[digest]
+
+    def list_blobs(self, model_id: str) -> List[str]:
+        if model_id not in self.storage.models:
+            raise errors.ErrorNotFound(f"Model {model_id}")
+
+        return list(self.storage.models[model_id].blobs.keys())
+
+    def delete_blob(self, model_id: str, digest: str) -> None:
+        if model_id not in self.storage.models:
+            raise errors.ErrorNotFound(f"Model {model_id}")
+
+        blobs = self.storage.models[model_id].blobs
+        if digest not in blobs:
+            raise errors.ErrorNotFound(f"Blob {digest}")
+        del blobs[digest]
+
+    def list_blob_references(self, model_id: str) -> Set[str]:
+        if model_id not in self.storage.models:
+            raise errors.ErrorNotFound(f"Model {model_id}")
+
+        return blob.get_blob_references(
+            artifact
+            for version in self.storage.models[model_id].versions.values()
+            for artifact in version.artifacts.values()
+        )
 
     def _get_version_with_artifacts(
         self, model_id: str, version_id: str
@@ -8,7 +8,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import BigInteger, ForeignKey, UniqueConstraint, select
+from sqlalchemy import (
+    BigInteger,
+    ForeignKey,
+    LargeBinary,
+    UniqueConstraint,
+    select,
+)
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -58,6 +64,9 @@ class DBModel(DBBase):
     versions: Mapped[List[DBVersion]] = relationship(
         back_populates="model", cascade="all, delete-orphan"
     )
+    blobs: Mapped[List[DBBlob]] = relationship(
+        back_populates="model", cascade="all, delete-orphan"
+    )
 
     __table_args__ = (UniqueConstraint("name", name="_model_identifier"),)
 
@@ -82,6 +91,25 @@ class DBVersion(DBBase):
         return f"Version(id={self.id!r}, name={self.name!r})"
 
 
+class DBBlob(DBBase):
+    __tablename__ = "blob"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    digest: Mapped[str]
+    # Deferred so that the data is only loaded when accessed, not when listing blobs.
+    data: Mapped[bytes] = mapped_column(LargeBinary, deferred=True)
+    model_id = mapped_column(ForeignKey("model.id"))
+
+    model: Mapped[DBModel] = relationship(back_populates="blobs")
+
+    __table_args__ = (
+        UniqueConstraint("digest", "model_id", name="_blob_model_ids_uc"),
+    )
+
+    def __repr__(self) -> str:
+        return f"Blob(id={self.id!r}, digest={self.digest!r})"
+
+
 # -------------------------------------------------------------------------
 # General Artifact Elements
 # -------------------------------------------------------------------------
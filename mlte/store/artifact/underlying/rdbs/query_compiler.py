@@ -0,0 +1,71 @@
+"""
+mlte/store/artifact/underlying/rdbs/query_compiler.py
+
+Translation of store query filters into SQL clauses over artifact tables.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+from sqlalchemy import ColumnElement, and_, false, or_, true
+
+from mlte.store.artifact.underlying.rdbs.metadata import (
+    DBArtifactHeader,
+    DBArtifactType,
+)
+from mlte.store.query import (
+    AllFilter,
+    AndFilter,
+    Filter,
+    IdentifierFilter,
+    NoneFilter,
+    OrFilter,
+    TypeFilter,
+)
+
+CompiledFilter = Tuple[ColumnElement[bool], bool]
+"""
+A SQL clause over DBArtifactHeader, and a flag indicating if the clause is exact.
+If it is not exact, the clause selects a superset of the matching artifacts, and the
+original filter has to be applied in Python to the returned rows.
+"""
+
+
+def compile_filter(filter: Filter) -> CompiledFilter:
+    """
+    Compiles a query filter into a SQL WHERE clause over artifact headers.
+
+    Filters that can't be expressed in SQL (tags, properties) are compiled into a clause
+    that does not discard anything, and the result is marked as not exact.
+    :param filter: The filter to compile
+    :return: A tuple with the SQL clause and whether it fully implements the filter
+    """
+    if isinstance(filter, AllFilter):
+        return true(), True
+    elif isinstance(filter, NoneFilter):
+        return false(), True
+    elif isinstance(filter, IdentifierFilter):
+        return DBArtifactHeader.identifier == filter.id, True
+    elif isinstance(filter, TypeFilter):
+        return (
+            DBArtifactHeader.type.has(
+                DBArtifactType.name == str(filter.item_type)
+            ),
+            True,
+        )
+    elif isinstance(filter, AndFilter):
+        compiled = [compile_filter(f) for f in filter.filters]
+        return (
+            and_(true(), *[clause for clause, _ in compiled]),
+            all(exact for _, exact in compiled),
+        )
+    elif isinstance(filter, OrFilter):
+        compiled = [compile_filter(f) for f in filter.filters]
+        if not all(exact for _, exact in compiled):
+            # A partial OR clause could discard items that the untranslated filters would match.
+            return true(), False
+        return or_(false(), *[clause for clause, _ in compiled]), True
+    else:
+        # Tag, property and unknown filters are evaluated in Python.
+        return true(), False
@@ -6,58 +6,109 @@ DB utils for getting artifact related data from the DB.
 
 from __future__ import annotations
 
-from typing import List, Tuple, Union
+import typing
+from typing import List, Optional, Tuple, Union
 
-from sqlalchemy import ScalarResult, select
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, and_, or_, select, true
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.context.model import Model, Version
 from mlte.model.shared import DataClassification, ProblemType
+from mlte.store.artifact.blob import BLOB_VALUE_TYPES
 from mlte.store.artifact.underlying.rdbs import factory
 from mlte.store.artifact.underlying.rdbs.metadata import (
     DBArtifactHeader,
     DBArtifactType,
+    DBBlob,
     DBModel,
     DBVersion,
 )
 from mlte.store.artifact.underlying.rdbs.metadata_nc import (
     DBDataClassification,
+    DBDataDescriptor,
+    DBGoalDescriptor,
     DBNegotiationCard,
+    DBNegotiationCardData,
     DBProblemType,
     DBReport,
 )
 from mlte.store.artifact.underlying.rdbs.metadata_spec import (
     DBQACategory,
+    DBResult,
     DBSpec,
     DBValidatedSpec,
 )
 from mlte.store.artifact.underlying.rdbs.metadata_value import DBValue
 
+# -------------------------------------------------------------------------
+# Loader profiles.
+# -------------------------------------------------------------------------
+
+# Relationships read when converting each artifact body, so that they are loaded
+# with one query per relationship for all rows, instead of lazily per row.
+_SPEC_LOADER = selectinload(DBSpec.qa_categories).selectinload(
+    DBQACategory.conditions
+)
+_NEGOTIATION_CARD_DATA_LOADERS = [
+    selectinload(DBNegotiationCardData.sys_goals).selectinload(
+        DBGoalDescriptor.metrics
+    ),
+    joinedload(DBNegotiationCardData.sys_problem_type),
+    selectinload(DBNegotiationCardData.data_descriptors).options(
+        joinedload(DBDataDescriptor.classification),
+        selectinload(DBDataDescriptor.labels),
+        selectinload(DBDataDescriptor.fields),
+    ),
+    joinedload(DBNegotiationCardData.model_dev_resources),
+    joinedload(DBNegotiationCardData.model_prod_resources),
+    selectinload(DBNegotiationCardData.model_prod_inputs),
+    selectinload(DBNegotiationCardData.model_prod_outputs),
+    selectinload(DBNegotiationCardData.system_requirements),
+]
+
+ARTIFACT_LOADER_OPTIONS: dict[ArtifactType, LoaderOption] = {
+    ArtifactType.SPEC: selectinload(DBArtifactHeader.body_spec).options(
+        _SPEC_LOADER
+    ),
+    ArtifactType.VALIDATED_SPEC: selectinload(
+        DBArtifactHeader.body_validated_spec
+    ).options(
+        selectinload(DBValidatedSpec.results).options(
+            joinedload(DBResult.evidence_metadata),
+            joinedload(DBResult.qa_category),
+        ),
+        selectinload(DBValidatedSpec.spec).options(
+            joinedload(DBSpec.artifact_header), _SPEC_LOADER
+        ),
+    ),
+    ArtifactType.NEGOTIATION_CARD: selectinload(
+        DBArtifactHeader.body_negotiation_card
+    )
+    .selectinload(DBNegotiationCard.negotiation_card_data)
+    .options(*_NEGOTIATION_CARD_DATA_LOADERS),
+    ArtifactType.REPORT: selectinload(DBArtifactHeader.body_report).options(
+        selectinload(DBReport.negotiation_card_data).options(
+            *_NEGOTIATION_CARD_DATA_LOADERS
+        ),
+        selectinload(DBReport.validated_spec).joinedload(
+            DBValidatedSpec.artifact_header
+        ),
+        selectinload(DBReport.comments),
+    ),
+    ArtifactType.VALUE: selectinload(DBArtifactHeader.body_value).joinedload(
+        DBValue.evidence_metadata
+    ),
+}
+"""Eager loading options for the body of each artifact type, to be applied to queries over DBArtifactHeader."""
+
 
 class DBReader:
     """Class encapsulating functions to read artifact related data from the DB."""
 
-    # Artifact Type - DB Object mapping.
-    SUPPORTED_ARTIFACT_DB_CLASSES: dict[
-        ArtifactType,
-        Union[
-            type[DBSpec],
-            type[DBValidatedSpec],
-            type[DBNegotiationCard],
-            type[DBReport],
-            type[DBValue],
-        ],
-    ] = {
-        ArtifactType.SPEC: DBSpec,
-        ArtifactType.VALIDATED_SPEC: DBValidatedSpec,
-        ArtifactType.NEGOTIATION_CARD: DBNegotiationCard,
-        ArtifactType.REPORT: DBReport,
-        ArtifactType.VALUE: DBValue,
-    }
-
     @staticmethod
     def get_model(model_id: str, session: Session) -> Tuple[Model, DBModel]:
         """Reads the model with the given identifier using the provided session, and returns a Model and DBModel object."""
@@ -102,6 +153,50 @@ class DBReader:
         else:
             return (Version(identifier=version_obj.name)), version_obj
 
+    @staticmethod
+    def get_blob(
+        model_id: str, digest: str, session: Session
+    ) -> Optional[DBBlob]:
+        """Reads the blob with the given digest in the given model, returning None if it does not exist."""
+        return session.scalar(
+            select(DBBlob)
+            .where(DBBlob.digest == digest)
+            .where(DBBlob.model_id == DBModel.id)
+            .where(DBModel.name == model_id)
+        )
+
+    @staticmethod
+    def get_blob_digests(model_id: str, session: Session) -> List[str]:
+        """Reads the digests of all blobs in the given model, without their data."""
+        return list(
+            session.scalars(
+                select(DBBlob.digest)
+                .where(DBBlob.model_id == DBModel.id)
+                .where(DBModel.name == model_id)
+            )
+        )
+
+    @staticmethod
+    def get_blob_value_jsons(model_id: str, session: Session) -> List[str]:
+        """Reads the stored JSON of the values, in all versions of the given model, of types that can refer to blobs."""
+        return list(
+            session.scalars(
+                select(DBValue.data_json)
+                .join(
+                    DBArtifactHeader,
+                    DBValue.artifact_header_id == DBArtifactHeader.id,
+                )
+                .join(DBVersion, DBArtifactHeader.version_id == DBVersion.id)
+                .join(DBModel, DBVersion.model_id == DBModel.id)
+                .where(DBModel.name == model_id)
+                .where(
+                    DBValue.value_type.in_(
+                        [value_type.value for value_type in BLOB_VALUE_TYPES]
+                    )
+                )
+            )
+        )
+
     @staticmethod
     def get_artifact_type(
         type: ArtifactType, session: Session
@@ -126,97 +221,80 @@ class DBReader:
         Union[DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue],
     ]:
         """Reads the artifact with the given identifier using the provided session, and returns an internal object."""
-        # First get the class of the artifact we are trying to read, so we can use the ORM by passing the DB object type.
-        artifact_header_obj = DBReader.get_artifact_header(artifact_id, session)
-        artifact_type = ArtifactType(artifact_header_obj.type.name)
-
-        # Get artifact.
-        artifact_class = DBReader.get_artifact_class(artifact_type)
-        artifact_obj: Union[
-            DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue
-        ] = session.scalar(
-            select(artifact_class)
-            .where(DBVersion.model_id == DBModel.id)
-            .where(DBVersion.name == version_id)
-            .where(DBModel.name == model_id)
-            .where(DBArtifactHeader.id == artifact_class.artifact_header_id)
-            .where(DBArtifactHeader.identifier == artifact_id)
-            .where(DBArtifactHeader.version_id == DBVersion.id)
+        # Load the header scoped to the model and version, with its body eagerly loaded.
+        artifact_header_objs = DBReader.get_artifact_headers(
+            model_id,
+            version_id,
+            session,
+            DBArtifactHeader.identifier == artifact_id,
         )
-
-        if artifact_obj is None:
+        if len(artifact_header_objs) == 0:
             raise errors.ErrorNotFound(
                 f"Artifact with identifier {artifact_id}  and associated to model {model_id}, and version {version_id} was not found in the artifact store."
             )
-        else:
-            return (
-                factory.create_artifact_from_db(artifact_header_obj, session),
-                artifact_obj,
-            )
+
+        artifact_header_obj = artifact_header_objs[0]
+        return (
+            factory.create_artifact_from_db(artifact_header_obj, session),
+            DBReader.get_artifact_body(artifact_header_obj),
+        )
+
+    @staticmethod
+    def get_artifact_body(
+        artifact_header_obj: DBArtifactHeader,
+    ) -> Union[DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue]:
+        """Gets the internal object with the body of the artifact with the given header."""
+        artifact_type = ArtifactType(artifact_header_obj.type.name)
+
+        # Body relationships in the header are named after the artifact type.
+        return typing.cast(
+            Union[
+                DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue
+            ],
+            getattr(artifact_header_obj, f"body_{artifact_type}"),
+        )
 
     @staticmethod
-    def get_artifacts_for_type(
+    def get_artifact_headers(
         model_id: str,
         version_id: str,
-        artifact_type: ArtifactType,
         session: Session,
-    ) -> List[ArtifactModel]:
-        """Loads and returns a list with all the artifacts of the given type, for the given model/version."""
-        artifact_class = DBReader.get_artifact_class(artifact_type)
-        artifact_objs: ScalarResult[
-            Union[DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue]
-        ] = session.scalars(
-            (
-                select(artifact_class)
-                .where(DBVersion.model_id == DBModel.id)
+        where: ColumnElement[bool] = true(),
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[DBArtifactHeader]:
+        """
+        Loads the headers of the artifacts in the given model/version that satisfy the given SQL clause.
+        Headers are sorted by timestamp and then id, so that pages over them are stable.
+        """
+        return list(
+            session.scalars(
+                select(DBArtifactHeader)
+                .join(DBVersion, DBArtifactHeader.version_id == DBVersion.id)
+                .join(DBModel, DBVersion.model_id == DBModel.id)
                 .where(DBVersion.name == version_id)
                 .where(DBModel.name == model_id)
-                .where(DBArtifactHeader.id == artifact_class.artifact_header_id)
-                .where(DBArtifactHeader.version_id == DBVersion.id)
+                .where(where)
+                .order_by(DBArtifactHeader.timestamp, DBArtifactHeader.id)
+                .limit(limit)
+                .offset(offset)
+                .options(
+                    joinedload(DBArtifactHeader.type),
+                    *ARTIFACT_LOADER_OPTIONS.values(),
+                )
             )
         )
-        artifacts = []
-        for artifact_obj in artifact_objs:
-            artifact = factory.create_artifact_from_db(
-                artifact_obj.artifact_header, session
-            )
-            artifacts.append(artifact)
-        return artifacts
 
     @staticmethod
-    def get_artifact_header(
-        artifact_id: str, session: Session
-    ) -> DBArtifactHeader:
-        """Gets the artifact header object of the artifact identifier provided."""
-        artifact_header_obj = session.scalar(
-            select(DBArtifactHeader).where(
-                DBArtifactHeader.identifier == artifact_id
-            )
+    def after_artifact_header(timestamp: int, id: int) -> ColumnElement[bool]:
+        """Builds a clause that selects headers sorted after the given one, used for keyset pagination."""
+        return or_(
+            DBArtifactHeader.timestamp > timestamp,
+            and_(
+                DBArtifactHeader.timestamp == timestamp,
+                DBArtifactHeader.id > id,
+            ),
         )
-        if artifact_header_obj is None:
-            raise errors.ErrorNotFound(
-                f"Artifact with identifier {artifact_id} was not found in the artifact store."
-            )
-        else:
-            return artifact_header_obj
-
-    @staticmethod
-    def get_artifact_class(
-        artifact_type: ArtifactType,
-    ) -> Union[
-        type[DBSpec],
-        type[DBValidatedSpec],
-        type[DBNegotiationCard],
-        type[DBReport],
-        type[DBValue],
-    ]:
-        """Gets the DB class of the artifact header provided."""
-        if artifact_type in DBReader.SUPPORTED_ARTIFACT_DB_CLASSES:
-            return DBReader.SUPPORTED_ARTIFACT_DB_CLASSES[
-                ArtifactType(artifact_type)
-            ]
-        else:
-            raise Exception(f"Unsupported artifact type: {artifact_type.value}")
 
     @staticmethod
     def get_spec(
@@ -7,19 +7,30 @@ Implementation of relational database system artifact store.
 from __future__ import annotations
 
 import typing
-from typing import List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-from sqlalchemy import Engine, select
+from sqlalchemy import ColumnElement, Engine, and_, select, true
 from sqlalchemy.orm import DeclarativeBase, Session
 
+import mlte.store.artifact.blob as blob
 import mlte.store.artifact.util as storeutil
 import mlte.store.error as errors
+from mlte._private.fixed_json import json
 from mlte.artifact.model import ArtifactModel
+from mlte.artifact.type import ArtifactType
 from mlte.context.model import Model, Version
+from mlte.store.artifact.cursor import (
+    check_page_limit,
+    decode_cursor,
+    encode_cursor,
+)
 from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
 from mlte.store.artifact.underlying.rdbs import factory
 from mlte.store.artifact.underlying.rdbs.metadata import (
+    DBArtifactHeader,
+    DBArtifactType,
     DBBase,
+    DBBlob,
     DBModel,
     DBVersion,
     init_artifact_types,
@@ -29,6 +40,7 @@ from mlte.store.artifact.underlying.rdbs.metadata_nc import (
     init_problem_types,
 )
 from mlte.store.artifact.underlying.rdbs.metadata_value import init_value_types
+from mlte.store.artifact.underlying.rdbs.query_compiler import compile_filter
 from mlte.store.artifact.underlying.rdbs.reader import DBReader
 from mlte.store.common.rdbs_storage import RDBStorage
 from mlte.store.query import Query
@@ -41,23 +53,47 @@ from mlte.store.query import Query
 class RelationalDBArtifactStore(ArtifactStore):
     """A DB implementation of the MLTE artifact store."""
 
-    def __init__(self, uri, **kwargs):
+    def __init__(
+        self,
+        uri,
+        read_uris: Optional[List[str]] = None,
+        read_your_writes: bool = True,
+        **kwargs,
+    ):
+        """
+        Create the store.
+        :param uri: The URI of the primary DB, which all writes go to
+        :param read_uris: URIs of read replicas of the primary DB; if given, reads go to them
+        :param read_your_writes: Whether sessions that wrote read from the primary DB afterwards,
+        so they see their own writes even if replicas lag behind
+        :param kwargs: Options for the DB engines, such as their connection pools
+        """
         ArtifactStore.__init__(self, uri=uri)
 
         self.storage = RDBStorage(
             uri,
             base_class=typing.cast(DeclarativeBase, DBBase),
             init_tables_func=init_artifact_store_tables,
+            read_uris=read_uris,
             **kwargs,
         )
         """The relational DB storage."""
 
+        self.read_your_writes = read_your_writes
+        """Whether sessions read from the primary DB once they wrote to it."""
+
     def session(self) -> RelationalDBArtifactStoreSession:
         """
         Return a session handle for the store instance.
         :return: The session handle
         """
-        return RelationalDBArtifactStoreSession(storage=self.storage)
+        return RelationalDBArtifactStoreSession(
+            storage=self.storage, read_your_writes=self.read_your_writes
+        )
+
+    def close(self) -> None:
+        """Close the store, releasing all pooled DB connections."""
+        self.storage.close()
 
 
 def init_artifact_store_tables(engine: Engine):
@@ -77,20 +113,40 @@ def init_artifact_store_tables(engine: Engine):
 class RelationalDBArtifactStoreSession(ArtifactStoreSession):
     """A relational DB implementation of the MLTE artifact store session."""
 
-    def __init__(self, storage: RDBStorage) -> None:
+    def __init__(
+        self, storage: RDBStorage, read_your_writes: bool = True
+    ) -> None:
         self.storage = storage
         """A reference to underlying storage."""
 
+        self.read_your_writes = read_your_writes
+        """Whether reads go to the primary DB once this session wrote to it."""
+
+        self._wrote = False
+        """Whether this session wrote to the primary DB."""
+
     def close(self) -> None:
         """Close the session."""
-        self.storage.close()
+        # Connections go back to the pool as each DB session ends; the engine stays up until the store is closed.
+        pass
+
+    def _read_engine(self) -> Engine:
+        """Returns the engine for a read: a replica, unless this session wrote and has to see its writes."""
+        if self._wrote and self.read_your_writes:
+            return self.storage.engine
+        return self.storage.read_engine()
+
+    def _write_engine(self) -> Engine:
+        """Returns the engine for a write, which is always the primary one."""
+        self._wrote = True
+        return self.storage.engine
 
     # -------------------------------------------------------------------------
     # Structural Elements
     # -------------------------------------------------------------------------
 
     def create_model(self, model: Model) -> Model:
-        with Session(self.storage.engine) as session:
+        with Session(self._write_engine()) as session:
             try:
                 _, _ = DBReader.get_model(model.identifier, session)
                 raise errors.ErrorAlreadyExists(
@@ -107,27 +163,27 @@ class RelationalDBArtifactStoreSession(ArtifactStoreSession):
                 return Model(identifier=model.identifier, versions=[])
 
     def read_model(self, model_id: str) -> Model:
-        with Session(self.storage.engine) as session:
+        with Session(self._read_engine()) as session:
             model, _ = DBReader.get_model(model_id, session)
             return model
 
     def list_models(self) -> List[str]:
         models: List[str] = []
-        with Session(self.storage.engine) as session:
+        with Session(self._read_engine()) as session:
             model_objs = session.scalars(select(DBModel))
             for model_obj in model_objs:
                 models.append(model_obj.name)
         return models
 
     def delete_model(self, model_id: str) -> Model:
-        with Session(self.storage.engine) as session:
+        with Session(self._write_engine()) as session:
             model, model_obj = DBReader.get_model(model_id, session)
             session.delete(model_obj)
             session.commit()
             return model
 
     def create_version(self, model_id: str, version: Version) -> Version:
-        with Session(self.storage.engine) as session:
+        with Session(self._write_engine()) as session:
             try:
                 _, _ = DBReader.get_version(
                     model_id, version.identifier, session
@@ -148,13 +204,13 @@ class RelationalDBArtifactStoreSession(ArtifactStoreSession):
                 return Version(identifier=version.identifier)
 
     def read_version(self, model_id: str, version_id: str) -> Version:
-        with Session(self.storage.engine) as session:
+        with Session(self._read_engine()) as session:
             version, _ = DBReader.get_version(model_id, version_id, session)
             return version
 
     def list_versions(self, model_id: str) -> List[str]:
         versions: List[str] = []
-        with Session(self.storage.engine) as session:
+        with Session(self._read_engine()) as session:
             version_objs = session.scalars(
                 (
                     select(DBVersion)
@@ -167,7 +223,7 @@ class RelationalDBArtifactStoreSession(ArtifactStoreSession):
         return versions
 
     def delete_version(self, model_id: str, version_id: str) -> Version:
-        with Session(self.storage.engine) as session:
+        with Session(self._write_engine()) as session:
             version, version_obj = DBReader.get_version(
                 model_id, version_id, session
             )
@@ -188,7 +244,7 @@ class RelationalDBArtifactStoreSession(ArtifactStoreSession):
         force: bool = False,
         parents: bool = False,
     ) -> ArtifactModel:
-        with Session(self.storage.engine) as session:
+        with Session(self._write_engine()) as session:
             if parents:
                 storeutil.create_parents(self, model_id, version_id)
             else:
@@ -231,17 +287,114 @@ class RelationalDBArtifactStoreSession(ArtifactStoreSession):
             session.commit()
             return artifact
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        with Session(self._write_engine()) as session:
+            if parents:
+                storeutil.create_parents(self, model_id, version_id)
+            _, version_obj = DBReader.get_version(model_id, version_id, session)
+
+            # Check all existing artifacts with one query.
+            artifact_ids = [
+                artifact.header.identifier for artifact in artifacts
+            ]
+            existing_header_objs = DBReader.get_artifact_headers(
+                model_id,
+                version_id,
+                session,
+                DBArtifactHeader.identifier.in_(artifact_ids),
+            )
+            if not force:
+                storeutil.check_new_artifacts(
+                    artifact_ids,
+                    {header.identifier for header in existing_header_objs},
+                )
+            for artifact_header_obj in existing_header_objs:
+                session.delete(DBReader.get_artifact_body(artifact_header_obj))
+
+            # When forced, the last of repeated artifacts is the one kept.
+            artifact_type_objs: Dict[ArtifactType, DBArtifactType] = {}
+            for artifact in {
+                artifact.header.identifier: artifact for artifact in artifacts
+            }.values():
+                if artifact.header.type not in artifact_type_objs:
+                    artifact_type_objs[artifact.header.type] = (
+                        DBReader.get_artifact_type(
+                            artifact.header.type, session
+                        )
+                    )
+                session.add(
+                    factory.create_db_artifact(
+                        artifact,
+                        artifact_type_objs[artifact.header.type],
+                        version_obj.id,
+                        session,
+                    )
+                )
+
+            # All artifacts are written in the same transaction.
+            session.commit()
+            return artifacts
+
     def read_artifact(
         self,
         model_id: str,
         version_id: str,
         artifact_id: str,
+        *,
+        resolve_blobs: bool = True,
     ) -> ArtifactModel:
-        with Session(self.storage.engine) as session:
+        with Session(self._read_engine()) as session:
             artifact, _ = DBReader.get_artifact(
                 model_id, version_id, artifact_id, session
             )
-            return artifact
+            if not resolve_blobs:
+                return artifact
+            return blob.inline_blobs(self, model_id, artifact)
+
+    def read_artifacts_by_ids(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+        *,
+        resolve_blobs: bool = True,
+    ) -> List[ArtifactModel]:
+        with Session(self._read_engine()) as session:
+            artifact_header_objs = {
+                header.identifier: header
+                for header in DBReader.get_artifact_headers(
+                    model_id,
+                    version_id,
+                    session,
+                    DBArtifactHeader.identifier.in_(artifact_ids),
+                )
+            }
+            for artifact_id in artifact_ids:
+                if artifact_id not in artifact_header_objs:
+                    raise errors.ErrorNotFound(
+                        f"Artifact with identifier {artifact_id}  and associated to model {model_id}, and version {version_id} was not found in the artifact store."
+                    )
+
+            artifacts = [
+                factory.create_artifact_from_db(
+                    artifact_header_objs[artifact_id], session
+                )
+                for artifact_id in artifact_ids
+            ]
+            if not resolve_blobs:
+                return artifacts
+            return [
+                blob.inline_blobs(self, model_id, artifact)
+                for artifact in artifacts
+            ]
 
     def read_artifacts(
         self,
@@ -250,15 +403,59 @@ class RelationalDBArtifactStoreSession(ArtifactStoreSession):
         limit: int = 100,
         offset: int = 0,
     ) -> List[ArtifactModel]:
-        # TODO: not the best support of offset and limit, still loading everything from DB.
-        with Session(self.storage.engine) as session:
-            all_artifacts = []
-            for artifact_type in DBReader.SUPPORTED_ARTIFACT_DB_CLASSES.keys():
-                artifacts = DBReader.get_artifacts_for_type(
-                    model_id, version_id, artifact_type, session
+        with Session(self._read_engine()) as session:
+            return [
+                blob.inline_blobs(
+                    self,
+                    model_id,
+                    factory.create_artifact_from_db(
+                        artifact_header_obj, session
+                    ),
                 )
-                all_artifacts.extend(artifacts)
-            return all_artifacts[offset : offset + limit]
+                for artifact_header_obj in DBReader.get_artifact_headers(
+                    model_id, version_id, session, limit=limit, offset=offset
+                )
+            ]
+
+    def read_artifacts_page(
+        self,
+        model_id: str,
+        version_id: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ArtifactModel], Optional[str]]:
+        check_page_limit(limit)
+        with Session(self._read_engine()) as session:
+            # Seek past the last header of the previous page, instead of counting rows to skip.
+            where: ColumnElement[bool] = true()
+            if cursor is not None:
+                position = decode_cursor(cursor, "timestamp", "id")
+                where = DBReader.after_artifact_header(
+                    position["timestamp"], position["id"]
+                )
+
+            # Read one extra header to know if there is a next page.
+            artifact_header_objs = DBReader.get_artifact_headers(
+                model_id, version_id, session, where, limit=limit + 1
+            )
+            next_cursor = None
+            if len(artifact_header_objs) > limit:
+                artifact_header_objs = artifact_header_objs[:limit]
+                last = artifact_header_objs[-1]
+                next_cursor = encode_cursor(
+                    {"timestamp": last.timestamp, "id": last.id}
+                )
+
+            return [
+                blob.inline_blobs(
+                    self,
+                    model_id,
+                    factory.create_artifact_from_db(
+                        artifact_header_obj, session
+                    ),
+                )
+                for artifact_header_obj in artifact_header_objs
+            ], next_cursor
 
     def search_artifacts(
         self,
@@ -266,11 +463,70 @@ class RelationalDBArtifactStoreSession(ArtifactStoreSession):
         version_id: str,
         query: Query = Query(),
     ) -> List[ArtifactModel]:
-        # TODO: not the most efficient way, since it loads all artifacts first, before filtering.
-        artifacts = self.read_artifacts(model_id, version_id)
-        return [
-            artifact for artifact in artifacts if query.filter.match(artifact)
-        ]
+        with Session(self._read_engine()) as session:
+            # Let the DB discard everything it can, and only check the rest here.
+            where, exact = compile_filter(query.filter)
+            artifacts = [
+                blob.inline_blobs(
+                    self,
+                    model_id,
+                    factory.create_artifact_from_db(
+                        artifact_header_obj, session
+                    ),
+                )
+                for artifact_header_obj in DBReader.get_artifact_headers(
+                    model_id, version_id, session, where
+                )
+            ]
+            if exact:
+                return artifacts
+            return [
+                artifact
+                for artifact in artifacts
+                if query.filter.match(artifact)
+            ]
+
+    def iter_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        page_size: int = 100,
+    ) -> Iterator[ArtifactModel]:
+        # The DB filters each page, which seeks past the last header of the previous one.
+        where, exact = compile_filter(query.filter)
+        position: ColumnElement[bool] = true()
+        while True:
+            # A DB session per page, so no connection is held while the artifacts are consumed.
+            with Session(self._read_engine()) as session:
+                artifact_header_objs = DBReader.get_artifact_headers(
+                    model_id,
+                    version_id,
+                    session,
+                    and_(where, position),
+                    limit=page_size,
+                )
+                artifacts = [
+                    blob.inline_blobs(
+                        self,
+                        model_id,
+                        factory.create_artifact_from_db(
+                            artifact_header_obj, session
+                        ),
+                    )
+                    for artifact_header_obj in artifact_header_objs
+                ]
+                if len(artifact_header_objs) == page_size:
+                    last = artifact_header_objs[-1]
+                    position = DBReader.after_artifact_header(
+                        last.timestamp, last.id
+                    )
+
+            for artifact in artifacts:
+                if exact or query.filter.match(artifact):
+                    yield artifact
+            if len(artifact_header_objs) < page_size:
+                return
 
     def delete_artifact(
         self,
@@ -278,10 +534,57 @@ class RelationalDBArtifactStoreSession(ArtifactStoreSession):
         version_id: str,
         artifact_id: str,
     ) -> ArtifactModel:
-        with Session(self.storage.engine) as session:
+        with Session(self._write_engine()) as session:
             artifact, artifact_obj = DBReader.get_artifact(
                 model_id, version_id, artifact_id, session
             )
             session.delete(artifact_obj)
             session.commit()
-            return artifact
+            return blob.inline_blobs(self, model_id, artifact)
+
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, model_id: str, data: bytes) -> str:
+        digest = blob.get_digest(data)
+        with Session(self._write_engine()) as session:
+            _, model_obj = DBReader.get_model(model_id, session)
+            if DBReader.get_blob(model_id, digest, session) is None:
+                session.add(
+                    DBBlob(digest=digest, data=data, model_id=model_obj.id)
+                )
+                session.commit()
+        return digest
+
+    def read_blob(self, model_id: str, digest: str) -> bytes:
+        with Session(self._read_engine()) as session:
+            blob_obj = DBReader.get_blob(model_id, digest, session)
+            if blob_obj is None:
+                raise errors.ErrorNotFound(f"Blob {digest}")
+            return blob_obj.data
+
+    def list_blobs(self, model_id: str) -> List[str]:
+        with Session(self._read_engine()) as session:
+            DBReader.get_model(model_id, session)
+            return DBReader.get_blob_digests(model_id, session)
+
+    def delete_blob(self, model_id: str, digest: str) -> None:
+        with Session(self._write_engine()) as session:
+            blob_obj = DBReader.get_blob(model_id, digest, session)
+            if blob_obj is None:
+                raise errors.ErrorNotFound(f"Blob {digest}")
+            session.delete(blob_obj)
+            session.commit()
+
+    def list_blob_references(self, model_id: str) -> Set[str]:
+        with Session(self._read_engine()) as session:
+            DBReader.get_model(model_id, session)
+            data_jsons = DBReader.get_blob_value_jsons(model_id, session)
+
+        digests = set()
+        for data_json in data_jsons:
+            digest = json.loads(data_json).get("blob")
+            if digest is not None:
+                digests.add(digest)
+        return digests
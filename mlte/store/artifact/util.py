@@ -4,9 +4,16 @@ mlte/store/artifact/util.py
 Common utilities for store implementations.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Container, List
+
 import mlte.store.error as errors
 from mlte.context.model import Model, Version
-from mlte.store.artifact.store import ArtifactStoreSession
+
+# Only needed for type checking, as the store itself uses these utilities.
+if TYPE_CHECKING:
+    from mlte.store.artifact.store import ArtifactStoreSession
 
 
 def create_parents(
@@ -29,3 +36,19 @@ def create_parents(
         session.create_version(model_id, Version(identifier=version_id))
     except errors.ErrorAlreadyExists:
         pass
+
+
+def check_new_artifacts(
+    artifact_ids: List[str], existing: Container[str]
+) -> None:
+    """
+    Check that a batch of artifacts can be written without overwriting any, before writing any of them.
+    :param artifact_ids: The identifiers of the artifacts to write
+    :param existing: The identifiers of the artifacts already stored
+    :raises ErrorAlreadyExists: If an artifact exists, or appears more than once in the batch
+    """
+    seen = set()
+    for artifact_id in artifact_ids:
+        if artifact_id in existing or artifact_id in seen:
+            raise errors.ErrorAlreadyExists(f"Artifact '{artifact_id}'")
+        seen.add(artifact_id)
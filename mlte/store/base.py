@@ -136,6 +136,10 @@ class Store:
         """
         raise NotImplementedError("Can't call session on a base Store.")
 
+    def close(self) -> None:
+        """Release the resources held by the store, such as pooled DB connections; no-op by default."""
+        pass
+
 
 # -----------------------------------------------------------------------------
 # StoreSession
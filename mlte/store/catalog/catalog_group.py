@@ -61,6 +61,11 @@ class CatalogStoreGroup:
 
         del self.catalogs[id]
 
+    def close(self) -> None:
+        """Closes all catalog stores in the group."""
+        for catalog in self.catalogs.values():
+            catalog.close()
+
     def session(self) -> CatalogStoreGroupSession:
         """
         Return a session handle for the store instance.
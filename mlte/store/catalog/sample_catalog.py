@@ -20,6 +20,7 @@ from mlte.store.catalog.store import (
     CatalogStoreSession,
     ManagedCatalogSession,
 )
+from mlte.store.common.fs_storage import parse_root_path
 
 
 class SampleCatalog:
@@ -34,11 +35,13 @@ class SampleCatalog:
     @staticmethod
     def setup_sample_catalog(
         stores_uri: Optional[StoreURI] = None,
+        reset: bool = True,
     ) -> CatalogStore:
         """
         Sets up the sample catalog.
 
         :param stores_uri: The URI of the stores being used (i.e., base folder, base DB, etc).
+        :param reset: Whether to reset the catalog's entries; not needed if another process already did.
         :return: The sample catalog store.
         """
         # Set file system URI if we didn't get one, or if we got a non-file system one.
@@ -53,7 +56,7 @@ class SampleCatalog:
             )
 
         # The base stores folder has to exist, so create it if it doesn't.
-        os.makedirs(f"./{stores_uri.path}", exist_ok=True)
+        os.makedirs(f"./{parse_root_path(stores_uri)}", exist_ok=True)
 
         # Create the actual sample catalog.
         print(f"Creating sample catalog at URI: {stores_uri}")
@@ -62,7 +65,8 @@ class SampleCatalog:
         )
 
         # Ensure the catalog is always reset to its initial state, and mark it as read only.
-        SampleCatalog.reset_catalog(catalog)
+        if reset:
+            SampleCatalog.reset_catalog(catalog)
         catalog.read_only = True
 
         return catalog
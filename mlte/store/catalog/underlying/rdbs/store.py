@@ -54,6 +54,10 @@ class RelationalDBCatalogStore(CatalogStore):
             storage=self.storage, read_only=self.read_only
         )
 
+    def close(self) -> None:
+        """Close the store, releasing all pooled DB connections."""
+        self.storage.close()
+
 
 def init_catalog_tables(engine: Engine):
     """Pre-populate tables."""
@@ -81,7 +85,8 @@ class RelationalDBCatalogStoreSession(CatalogStoreSession):
 
     def close(self) -> None:
         """Close the session."""
-        self.storage.close()
+        # Connections go back to the pool as each DB session ends; the engine stays up until the store is closed.
+        pass
 
 
 # -----------------------------------------------------------------------------
@@ -0,0 +1,216 @@
+"""
+mlte/store/common/fs_codec.py
+
+Encodings for the files of file-based stores.
+"""
+
+from __future__ import annotations
+
+import importlib
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import Any, Dict, List
+
+from mlte._private.fixed_json import json
+
+DEFAULT_CODEC = "json"
+"""The codec used when none is configured; matches the original file format."""
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+"""The first bytes of every zstd frame."""
+
+MSGPACK_MAP_MARKERS = {*range(0x80, 0x90), 0xDE, 0xDF}
+"""First byte of a msgpack-encoded map, which is what all stored files contain."""
+
+
+def _import_optional(module_name: str, codec_name: str) -> ModuleType:
+    """Imports a package only needed for a given codec, failing with a clear error if missing."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        raise RuntimeError(
+            f"The '{codec_name}' codec requires the '{module_name}' package, which is not installed."
+        )
+
+
+def _to_json_default(obj: Any) -> Any:
+    """Serializes objects that define __json__, as the patched json module does."""
+    if hasattr(obj, "__json__"):
+        return obj.__json__()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _loads_json(data: bytes) -> Dict[str, Any]:
+    """Parses JSON, using orjson if it is available."""
+    try:
+        orjson = importlib.import_module("orjson")
+        try:
+            result: Dict[str, Any] = orjson.loads(data)
+            return result
+        except orjson.JSONDecodeError:
+            # orjson rejects non-standard values, like NaN, that json.dump may write.
+            pass
+    except ImportError:
+        pass
+    result = json.loads(data)
+    return result
+
+
+# -----------------------------------------------------------------------------
+# Codecs
+# -----------------------------------------------------------------------------
+
+
+class Codec(ABC):
+    """Converts the data of a stored file to and from bytes."""
+
+    name: str
+    """The name used to select the codec in a store URI."""
+
+    @abstractmethod
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """Encodes the data to be written."""
+        raise NotImplementedError("Can't encode without a specific codec.")
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        """Decodes data that was read."""
+        raise NotImplementedError("Can't decode without a specific codec.")
+
+    @abstractmethod
+    def matches(self, data: bytes) -> bool:
+        """Checks, from its first bytes, if data was written by this codec."""
+        raise NotImplementedError("Can't match without a specific codec.")
+
+
+class JsonCodec(Codec):
+    """Indented JSON, the original format of stored files."""
+
+    name = "json"
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=4).encode("utf-8")
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        return _loads_json(data)
+
+    def matches(self, data: bytes) -> bool:
+        return data.lstrip()[:1] == b"{"
+
+
+class CompactJsonCodec(JsonCodec):
+    """JSON without indentation or extra separators."""
+
+    name = "json-compact"
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Compact JSON written with orjson, which is much faster for large files.
+    Note that orjson writes NaN and infinite values as null.
+    """
+
+    name = "orjson"
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        orjson = _import_optional("orjson", self.name)
+        result: bytes = orjson.dumps(data, default=_to_json_default)
+        return result
+
+
+class ZstdCodec(Codec):
+    """Compact JSON compressed with zstd."""
+
+    name = "zstd"
+
+    LEVEL = 3
+    """The compression level; the zstd default, which favors speed."""
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        zstandard = _import_optional("zstandard", self.name)
+        try:
+            encoded = OrjsonCodec().encode(data)
+        except RuntimeError:
+            encoded = CompactJsonCodec().encode(data)
+        result: bytes = zstandard.ZstdCompressor(level=self.LEVEL).compress(
+            encoded
+        )
+        return result
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        zstandard = _import_optional("zstandard", self.name)
+        return _loads_json(zstandard.ZstdDecompressor().decompress(data))
+
+    def matches(self, data: bytes) -> bool:
+        return data.startswith(ZSTD_MAGIC)
+
+
+class MsgpackCodec(Codec):
+    """Binary encoding with msgpack."""
+
+    name = "msgpack"
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        msgpack = _import_optional("msgpack", self.name)
+        result: bytes = msgpack.packb(
+            data, use_bin_type=True, default=_to_json_default
+        )
+        return result
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        msgpack = _import_optional("msgpack", self.name)
+        result: Dict[str, Any] = msgpack.unpackb(data, raw=False)
+        return result
+
+    def matches(self, data: bytes) -> bool:
+        return len(data) > 0 and data[0] in MSGPACK_MAP_MARKERS
+
+
+CODECS: Dict[str, Codec] = {
+    codec.name: codec
+    for codec in [
+        JsonCodec(),
+        CompactJsonCodec(),
+        OrjsonCodec(),
+        ZstdCodec(),
+        MsgpackCodec(),
+    ]
+}
+"""All available codecs, by name."""
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Gets a codec by name.
+    :param name: The name of the codec
+    :return: The codec
+    """
+    if name not in CODECS:
+        raise RuntimeError(
+            f"Unknown codec '{name}', valid ones are: {', '.join(CODECS)}"
+        )
+    return CODECS[name]
+
+
+def detect_codec(data: bytes) -> Codec:
+    """
+    Finds the codec that wrote some data, from its first bytes.
+    All JSON variants are detected as the default JSON codec, as they are decoded the same way.
+    :param data: The encoded data
+    :return: The codec to decode it with
+    """
+    for codec in _DETECTION_ORDER:
+        if codec.matches(data):
+            return codec
+    raise RuntimeError("Unable to detect the encoding of stored data.")
+
+
+_DETECTION_ORDER: List[Codec] = [
+    CODECS[JsonCodec.name],
+    CODECS[ZstdCodec.name],
+    CODECS[MsgpackCodec.name],
+]
+"""Codecs that can be told apart by their first bytes."""
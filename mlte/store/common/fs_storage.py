@@ -6,15 +6,55 @@ Common functions for file-based stores.
 
 from __future__ import annotations
 
+import os
 import shutil
+import threading
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
+from urllib.parse import parse_qsl
+
+from strenum import StrEnum
 
 import mlte.store.error as errors
-from mlte._private.fixed_json import json
 from mlte.store.base import StoreType, StoreURI
+from mlte.store.common.fs_codec import (
+    DEFAULT_CODEC,
+    Codec,
+    detect_codec,
+    get_codec,
+)
 from mlte.store.common.storage import Storage
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Not available on Windows; only in-process locking is done there.
+    fcntl = None  # type: ignore[assignment]
+
+OPTIONS_DELIMITER = "?"
+"""Separates the root path of a file system URI from its options."""
+
+FSYNC_OPTION = "fsync"
+"""URI option used to set the durability policy, e.g. fs://store?fsync=file."""
+
+CODEC_OPTION = "codec"
+"""URI option used to set the encoding of written files, e.g. fs://store?codec=zstd."""
+
+
+class FsyncPolicy(StrEnum):
+    """How much to wait for written data to reach the disk before returning."""
+
+    NONE = "none"
+    """Leave flushing to the OS; a crash can lose recent writes, but never leaves partial files."""
+
+    FILE = "file"
+    """Sync the contents of each written file before replacing the previous one."""
+
+    DIR = "dir"
+    """Sync each written file and also its folder, so the replace itself is durable."""
+
 
 def parse_root_path(uri: StoreURI) -> Path:
     """
@@ -25,7 +65,77 @@ def parse_root_path(uri: StoreURI) -> Path:
     if uri.type != StoreType.LOCAL_FILESYSTEM:
         raise RuntimeError(f"Not a valid file system URI: {uri.uri}")
 
-    return Path(uri.path)
+    return Path(uri.path.split(OPTIONS_DELIMITER)[0])
+
+
+def parse_options(uri: StoreURI) -> Dict[str, str]:
+    """
+    Parse the options given after the root path in a file system URI.
+    :param uri: The URI
+    :return: The options, by name
+    """
+    if OPTIONS_DELIMITER not in uri.path:
+        return {}
+    return dict(parse_qsl(uri.path.split(OPTIONS_DELIMITER, 1)[1]))
+
+
+# -----------------------------------------------------------------------------
+# Locking
+# -----------------------------------------------------------------------------
+
+_THREAD_LOCK_STRIPES = [threading.Lock() for _ in range(64)]
+"""
+Locks to serialize threads of this process, as OS file locks may not do so (e.g., on NFS).
+Paths are spread over a fixed number of locks, so callers must not nest file locks.
+"""
+
+
+@contextmanager
+def file_lock(path: Path, remove: bool = False) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock on a file, across threads and processes.
+
+    The lock is taken on a hidden sidecar file, so it is not affected by the file
+    being replaced or deleted while it is held.
+    :param path: The path of the file to lock
+    :param remove: Whether to remove the sidecar file before releasing the lock, once the file is deleted
+    """
+    lock_path = Path(path.parent, f".{path.name}.lock")
+    with _THREAD_LOCK_STRIPES[hash(str(lock_path)) % len(_THREAD_LOCK_STRIPES)]:
+        while True:
+            f = open(lock_path, "a")
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                # The holder we waited for may have removed the sidecar, so lock the current one.
+                if _is_same_file(f.fileno(), lock_path):
+                    break
+            except BaseException:
+                f.close()
+                raise
+            f.close()
+
+        try:
+            yield
+        finally:
+            if remove:
+                lock_path.unlink(missing_ok=True)
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            f.close()
+
+
+def _is_same_file(fd: int, path: Path) -> bool:
+    """Checks if an open file is still the one at a path."""
+    try:
+        return os.fstat(fd).st_ino == os.stat(path).st_ino
+    except FileNotFoundError:
+        return False
+
+
+# -----------------------------------------------------------------------------
+# JsonFileStorage
+# -----------------------------------------------------------------------------
 
 
 class JsonFileStorage:
@@ -55,21 +165,75 @@ class JsonFileStorage:
 
     @staticmethod
     def read_json_file(path: Path) -> Dict[str, Any]:
-        with path.open("r") as f:
-            data: Dict[str, Any] = json.load(f)
-        return data
+        # Files may have been written with any codec, so it is detected from the contents.
+        data = path.read_bytes()
+        return detect_codec(data).decode(data)
+
+    @staticmethod
+    def write_json_to_file(
+        path: Path,
+        data: Dict[str, Any],
+        fsync: FsyncPolicy = FsyncPolicy.NONE,
+        codec: Codec = get_codec(DEFAULT_CODEC),
+    ) -> None:
+        JsonFileStorage.write_bytes_to_file(path, codec.encode(data), fsync)
+
+    @staticmethod
+    def write_bytes_to_file(
+        path: Path, data: bytes, fsync: FsyncPolicy = FsyncPolicy.NONE
+    ) -> None:
+        JsonFileStorage.write_chunks_to_file(path, [data], fsync)
 
     @staticmethod
-    def write_json_to_file(path: Path, data: Dict[str, Any]) -> None:
-        with path.open("w") as f:
-            json.dump(data, f, indent=4)
+    def write_chunks_to_file(
+        path: Path,
+        chunks: Iterable[bytes],
+        fsync: FsyncPolicy = FsyncPolicy.NONE,
+    ) -> None:
+        # Write to a temporary file first so readers never see a partial file.
+        temp_path = Path(path.parent, f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with temp_path.open("xb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                if fsync != FsyncPolicy.NONE:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        if fsync == FsyncPolicy.DIR:
+            JsonFileStorage.sync_folder(path.parent)
 
     @staticmethod
-    def delete_file(path: Path) -> None:
+    def delete_file(path: Path, fsync: FsyncPolicy = FsyncPolicy.NONE) -> None:
         if not path.exists():
             raise RuntimeError(f"Path {path} does not exist.")
         path.unlink()
 
+        if fsync == FsyncPolicy.DIR:
+            JsonFileStorage.sync_folder(path.parent)
+
+    @staticmethod
+    def sync_folder(path: Path) -> None:
+        """Flushes changes to the entries of a folder to disk."""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def lock(path: Path, remove: bool = False):
+        """
+        Returns a context manager holding an exclusive lock on the given file.
+        :param path: The path of the file to lock
+        :param remove: Whether to remove the lock's sidecar file on release, for files being deleted
+        """
+        return file_lock(path, remove)
+
     @staticmethod
     def add_extension(filename: str) -> Path:
         return Path(filename + JsonFileStorage.JSON_EXT)
@@ -96,6 +260,19 @@ class FileSystemStorage(Storage, JsonFileStorage):
         self.sub_folder = sub_folder
         """The specific folder for this storage."""
 
+        options = parse_options(uri)
+        fsync = options.get(FSYNC_OPTION, FsyncPolicy.NONE)
+        if fsync not in list(FsyncPolicy):
+            raise RuntimeError(
+                f"Invalid {FSYNC_OPTION} option in URI {uri.uri}, valid ones are: {', '.join(FsyncPolicy)}"
+            )
+
+        self.fsync = FsyncPolicy(fsync)
+        """How writes are flushed to disk."""
+
+        self.codec = get_codec(options.get(CODEC_OPTION, DEFAULT_CODEC))
+        """How written files are encoded; files are always decoded with the codec that wrote them."""
+
         self.set_base_path(Path(sub_folder))
 
     def set_base_path(self, sub_folder: Path):
@@ -133,13 +310,17 @@ class FileSystemStorage(Storage, JsonFileStorage):
         self, resource_id: str, resource_data: Dict[str, Any]
     ) -> None:
         """Writes the given resource to storage."""
-        JsonFileStorage.write_json_to_file(
-            self._resource_path(resource_id), resource_data
-        )
+        path = self._resource_path(resource_id)
+        with JsonFileStorage.lock(path):
+            JsonFileStorage.write_json_to_file(
+                path, resource_data, self.fsync, self.codec
+            )
 
     def delete_resource(self, resource_id: str) -> None:
         """Deletes the file for the associated resource id."""
-        JsonFileStorage.delete_file(self._resource_path(resource_id))
+        path = self._resource_path(resource_id)
+        with JsonFileStorage.lock(path, remove=True):
+            JsonFileStorage.delete_file(path, self.fsync)
 
     def ensure_resource_does_not_exist(self, resource_id: str) -> None:
         """Throws an ErrorAlreadyExists if the given resource does exist."""
@@ -172,3 +353,26 @@ class FileSystemStorage(Storage, JsonFileStorage):
         :return: The resource id
         """
         return JsonFileStorage.get_just_filename(resource_path)
+
+
+def reencode_files(root: Path, codec: Codec, fsync: FsyncPolicy) -> int:
+    """
+    Re-encodes, in place, all stored files under a folder with the given codec.
+    :param root: The folder to process, recursively
+    :param codec: The codec to encode files with
+    :param fsync: The durability policy for the rewritten files
+    :return: The number of files that were re-encoded
+    """
+    count = 0
+    for path in sorted(root.rglob(f"*{JsonFileStorage.JSON_EXT}")):
+        if not path.is_file():
+            continue
+        with JsonFileStorage.lock(path):
+            data = path.read_bytes()
+            decoded = detect_codec(data).decode(data)
+            if codec.encode(decoded) == data:
+                # Already encoded with this codec.
+                continue
+            JsonFileStorage.write_json_to_file(path, decoded, fsync, codec)
+        count += 1
+    return count
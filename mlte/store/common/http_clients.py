@@ -6,15 +6,34 @@ HTTP clients that can be used by underlying stores to access remote HTTP stores.
 
 from __future__ import annotations
 
+import threading
+import time
+import typing
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+from urllib.parse import urlencode
 
 import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 import mlte._private.url as url_utils
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
+from mlte._private.fixed_json import json
+from mlte.backend.api.etag import ETAG_HEADER, IF_NONE_MATCH_HEADER
 
 
 class HttpClientType(Enum):
@@ -30,6 +49,78 @@ class HttpClientType(Enum):
 HttpResponse = Union[requests.Response, httpx.Response]
 """Standard HTTP response, both have same implicit interface."""
 
+DEFAULT_POOL_SIZE = 10
+"""Default number of connections kept alive per host by pooled clients."""
+
+TOKEN_EXPIRY_MARGIN = 30
+"""Seconds before its expiration at which a token is no longer reused, and a new one is requested."""
+
+DEFAULT_CACHE_SIZE = 256
+"""Default number of tagged responses kept by a client to revalidate."""
+
+
+class CachedResponse:
+    """The body and headers of a successful response, with the tag the server gave it, if any."""
+
+    def __init__(
+        self, content: bytes, headers: Mapping[str, str], etag: Optional[str]
+    ) -> None:
+        self.content = content
+        """The raw body."""
+
+        self.headers = headers
+        """The response headers."""
+
+        self.etag = etag
+        """The tag of the body, to send back to the server to revalidate it."""
+
+    def json(self) -> Any:
+        """Parses the body; parsed again on each call, so callers can't change cached data."""
+        return json.loads(self.content)
+
+
+class ResponseCache:
+    """Responses tagged by the server, kept so they can be revalidated instead of downloaded again."""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        """Maximum number of responses; the least recently used are dropped first."""
+
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        """The cached responses, by URL including its query."""
+
+        self._lock = threading.Lock()
+        """Lock for the entries, as clients may be shared across threads."""
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Gets a cached response.
+        :param key: The URL of the request, including its query
+        :return: The response, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        """
+        Caches a response.
+        :param key: The URL of the request, including its query
+        :param response: The response
+        """
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops all responses."""
+        with self._lock:
+            self._entries.clear()
+
 
 class HttpClient:
     """Interface for an HTTP client."""
@@ -38,6 +129,9 @@ class HttpClient:
         self.type = type
         self.headers: dict[str, str] = {}
 
+        self.response_cache = ResponseCache()
+        """Responses of GET requests tagged by the server, to revalidate them."""
+
     def get(self, url: str, **kwargs) -> HttpResponse:
         raise NotImplementedError("get()")
 
@@ -54,6 +148,83 @@ class HttpClient:
     def delete(self, url: str, **kwargs) -> HttpResponse:
         raise NotImplementedError("delete()")
 
+    def close(self) -> None:
+        """Release the connections held by the client, if any."""
+        pass
+
+    def get_cached(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> CachedResponse:
+        """
+        Send a GET request, revalidating a previous response to it if one is cached, and
+        raise an error if it fails.
+        :param url: The URL
+        :param params: The query parameters
+        :return: The response, either the cached one if the server did not modify it, or the new one
+        """
+        key = url if not params else f"{url}?{urlencode(params, doseq=True)}"
+        cached = self.response_cache.get(key)
+        headers = (
+            {}
+            if cached is None or cached.etag is None
+            else {IF_NONE_MATCH_HEADER: cached.etag}
+        )
+
+        response = self.get(url, params=params, headers=headers)
+        if cached is not None and response.status_code == codes.NOT_MODIFIED:
+            return cached
+        self.raise_for_response(response)
+
+        result = CachedResponse(
+            response.content,
+            CaseInsensitiveDict(response.headers),
+            response.headers.get(ETAG_HEADER),
+        )
+        if result.etag is not None:
+            self.response_cache.put(key, result)
+        return result
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs,
+    ) -> ContextManager[HttpResponse]:
+        """
+        Send a request whose response body is only received as it is iterated.
+        :param method: The HTTP method
+        :param url: The URL
+        :param headers: Headers to send in addition to the client's own
+        :return: A context manager with the response, closing it on exit
+        """
+        raise NotImplementedError("stream()")
+
+    @staticmethod
+    def iter_lines(response: HttpResponse) -> Iterator[str]:
+        """
+        Iterate over the non-empty lines of a streamed response body.
+        :param response: The response object
+        :return: An iterator over the lines
+        """
+        for line in response.iter_lines():
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            if line:
+                yield line
+
+    @staticmethod
+    def iter_bytes(response: HttpResponse, chunk_size: int) -> Iterator[bytes]:
+        """
+        Iterate over a streamed response body in chunks of raw bytes.
+        :param response: The response object
+        :param chunk_size: The maximum size of each chunk
+        :return: An iterator over the chunks
+        """
+        if isinstance(response, requests.Response):
+            return response.iter_content(chunk_size)
+        return response.iter_bytes(chunk_size)
+
     @staticmethod
     def raise_for_response(response: HttpResponse) -> None:
         """
@@ -62,6 +233,9 @@ class HttpClient:
         """
         if response.status_code == codes.OK:
             return
+        if isinstance(response, httpx.Response):
+            # Streamed error responses must be read before their content is available.
+            response.read()
         if response.status_code == codes.NOT_FOUND:
             raise errors.ErrorNotFound(f"{response.json()}")
         if response.status_code == codes.ALREADY_EXISTS:
@@ -95,6 +269,18 @@ class OAuthHttpClient(HttpClient):
         self.access_token: Optional[str] = None
         """The access token."""
 
+        self.token_expiration: Optional[float] = None
+        """Time (as in time.monotonic()) after which the token is not reused, or None if it does not expire."""
+
+        self.api_url: Optional[str] = None
+        """The URL of the API the client last authenticated against, to refresh the token."""
+
+        self.authenticated_username: Optional[str] = None
+        """The user the client last authenticated as."""
+
+        self._token_lock = threading.RLock()
+        """Lock to request one token at a time, as the client may be shared across threads."""
+
         self.username = username
         """The username to use when authenticating."""
 
@@ -109,11 +295,74 @@ class OAuthHttpClient(HttpClient):
         payload.update({"username": username, "password": password})
         return payload
 
-    def _store_token(self, access_token: str):
+    def _store_token(self, access_token: str, expires_in: Optional[int] = None):
         """Stores the token and sets proper headers."""
         if access_token is not None:
             self.access_token = access_token
-            self.headers = {"Authorization": f"Bearer {self.access_token}"}
+            # Replaced in one step, as other threads send requests with the headers meanwhile.
+            self.headers = {"Authorization": f"Bearer {access_token}"}
+            self.token_expiration = (
+                None
+                if expires_in is None
+                else time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN
+            )
+
+    def has_valid_token(self) -> bool:
+        """Checks if there is a token that has not expired yet."""
+        return self.access_token is not None and (
+            self.token_expiration is None
+            or time.monotonic() < self.token_expiration
+        )
+
+    def ensure_authenticated(self, api_url: str) -> None:
+        """
+        Authenticates only if there is no token for the given API that can still be reused.
+        :param api_url: The URL of the API
+        """
+        if self.api_url == api_url and self.has_valid_token():
+            return
+        with self._token_lock:
+            # Another thread may have authenticated while we waited for the lock.
+            if self.api_url == api_url and self.has_valid_token():
+                return
+            self.authenticate(api_url)
+
+    def _send_with_refresh(
+        self, send: Callable[[], HttpResponse], retry: bool = True
+    ) -> HttpResponse:
+        """
+        Sends a request and, if it is rejected because the token expired, gets a new token and sends it again.
+        :param send: Function that sends the request with the current headers
+        :param retry: Whether the request can be sent again; not the case for bodies read from iterators
+        :return: The response
+        """
+        access_token = self.access_token
+        response = send()
+        if (
+            response.status_code != codes.UNAUTHORIZED
+            or not retry
+            or self.api_url is None
+            or access_token is None
+        ):
+            return response
+
+        response.close()
+        with self._token_lock:
+            # Only get a new token if another thread did not already replace the rejected one.
+            if self.access_token == access_token:
+                self.authenticate(self.api_url)
+        return send()
+
+    def send_token_request(
+        self, url: str, data: Dict[str, str]
+    ) -> HttpResponse:
+        """
+        Sends a token request, with only the headers it needs, leaving the client's headers in use.
+        :param url: The URL of the token endpoint
+        :param data: The form data with the credentials
+        :return: The response
+        """
+        raise NotImplementedError("send_token_request()")
 
     def authenticate(
         self,
@@ -136,29 +385,40 @@ class OAuthHttpClient(HttpClient):
                     "Can't authenticate without password, no internal or argument password received."
                 )
 
-        # Send authentication request to get token.
-        self.headers = self.TOKEN_REQ_HEADERS
-        url = f"{api_url}{self.TOKEN_ENDPOINT}"
-        response = self.post(
-            url,
-            data=self._format_oauth_password_payload(username, password),
-        )
-        self.headers = {}
-        if response.status_code != codes.OK:
-            reply = response.content.decode("utf-8")
-            raise Exception(
-                f"Token request was unsuccessful - code: {response.status_code}, reply: {reply}"
+        # Send authentication request to get token, one at a time.
+        with self._token_lock:
+            response = self.send_token_request(
+                f"{api_url}{self.TOKEN_ENDPOINT}",
+                self._format_oauth_password_payload(username, password),
             )
+            if response.status_code != codes.OK:
+                # The previous token, possibly of another user, is not used anymore.
+                self.access_token = None
+                self.headers = {}
+                reply = response.content.decode("utf-8")
+                raise Exception(
+                    f"Token request was unsuccessful - code: {response.status_code}, reply: {reply}"
+                )
 
-        # Process reply and store token.
-        response_data = response.json()
-        if response_data is None:
-            raise Exception(
-                "Did not receive any valid response for token request."
+            # Process reply and store token.
+            response_data = response.json()
+            if response_data is None:
+                raise Exception(
+                    "Did not receive any valid response for token request."
+                )
+            if "access_token" not in response_data:
+                raise Exception("Access token was not contained in response.")
+            self._store_token(
+                response_data["access_token"], response_data.get("expires_in")
             )
-        if "access_token" not in response_data:
-            raise Exception("Access token was not contained in response.")
-        self._store_token(response_data["access_token"])
+            if (self.api_url, self.authenticated_username) != (
+                api_url,
+                username,
+            ):
+                # Responses for another user or server can't be revalidated for this one.
+                self.response_cache.clear()
+            self.api_url = api_url
+            self.authenticated_username = username
 
     def process_credentials(self, uri: str) -> str:
         """Obtains user and password from uri for client auth, and returns cleaned up uri."""
@@ -173,37 +433,85 @@ class OAuthHttpClient(HttpClient):
 
 
 class RequestsClient(OAuthHttpClient):
-    """Client implementation using requests library."""
+    """Client implementation using requests library, keeping connections alive in a pool."""
 
     def __init__(
-        self, username: Optional[str] = None, password: Optional[str] = None
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
     ) -> None:
         super().__init__(HttpClientType.REQUESTS, username, password)
 
+        self.session = requests.Session()
+        """The session, reusing connections across requests."""
+
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def get(self, url: str, **kwargs) -> requests.Response:
-        return requests.get(url, headers=self.headers, **kwargs)
+        return self._request("GET", url, **kwargs)
 
     def post(
         self, url: str, data: Any = None, json: Any = None, **kwargs
     ) -> requests.Response:
-        return requests.post(
-            url,
-            headers=self.headers,
-            data=data,
-            json=json,
-            **kwargs,
-        )
+        return self._request("POST", url, data=data, json=json, **kwargs)
 
     def put(
         self, url: str, data: Any = None, json: Any = None, **kwargs
     ) -> requests.Response:
-        return requests.put(
-            url,
-            headers=self.headers,
-            data=data,
-            json=json,
-            **kwargs,
-        )
+        return self._request("PUT", url, data=data, json=json, **kwargs)
 
     def delete(self, url: str, **kwargs) -> requests.Response:
-        return requests.delete(url, headers=self.headers, **kwargs)
+        return self._request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def send_token_request(
+        self, url: str, data: Dict[str, str]
+    ) -> requests.Response:
+        return self.session.request(
+            "POST", url, headers=dict(self.TOKEN_REQ_HEADERS), data=data
+        )
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs,
+    ) -> Iterator[requests.Response]:
+        with self._request(
+            method, url, headers=headers, stream=True, **kwargs
+        ) as response:
+            yield response
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request through the session, with the client headers plus the given ones.
+        :param method: The HTTP method
+        :param url: The URL
+        :param headers: Headers to send in addition to the client's own
+        :return: The response
+        """
+        return typing.cast(
+            requests.Response,
+            self._send_with_refresh(
+                lambda: self.session.request(
+                    method,
+                    url,
+                    headers={**self.headers, **(headers or {})},
+                    **kwargs,
+                ),
+                retry=not isinstance(kwargs.get("data"), Iterator),
+            ),
+        )
@@ -38,5 +38,5 @@ class HttpStorage(Storage):
         """Store the clean URL without credentials."""
 
     def start_session(self):
-        # Authenticate.
-        self.client.authenticate(f"{self.clean_url}{API_PREFIX}")
+        # Authenticate, unless the token from a previous session is still valid.
+        self.client.ensure_authenticated(f"{self.clean_url}{API_PREFIX}")
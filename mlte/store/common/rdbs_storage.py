@@ -6,7 +6,8 @@ Base RDBS store.
 
 from __future__ import annotations
 
-from typing import Callable, Optional
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import sqlalchemy
 import sqlalchemy.orm
@@ -16,6 +17,30 @@ from sqlalchemy.orm import DeclarativeBase
 from mlte.store.base import StoreURI
 from mlte.store.common.storage import Storage
 
+POOL_OPTIONS: Dict[str, Callable[[str], Any]] = {
+    "pool_size": int,
+    "max_overflow": int,
+    "pool_timeout": float,
+    "pool_recycle": int,
+    "pool_pre_ping": lambda value: value.lower() in ["1", "true", "yes"],
+}
+"""Connection pool options that can be set as query parameters of a store URI, and how to parse them."""
+
+
+def parse_pool_options(uri: str) -> Tuple[sqlalchemy.URL, Dict[str, Any]]:
+    """
+    Takes the connection pool options out of a DB URI.
+    :param uri: The DB URI, which may have pool options as query parameters
+    :return: The URI without the pool options, and the parsed options
+    """
+    url = sqlalchemy.make_url(uri)
+    options: Dict[str, Any] = {}
+    for name, parse in POOL_OPTIONS.items():
+        value = url.query.get(name)
+        if isinstance(value, str):
+            options[name] = parse(value)
+    return url.difference_update_query(POOL_OPTIONS.keys()), options
+
 
 class RDBStorage(Storage):
     """Helper to setup RDB storage.."""
@@ -25,12 +50,22 @@ class RDBStorage(Storage):
         uri: StoreURI,
         base_class: DeclarativeBase,
         init_tables_func: Optional[Callable[[sqlalchemy.Engine], None]],
+        read_uris: Optional[List[str]] = None,
         **kwargs,
     ) -> None:
         super().__init__(uri)
 
-        self.engine = sqlalchemy.create_engine(uri.uri, **kwargs)
-        """The underlying DB engine access."""
+        self.engine = self._create_engine(uri.uri, **kwargs)
+        """The underlying DB engine access; its connection pool lives until the storage is closed."""
+
+        self.read_engines = [
+            self._create_engine(read_uri, **kwargs)
+            for read_uri in read_uris or []
+        ]
+        """Engines for read replicas of the DB, if any; they are only read, and are never set up here."""
+
+        self._read_turns = itertools.count()
+        """Counter to spread reads over the replicas in turns."""
 
         # Create the DB if it doesn't exist already.
         if not sqlalchemy_utils.database_exists(self.engine.url):
@@ -41,10 +76,30 @@ class RDBStorage(Storage):
         if init_tables_func:
             init_tables_func(self.engine)
 
+    @staticmethod
+    def _create_engine(uri: str, **kwargs) -> sqlalchemy.Engine:
+        """Creates an engine for a DB URI, with the pool options set in it or in the given arguments."""
+        # Pool options in the URI are taken out of it, as they are for the engine and not the DB driver.
+        url, pool_options = parse_pool_options(uri)
+        return sqlalchemy.create_engine(url, **{**kwargs, **pool_options})
+
+    def read_engine(self) -> sqlalchemy.Engine:
+        """
+        Gets the engine to use for a read, taking replicas in turns.
+        :return: The next replica's engine, or the primary one if there are no replicas
+        """
+        if len(self.read_engines) == 0:
+            return self.engine
+        return self.read_engines[
+            next(self._read_turns) % len(self.read_engines)
+        ]
+
     def _create_tables(self, base_class: DeclarativeBase):
         """Creates all items, if they don't exist already."""
         base_class.metadata.create_all(self.engine)
 
     def close(self):
-        """Cleanup."""
+        """Cleanup, closing all pooled connections. Only to be called when the store is no longer used."""
         self.engine.dispose()
+        for read_engine in self.read_engines:
+            read_engine.dispose()
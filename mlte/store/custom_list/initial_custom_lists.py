@@ -27,17 +27,21 @@ class InitialCustomLists:
     @staticmethod
     def setup_custom_list_store(
         stores_uri: StoreURI,
+        add_initial_lists: bool = True,
     ) -> CustomListStore:
         """
         Sets up a custom list store with the initial custom lists.
 
         :param stores_uri: The URI of the store being used (i.e., base folder, base DB, etc).
+        :param add_initial_lists: Whether to add the initial entries; not needed if another process already did.
         :return: A custom list store populated with the initial entries.
         """
-        # Create the initial custom lists.
-        print(f"Creating initial custom lists at URI: {stores_uri}")
         custom_list_store = create_custom_list_store(stores_uri.uri)
+        if not add_initial_lists:
+            return custom_list_store
 
+        # Create the initial custom lists.
+        print(f"Creating initial custom lists at URI: {stores_uri}")
         with ManagedCustomListSession(custom_list_store.session()) as session:
             num_categories = 0
             for json_data in get_json_resources(qa_category_entries):
@@ -33,3 +33,9 @@ class ForbiddenError(RuntimeError):
     """User without permissions for the operation."""
 
     pass
+
+
+class InvalidCursorError(RuntimeError):
+    """A pagination cursor that could not be decoded by the store."""
+
+    pass
@@ -11,19 +11,23 @@ from mlte.store.user.underlying.memory import InMemoryUserStore
 from mlte.store.user.underlying.rdbs.store import RelationalDBUserStore
 
 
-def create_user_store(uri: str) -> UserStore:
+def create_user_store(
+    uri: str, add_default_data: bool = True, **kwargs
+) -> UserStore:
     """
     Create a MLTE user store instance.
     :param uri: The URI for the store instance
+    :param add_default_data: Whether to add the default user and permissions, if missing
+    :param kwargs: Options for the DB engine of relational DB stores, such as its connection pool
     :return: The store instance
     """
     parsed_uri = StoreURI.from_string(uri)
     if parsed_uri.type == StoreType.LOCAL_MEMORY:
-        return InMemoryUserStore(parsed_uri)
+        return InMemoryUserStore(parsed_uri, add_default_data)
     if parsed_uri.type == StoreType.RELATIONAL_DB:
-        return RelationalDBUserStore(parsed_uri)
+        return RelationalDBUserStore(parsed_uri, add_default_data, **kwargs)
     if parsed_uri.type == StoreType.LOCAL_FILESYSTEM:
-        return FileSystemUserStore(parsed_uri)
+        return FileSystemUserStore(parsed_uri, add_default_data)
     else:
         raise Exception(
             f"Store can't be created, unknown or unsupported URI prefix received for uri {parsed_uri}"
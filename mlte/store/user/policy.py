@@ -6,7 +6,6 @@ Class to define group and permission policies.
 
 from typing import Any, List, Optional
 
-import mlte.store.error as errors
 from mlte.store.artifact.store import ArtifactStoreSession
 from mlte.store.user.store_session import UserStoreSession
 from mlte.user.model import (
@@ -27,9 +26,30 @@ def create_model_policies_if_needed(
     This is for cases where the model may have been created without the API.
     """
     models = artifact_store.list_models()
+
+    # Check and create the policies of all models together, only for the parts that are missing.
+    permissions: List[Permission] = []
+    groups: List[Group] = []
     for model_id in models:
-        if not Policy.is_stored(ResourceType.MODEL, model_id, user_store):
-            Policy.create(ResourceType.MODEL, model_id, user_store)
+        permissions.extend(
+            Policy.build_permissions(ResourceType.MODEL, model_id)
+        )
+        groups.extend(Policy.build_groups(ResourceType.MODEL, model_id))
+
+    stored_permissions, stored_groups = user_store.find_stored_policies(
+        [permission.to_str() for permission in permissions],
+        [group.name for group in groups],
+    )
+    missing_permissions = [
+        permission
+        for permission in permissions
+        if permission.to_str() not in stored_permissions
+    ]
+    missing_groups = [
+        group for group in groups if group.name not in stored_groups
+    ]
+    if len(missing_permissions) > 0 or len(missing_groups) > 0:
+        user_store.create_policies(missing_permissions, missing_groups)
 
 
 class Policy:
@@ -134,6 +154,20 @@ class Policy:
 
         return groups
 
+    @staticmethod
+    def build_permissions(
+        resource_type: ResourceType, resource_id: Any = None
+    ) -> List[Permission]:
+        """Generates in memory representations of the permissions for each method type on the given resource."""
+        return [
+            Permission(
+                resource_type=resource_type,
+                resource_id=resource_id,
+                method=method,
+            )
+            for method in MethodType
+        ]
+
     @staticmethod
     def is_stored(
         resource_type: ResourceType,
@@ -141,26 +175,24 @@ class Policy:
         user_store: UserStoreSession,
     ) -> bool:
         """Checks if the given resource type and id has a policy stored in the DB for them."""
-        try:
-            # Try to read all permissions.
-            for method in MethodType:
-                _ = user_store.permission_mapper.read(
-                    Permission(
-                        resource_type=resource_type,
-                        resource_id=resource_id,
-                        method=method,
-                    ).to_str()
-                )
-
-                # Try to read all groups.
-                for group in Policy.build_groups(resource_type, resource_id):
-                    _ = user_store.group_mapper.read(group.name)
-        except errors.ErrorNotFound:
-            # At least one permission or group is missing.
-            return False
-
-        # If we found everything, policy is complete.
-        return True
+        permissions = [
+            permission.to_str()
+            for permission in Policy.build_permissions(
+                resource_type, resource_id
+            )
+        ]
+        group_names = [
+            group.name
+            for group in Policy.build_groups(resource_type, resource_id)
+        ]
+
+        # The policy is complete only if all permissions and groups were found.
+        stored_permissions, stored_groups = user_store.find_stored_policies(
+            permissions, group_names
+        )
+        return len(stored_permissions) == len(set(permissions)) and len(
+            stored_groups
+        ) == len(set(group_names))
 
     @staticmethod
     def create(
@@ -171,20 +203,11 @@ class Policy:
     ):
         """Sets up groups and permissions for a given resource type and id."""
 
-        # Create a permission for each method type and this resource.
-        for method in MethodType:
-            user_store.permission_mapper.create(
-                Permission(
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    method=method,
-                )
-            )
-
-        # Create a group with read permissions.
+        # Create a permission for each method type and this resource, and the groups with them.
         policy_groups = Policy.build_groups(resource_type, resource_id)
-        for group in policy_groups:
-            user_store.group_mapper.create(group)
+        user_store.create_policies(
+            Policy.build_permissions(resource_type, resource_id), policy_groups
+        )
 
         # Add current user, if any, to all groups.
         if user and not user.role == RoleType.ADMIN:
@@ -199,16 +222,15 @@ class Policy:
         user_store: UserStoreSession,
     ):
         """Delete groups and permissions for a resource."""
-
-        # TODO: This is not atomic. Error deleting one part may leave the rest dangling.
-        for group in Policy.build_groups(resource_type, resource_id):
-            user_store.group_mapper.delete(group.name)
-
-        for method in MethodType:
-            user_store.permission_mapper.delete(
-                Permission(
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    method=method,
-                ).to_str()
-            )
+        user_store.delete_policies(
+            [
+                permission.to_str()
+                for permission in Policy.build_permissions(
+                    resource_type, resource_id
+                )
+            ],
+            [
+                group.name
+                for group in Policy.build_groups(resource_type, resource_id)
+            ],
+        )
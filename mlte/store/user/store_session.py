@@ -6,8 +6,9 @@ MLTE user store interface implementation.
 
 from __future__ import annotations
 
-from typing import Any, List, Union, cast
+from typing import Any, Container, List, Set, Tuple, Union, cast
 
+import mlte.store.error as errors
 from mlte.store.base import ManagedSession, ResourceMapper, StoreSession
 from mlte.user.model import BasicUser, Group, Permission, User, UserWithPassword
 
@@ -28,6 +29,156 @@ class UserStoreSession(StoreSession):
     permission_mapper: PermissionMapper
     """Mapper for the permission resource."""
 
+    def find_stored_policies(
+        self, permissions: List[str], group_names: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Checks which of the given permissions and groups are stored. By default all stored ones are
+        listed once; stores that can check only the given ones in a single query override this.
+        :param permissions: The string representations of the permissions
+        :param group_names: The names of the groups
+        :return: The permissions and the group names, out of the given ones, that are stored
+        """
+        stored_permissions = set(self.permission_mapper.list())
+        stored_groups = set(self.group_mapper.list())
+        return (
+            {p for p in permissions if p in stored_permissions},
+            {g for g in group_names if g in stored_groups},
+        )
+
+    def create_policies(
+        self, permissions: List[Permission], groups: List[Group]
+    ) -> None:
+        """
+        Create several permissions, and groups made of them, at once. By default all are checked
+        first, so nothing is created if any of them already exists, and then created one at a
+        time; stores that can create them in a single transaction override this.
+        :param permissions: The permissions
+        :param groups: The groups, which may refer to the new permissions or to stored ones
+        :raises ErrorAlreadyExists: If a permission or group exists, or is repeated
+        :raises ErrorNotFound: If a group refers to a permission that is neither stored nor new
+        """
+        new_permissions = [permission.to_str() for permission in permissions]
+        stored_permissions, stored_groups = self.find_stored_policies(
+            new_permissions + get_group_permissions(groups),
+            [group.name for group in groups],
+        )
+        check_new_policies(
+            new_permissions,
+            [group.name for group in groups],
+            stored_permissions,
+            stored_groups,
+        )
+        check_group_permissions(
+            groups, stored_permissions.union(new_permissions)
+        )
+
+        for permission in permissions:
+            self.permission_mapper.create(permission)
+        for group in groups:
+            self.group_mapper.create(group)
+
+    def delete_policies(
+        self, permissions: List[str], group_names: List[str]
+    ) -> None:
+        """
+        Delete several permissions and groups at once. By default all are checked first, so
+        nothing is deleted if any of them is missing, and then deleted one at a time; stores
+        that can delete them in a single transaction override this.
+        :param permissions: The string representations of the permissions
+        :param group_names: The names of the groups
+        :raises ErrorNotFound: If a permission or group is not stored
+        """
+        stored_permissions, stored_groups = self.find_stored_policies(
+            permissions, group_names
+        )
+        check_stored_policies(
+            permissions, group_names, stored_permissions, stored_groups
+        )
+
+        for group_name in group_names:
+            self.group_mapper.delete(group_name)
+        for permission in permissions:
+            self.permission_mapper.delete(permission)
+
+
+def check_new_policies(
+    permissions: List[str],
+    group_names: List[str],
+    stored_permissions: Container[str],
+    stored_groups: Container[str],
+) -> None:
+    """
+    Checks that none of the permissions and groups to create is stored or repeated.
+    :param permissions: The string representations of the permissions to create
+    :param group_names: The names of the groups to create
+    :param stored_permissions: The permissions that are already stored
+    :param stored_groups: The names of the groups that are already stored
+    :raises ErrorAlreadyExists: If a permission or group exists, or is repeated
+    """
+    for kind, ids, stored in [
+        ("Permission", permissions, stored_permissions),
+        ("Group", group_names, stored_groups),
+    ]:
+        seen: Set[str] = set()
+        for id in ids:
+            if id in stored or id in seen:
+                raise errors.ErrorAlreadyExists(f"{kind} {id}")
+            seen.add(id)
+
+
+def get_group_permissions(groups: List[Group]) -> List[str]:
+    """
+    Lists the permissions the groups are made of.
+    :param groups: The groups
+    :return: The string representations of the permissions of all groups
+    """
+    return [
+        permission.to_str()
+        for group in groups
+        for permission in group.permissions
+    ]
+
+
+def check_group_permissions(
+    groups: List[Group], permissions: Container[str]
+) -> None:
+    """
+    Checks that all the permissions the groups to create are made of are available.
+    :param groups: The groups to create
+    :param permissions: The permissions that are stored or being created
+    :raises ErrorNotFound: If a group refers to a permission that is not available
+    """
+    for group in groups:
+        for permission in group.permissions:
+            if permission.to_str() not in permissions:
+                raise errors.ErrorNotFound(
+                    f"Permission {permission.to_str()} of group {group.name}"
+                )
+
+
+def check_stored_policies(
+    permissions: List[str],
+    group_names: List[str],
+    stored_permissions: Container[str],
+    stored_groups: Container[str],
+) -> None:
+    """
+    Checks that all the permissions and groups to delete are stored.
+    :param permissions: The string representations of the permissions to delete
+    :param group_names: The names of the groups to delete
+    :param stored_permissions: The permissions that are stored
+    :param stored_groups: The names of the groups that are stored
+    :raises ErrorNotFound: If a permission or group is not stored
+    """
+    for kind, ids, stored in [
+        ("Permission", permissions, stored_permissions),
+        ("Group", group_names, stored_groups),
+    ]:
+        for id in ids:
+            if id not in stored:
+                raise errors.ErrorNotFound(f"{kind} {id}")
+
 
 class ManagedUserSession(ManagedSession):
     """A simple context manager for store sessions."""
@@ -38,14 +38,14 @@ class FileSystemUserStore(UserStore):
     BASE_USERS_FOLDER = "users"
     """Base folder to store users store in."""
 
-    def __init__(self, uri: StoreURI) -> None:
+    def __init__(self, uri: StoreURI, add_default_data: bool = True) -> None:
         self.storage = FileSystemStorage(
             uri=uri, sub_folder=self.BASE_USERS_FOLDER
         )
         """Underlying storage."""
 
         # Initialize defaults.
-        super().__init__(uri=uri)
+        super().__init__(uri=uri, add_default_data=add_default_data)
 
     def session(self) -> FileSystemUserStoreSession:
         """
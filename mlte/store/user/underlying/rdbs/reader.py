@@ -6,10 +6,10 @@ DB utils for getting user related data from the DB.
 
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 import mlte.store.error as errors
 from mlte.store.user.underlying.rdbs.metadata import (
@@ -28,6 +28,9 @@ from mlte.user.model import (
     User,
 )
 
+QUERY_BATCH_SIZE = 500
+"""Maximum number of values in a single IN clause, to stay below DB parameter limits."""
+
 
 class DBReader:
     """Class encapsulating functions to read user related data from the DB."""
@@ -74,19 +77,39 @@ class DBReader:
         else:
             return (DBReader._build_group(group_obj, session), group_obj)
 
+    @staticmethod
+    def get_group_objs(
+        group_names: List[str], session: Session
+    ) -> Dict[str, DBGroup]:
+        """Reads the groups with the given names that exist, in as few queries as possible, by name."""
+        group_objs: Dict[str, DBGroup] = {}
+        unique_names = list(dict.fromkeys(group_names))
+        for start in range(0, len(unique_names), QUERY_BATCH_SIZE):
+            for group_obj in session.scalars(
+                select(DBGroup).where(
+                    DBGroup.name.in_(
+                        unique_names[start : start + QUERY_BATCH_SIZE]
+                    )
+                )
+            ):
+                group_objs[group_obj.name] = group_obj
+        return group_objs
+
     @staticmethod
     def _build_group(
         group_obj: DBGroup,
         session: Session,
     ) -> Group:
         """Builds a Group object out of its DB model."""
-        all_permissions, all_permissions_db = DBReader.get_permissions(session)
+        # Only the group's own permissions are loaded, in the order they were stored.
         return Group(
             name=group_obj.name,
             permissions=[
-                all_permissions[i]
-                for i, permission_obj in enumerate(all_permissions_db)
-                if group_obj in permission_obj.groups
+                DBReader._build_permission(permission_obj)
+                for permission_obj in sorted(
+                    group_obj.permissions,
+                    key=lambda permission_obj: permission_obj.id,
+                )
             ],
         )
 
@@ -119,17 +142,58 @@ class DBReader:
         permissions_obj = list(
             session.execute(select(DBPermission)).scalars().all()
         )
-        permissions: List[Permission] = []
-        for permission_obj in permissions_obj:
-            permission = Permission(
-                resource_type=ResourceType(permission_obj.resource_type),
-                resource_id=permission_obj.resource_id,
-                method=MethodType(permission_obj.method_type.name),
-            )
-            permissions.append(permission)
+        permissions: List[Permission] = [
+            DBReader._build_permission(permission_obj)
+            for permission_obj in permissions_obj
+        ]
 
         return permissions, permissions_obj
 
+    @staticmethod
+    def get_permission_objs(
+        permissions: List[str], session: Session
+    ) -> Dict[str, DBPermission]:
+        """Reads the permissions out of the given ones that exist, filtering by resource in the query, by their string representation."""
+        wanted = set(permissions)
+        resource_ids: Dict[str, Set[Optional[str]]] = {}
+        for permission in map(Permission.from_str, wanted):
+            resource_ids.setdefault(permission.resource_type, set()).add(
+                permission.resource_id
+            )
+
+        permission_objs: Dict[str, DBPermission] = {}
+        for resource_type, ids in resource_ids.items():
+            named_ids = [id for id in ids if id is not None]
+            conditions = [
+                DBPermission.resource_id.in_(
+                    named_ids[start : start + QUERY_BATCH_SIZE]
+                )
+                for start in range(0, len(named_ids), QUERY_BATCH_SIZE)
+            ]
+            if None in ids:
+                conditions.append(DBPermission.resource_id.is_(None))
+            for condition in conditions:
+                for permission_obj in session.scalars(
+                    select(DBPermission)
+                    .options(joinedload(DBPermission.method_type))
+                    .where(DBPermission.resource_type == resource_type)
+                    .where(condition)
+                ):
+                    # Only the method is left to match.
+                    key = DBReader._build_permission(permission_obj).to_str()
+                    if key in wanted:
+                        permission_objs[key] = permission_obj
+        return permission_objs
+
+    @staticmethod
+    def _build_permission(permission_obj: DBPermission) -> Permission:
+        """Builds a Permission object out of its DB model."""
+        return Permission(
+            resource_type=ResourceType(permission_obj.resource_type),
+            resource_id=permission_obj.resource_id,
+            method=MethodType(permission_obj.method_type.name),
+        )
+
     @staticmethod
     def get_role_type(type: RoleType, session: Session) -> DBRoleType:
         """Gets the role type DB object corresponding to the given internal type."""
@@ -7,7 +7,7 @@ Implementation of relational database system user store.
 from __future__ import annotations
 
 import typing
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Set, Tuple, Union
 
 from sqlalchemy import Engine, select
 from sqlalchemy.orm import DeclarativeBase, Session
@@ -21,6 +21,10 @@ from mlte.store.user.store_session import (
     PermissionMapper,
     UserMapper,
     UserStoreSession,
+    check_group_permissions,
+    check_new_policies,
+    check_stored_policies,
+    get_group_permissions,
 )
 from mlte.store.user.underlying.rdbs.metadata import (
     DBBase,
@@ -72,6 +76,10 @@ class RelationalDBUserStore(UserStore):
         """
         return RelationalDBUserStoreSession(storage=self.storage)
 
+    def close(self) -> None:
+        """Close the store, releasing all pooled DB connections."""
+        self.storage.close()
+
 
 def init_user_tables(engine: Engine):
     """Pre-populate tables."""
@@ -103,7 +111,79 @@ class RelationalDBUserStoreSession(UserStoreSession):
 
     def close(self) -> None:
         """Close the session."""
-        self.storage.close()
+        # Connections go back to the pool as each DB session ends; the engine stays up until the store is closed.
+        pass
+
+    def find_stored_policies(
+        self, permissions: List[str], group_names: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        with Session(self.storage.engine) as session:
+            permission_objs = DBReader.get_permission_objs(permissions, session)
+            group_objs = DBReader.get_group_objs(group_names, session)
+            return (set(permission_objs.keys()), set(group_objs.keys()))
+
+    def create_policies(
+        self, permissions: List[Permission], groups: List[Group]
+    ) -> None:
+        new_permissions = [permission.to_str() for permission in permissions]
+        with Session(self.storage.engine) as session:
+            permission_objs = DBReader.get_permission_objs(
+                new_permissions + get_group_permissions(groups), session
+            )
+            check_new_policies(
+                new_permissions,
+                [group.name for group in groups],
+                permission_objs,
+                DBReader.get_group_objs(
+                    [group.name for group in groups], session
+                ),
+            )
+
+            method_type_objs = {
+                method: DBReader.get_method_type(method, session)
+                for method in {permission.method for permission in permissions}
+            }
+            for permission in permissions:
+                permission_obj = DBPermission(
+                    resource_type=permission.resource_type,
+                    resource_id=permission.resource_id,
+                    method_type=method_type_objs[permission.method],
+                )
+                session.add(permission_obj)
+                permission_objs[permission.to_str()] = permission_obj
+
+            check_group_permissions(groups, permission_objs)
+            for group in groups:
+                session.add(
+                    DBGroup(
+                        name=group.name,
+                        permissions=[
+                            permission_objs[permission.to_str()]
+                            for permission in group.permissions
+                        ],
+                    )
+                )
+
+            # Everything is written in a single transaction.
+            session.commit()
+
+    def delete_policies(
+        self, permissions: List[str], group_names: List[str]
+    ) -> None:
+        with Session(self.storage.engine) as session:
+            permission_objs = DBReader.get_permission_objs(permissions, session)
+            group_objs = DBReader.get_group_objs(group_names, session)
+            check_stored_policies(
+                permissions, group_names, permission_objs, group_objs
+            )
+
+            for group_name in group_names:
+                session.delete(group_objs[group_name])
+            for permission in permissions:
+                session.delete(permission_objs[permission])
+
+            # Everything is deleted in a single transaction.
+            session.commit()
 
 
 # -----------------------------------------------------------------------------
@@ -257,11 +337,14 @@ class RDBGroupMapper(GroupMapper):
 
         all_permissions, all_permission_objs = DBReader.get_permissions(session)
 
+        group_permissions = {
+            permission.to_str() for permission in group.permissions
+        }
         group_obj.name = group.name
         group_obj.permissions = [
             all_permission_objs[i]
             for i, permission in enumerate(all_permissions)
-            if permission in group.permissions
+            if permission.to_str() in group_permissions
         ]
 
         return group_obj
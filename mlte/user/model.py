@@ -6,7 +6,7 @@ Model implementation for a User.
 
 from __future__ import annotations
 
-from typing import List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from strenum import StrEnum
 
@@ -248,3 +248,75 @@ class Permission(BaseModel):
             else:
                 # The methods don't match in some way.
                 return False
+
+
+class PermissionIndex:
+    """
+    The permissions of a set of groups, indexed so access checks are lookups instead of scans.
+    Grants the same access as checking each permission with Permission.grants_access().
+    """
+
+    def __init__(self, permissions: Iterable[Permission]) -> None:
+        self._ids: Dict[Tuple[ResourceType, MethodType], Set[str]] = {}
+        """The resource ids with explicit permissions, per resource type and method."""
+
+        self._wildcards: Set[Tuple[ResourceType, MethodType]] = set()
+        """The resource types and methods with permissions for all resource ids."""
+
+        for permission in permissions:
+            key = (permission.resource_type, permission.method)
+            if permission.resource_id is None:
+                self._wildcards.add(key)
+            else:
+                self._ids.setdefault(key, set()).add(permission.resource_id)
+
+    @staticmethod
+    def from_groups(groups: List[Group]) -> PermissionIndex:
+        """Indexes the permissions of all the given groups."""
+        return PermissionIndex(
+            permission for group in groups for permission in group.permissions
+        )
+
+    @staticmethod
+    def _matching_methods(method: MethodType) -> List[MethodType]:
+        """Returns the permission methods that apply to a request with the given method."""
+        if method == MethodType.ANY:
+            return list(MethodType)
+        return [method, MethodType.ANY]
+
+    def grants_access(self, request: Permission) -> bool:
+        """Checks if any of the indexed permissions grants access to the recieved request."""
+        for method in self._matching_methods(request.method):
+            key = (request.resource_type, method)
+            if key in self._wildcards:
+                return True
+            if request.resource_id is not None and request.resource_id in (
+                self._ids.get(key, set())
+            ):
+                return True
+        return False
+
+    def filter_resource_ids(
+        self,
+        resource_type: ResourceType,
+        method: MethodType,
+        resource_ids: Iterable[str],
+    ) -> List[str]:
+        """
+        Filters resource ids, keeping only the ones the indexed permissions grant access to.
+        :param resource_type: The type of the resources
+        :param method: The method to access the resources with
+        :param resource_ids: The ids of the resources
+        :return: The ids with access granted, in the same order
+        """
+        granted: Set[str] = set()
+        for matching_method in self._matching_methods(method):
+            key = (resource_type, matching_method)
+            if key in self._wildcards:
+                return list(resource_ids)
+            granted.update(self._ids.get(key, set()))
+        return [
+            resource_id
+            for resource_id in resource_ids
+            if resource_id in granted
+        ]
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import abc
 import typing
+from typing import Callable, Optional
 
 from mlte._private.meta import get_class_path
 from mlte._private.reflection import load_class
@@ -16,7 +17,7 @@ from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.context.context import Context
 from mlte.evidence.metadata import EvidenceMetadata
-from mlte.store.artifact.store import ArtifactStore
+from mlte.store.artifact.store import ArtifactStore, ManagedArtifactSession
 from mlte.value.model import ValueModel
 
 
@@ -45,6 +46,12 @@ class Value(Artifact, metaclass=abc.ABCMeta):
         self.typename: str = type(instance).__name__
         """The type of the value itself."""
 
+        self.blob: Optional[str] = None
+        """Digest of the payload in the store's blob area, if it was loaded without it and not read yet."""
+
+        self._blob_reader: Optional[Callable[[str], bytes]] = None
+        """Reads blobs from the store the value was loaded from."""
+
     def to_model(self) -> ArtifactModel:
         """
         Convert a value artifact to its corresponding model.
@@ -64,6 +71,34 @@ class Value(Artifact, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError("Value.from_model()")
 
+    def post_load_hook(self, context: Context, store: ArtifactStore) -> None:
+        """
+        Override Artifact.post_load_hook().
+        Binds the value to the store it was loaded from, to read its payload if it was left there.
+        """
+        super().post_load_hook(context, store)
+
+        model_id = context.model
+
+        def read_blob(digest: str) -> bytes:
+            with ManagedArtifactSession(store.session()) as handle:
+                return handle.read_blob(model_id, digest)
+
+        self._blob_reader = read_blob
+
+    def _read_blob(self) -> bytes:
+        """
+        Reads the payload that was left in the store's blob area when the value was loaded.
+        :return: The raw blob data
+        """
+        if self.blob is None or self._blob_reader is None:
+            raise RuntimeError(
+                f"Payload of value {self.identifier} was not loaded from a store."
+            )
+        data = self._blob_reader(self.blob)
+        self.blob = None
+        return data
+
     @staticmethod
     def load_all() -> list[Value]:
         """Loads all artifact models of the given type for the current session."""
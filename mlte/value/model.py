@@ -6,7 +6,7 @@ Model implementation for MLTE value types.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import Field
 from strenum import StrEnum
@@ -86,6 +86,9 @@ class OpaqueValueModel(BaseModel):
     data: Dict[str, Any]
     """Encapsulated, opaque data."""
 
+    blob: Optional[str] = None
+    """Digest of the data in the artifact store's blob area, if it was stored there; data is empty then."""
+
 
 class ImageValueModel(BaseModel):
     """The model implementation for MLTE image values."""
@@ -96,6 +99,9 @@ class ImageValueModel(BaseModel):
     data: str
     """The image data as base64-encoded string."""
 
+    blob: Optional[str] = None
+    """Digest of the data in the artifact store's blob area, if it was stored there; data is empty then."""
+
 
 class ArrayValueModel(BaseModel):
     """The model implementation for MLTE array values."""
@@ -106,6 +112,9 @@ class ArrayValueModel(BaseModel):
     data: List[Any]
     """The array to capture."""
 
+    blob: Optional[str] = None
+    """Digest of the data in the artifact store's blob area, if it was stored there; data is empty then."""
+
 
 ValueModel.model_rebuild()
 
@@ -7,8 +7,9 @@ Implementation of Array value.
 from __future__ import annotations
 
 import typing
-from typing import Any, List
+from typing import Any, List, Optional
 
+from mlte._private.fixed_json import json
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.evidence.metadata import EvidenceMetadata
@@ -21,6 +22,8 @@ class Array(Value):
     Array implements the Value interface for a numpy array of values.
     """
 
+    LAZY_BLOBS = True
+
     def __init__(self, metadata: EvidenceMetadata, array: List[Any]):
         """
         Initialize an Array instance.
@@ -29,8 +32,19 @@ class Array(Value):
         """
         super().__init__(self, metadata)
 
-        self.array: List[Any] = array
+        self._array: Optional[List[Any]] = array
+        """The values, or None if they are still in the store's blob area."""
+
+    @property
+    def array(self) -> List[Any]:
         """Underlying values represented as numpy array."""
+        if self._array is None:
+            self._array = json.loads(self._read_blob())
+        return self._array
+
+    @array.setter
+    def array(self, array: List[Any]) -> None:
+        self._array = array
 
     def to_model(self) -> ArtifactModel:
         """
@@ -57,10 +71,15 @@ class Array(Value):
         body = typing.cast(ValueModel, model.body)
 
         assert body.value.value_type == ValueType.ARRAY, "Broken Precondition."
-        return Array(
+        array = Array(
             metadata=body.metadata,
             array=body.value.data,
         )
+        if body.value.blob is not None:
+            # The values will be read from the store on first access.
+            array.blob = body.value.blob
+            array._array = None
+        return array
 
     def __str__(self) -> str:
         return str(self.array)
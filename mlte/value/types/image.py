@@ -9,7 +9,7 @@ from __future__ import annotations
 import base64
 import typing
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
@@ -24,6 +24,8 @@ class Image(Value):
     Image implements the Value interface for image media.
     """
 
+    LAZY_BLOBS = True
+
     def __init__(
         self,
         metadata: EvidenceMetadata,
@@ -44,11 +46,19 @@ class Image(Value):
 
         super().__init__(self, metadata)
 
-        # TODO(Kyle): Unsure if storing media inline is the
-        # right way to go here (not scalable); reassess this.
+        self._image: Optional[bytes] = image
+        """The image data, or None if it is still in the store's blob area."""
 
-        self.image: bytes = image
+    @property
+    def image(self) -> bytes:
         """The data of the referenced image."""
+        if self._image is None:
+            self._image = self._read_blob()
+        return self._image
+
+    @image.setter
+    def image(self, image: bytes) -> None:
+        self._image = image
 
     def to_model(self) -> ArtifactModel:
         """
@@ -77,10 +87,15 @@ class Image(Value):
         body = typing.cast(ValueModel, model.body)
 
         assert body.value.value_type == ValueType.IMAGE, "Broken Precondition."
-        return Image(
+        image = Image(
             metadata=body.metadata,
             image=base64.decodebytes(body.value.data.encode("utf-8")),
         )
+        if body.value.blob is not None:
+            # The image data will be read from the store on first access.
+            image.blob = body.value.blob
+            image._image = None
+        return image
 
     @classmethod
     def register_info(cls, info: str) -> Condition:
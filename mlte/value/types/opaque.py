@@ -7,8 +7,9 @@ An opaque evaluation value, without semantics.
 from __future__ import annotations
 
 import typing
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from mlte._private.fixed_json import json
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.evidence.metadata import EvidenceMetadata
@@ -21,6 +22,8 @@ class Opaque(Value):
     The 'default' Value instance for measurements that do not provide their own.
     """
 
+    LAZY_BLOBS = True
+
     def __init__(self, metadata: EvidenceMetadata, data: Dict[str, Any]):
         """
         Initialize an Opaque instance.
@@ -29,8 +32,15 @@ class Opaque(Value):
         """
         super().__init__(self, metadata)
 
-        self.data = data
+        self._data: Optional[Dict[str, Any]] = data
+        """The output, or None if it is still in the store's blob area."""
+
+    @property
+    def data(self) -> Dict[str, Any]:
         """The raw output from measurement execution."""
+        if self._data is None:
+            self._data = json.loads(self._read_blob())
+        return self._data
 
     def to_model(self) -> ArtifactModel:
         """
@@ -59,10 +69,15 @@ class Opaque(Value):
         body = typing.cast(ValueModel, model.body)
 
         assert body.value.value_type == ValueType.OPAQUE, "Broken Precondition."
-        return Opaque(
+        opaque = Opaque(
             metadata=body.metadata,
             data=body.value.data,
         )
+        if body.value.blob is not None:
+            # The data will be read from the store on first access.
+            opaque.blob = body.value.blob
+            opaque._data = None
+        return opaque
 
     def __getitem__(self, key: str) -> Any:
         """
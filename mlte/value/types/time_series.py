@@ -0,0 +1,411 @@
+"""
+mlte/value/types/time_series.py
+
+Implementation of TimeSeries value, for samples taken over long-running measurements.
+"""
+
+from __future__ import annotations
+
+import array
+import base64
+import bisect
+import math
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from mlte.evidence.metadata import EvidenceMetadata
+from mlte.spec.condition import Condition
+from mlte.value.base import ValueBase
+
+DEFAULT_MAX_POINTS = 1024
+"""The default number of points kept by a TimeSeries."""
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+"""The default relative accuracy of the quantiles of a TimeSeries."""
+
+# -----------------------------------------------------------------------------
+# QuantileSketch
+# -----------------------------------------------------------------------------
+
+
+class QuantileSketch:
+    """
+    Estimates quantiles of a stream of values in bounded memory, with a bounded relative error.
+    Values are counted in buckets of exponentially growing width, as in DDSketch.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """
+        Initialize an empty sketch.
+
+        :param relative_accuracy: The maximum relative error of estimated quantiles, between 0 and 1
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                f"Relative accuracy must be between 0 and 1, got {relative_accuracy}."
+            )
+
+        self.relative_accuracy = relative_accuracy
+        """The maximum relative error of estimated quantiles."""
+
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        """The ratio between the bounds of each bucket."""
+
+        self.count = 0
+        """The number of values added."""
+
+        self.zeros = 0
+        """The number of values too close to zero for a bucket."""
+
+        self.positive: Dict[int, int] = {}
+        """The number of positive values in each bucket, by bucket index."""
+
+        self.negative: Dict[int, int] = {}
+        """The number of negative values in each bucket, by index of the bucket of their magnitude."""
+
+    def add(self, value: float) -> None:
+        """
+        Add a value.
+
+        :param value: The value
+        """
+        self.count += 1
+        if abs(value) < sys.float_info.min:
+            self.zeros += 1
+            return
+        buckets = self.positive if value > 0 else self.negative
+        key = self._key(abs(value))
+        buckets[key] = buckets.get(key, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the values added.
+
+        :param q: The quantile, between 0 and 1
+        :return: A value within the relative accuracy of the quantile
+        """
+        if self.count == 0:
+            raise ValueError("Can't compute a quantile of no values.")
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}.")
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive))
+
+    def serialize(self) -> Dict[str, Any]:
+        """
+        Serialize the sketch to a JSON object.
+
+        :return: The JSON object
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "zeros": self.zeros,
+            "positive": {str(k): v for k, v in self.positive.items()},
+            "negative": {str(k): v for k, v in self.negative.items()},
+        }
+
+    @staticmethod
+    def deserialize(data: Dict[str, Any]) -> QuantileSketch:
+        """
+        Deserialize a sketch from a JSON object.
+
+        :param data: The JSON object
+        :return: The deserialized sketch
+        """
+        sketch = QuantileSketch(data["relative_accuracy"])
+        sketch.zeros = data["zeros"]
+        sketch.positive = {int(k): v for k, v in data["positive"].items()}
+        sketch.negative = {int(k): v for k, v in data["negative"].items()}
+        sketch.count = (
+            sketch.zeros
+            + sum(sketch.positive.values())
+            + sum(sketch.negative.values())
+        )
+        return sketch
+
+    def _key(self, magnitude: float) -> int:
+        """Returns the index of the bucket of a positive value."""
+        return math.ceil(math.log(magnitude, self.gamma))
+
+    def _value(self, key: int) -> float:
+        """Returns the value representing a bucket, with the same relative error to both of its bounds."""
+        return float(2 * self.gamma**key / (self.gamma + 1))
+
+
+# -----------------------------------------------------------------------------
+# TimeSeries
+# -----------------------------------------------------------------------------
+
+
+class TimeSeries(ValueBase):
+    """
+    A series of values sampled over time, kept in bounded memory. Once more than a maximum
+    number of points are added, they are downsampled with Largest-Triangle-Three-Buckets over
+    equal intervals of time, which keeps the shape of the whole series. The count, minimum, maximum,
+    mean and quantiles are kept up to date as points are added, so they summarize all points,
+    not only those kept.
+    """
+
+    def __init__(
+        self,
+        evidence_metadata: EvidenceMetadata,
+        max_points: int = DEFAULT_MAX_POINTS,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ):
+        """
+        Initialize an empty TimeSeries instance.
+
+        :param evidence_metadata: The generating measurement's metadata
+        :param max_points: The maximum number of points kept, at least 3
+        :param relative_accuracy: The maximum relative error of quantiles
+        """
+        super().__init__(self, evidence_metadata)
+        if max_points < 3:
+            raise ValueError(
+                f"A time series must keep at least 3 points, got {max_points}."
+            )
+
+        self.max_points = max_points
+        """The maximum number of points kept."""
+
+        self.timestamps = array.array("d")
+        """The times of the points kept, in seconds since the epoch."""
+
+        self.values = array.array("d")
+        """The values of the points kept."""
+
+        self.count = 0
+        """The number of points added."""
+
+        self.min: Optional[float] = None
+        """The minimum of the values added, or None if there are none."""
+
+        self.max: Optional[float] = None
+        """The maximum of the values added, or None if there are none."""
+
+        self.sum = 0.0
+        """The sum of the values added."""
+
+        self.sketch = QuantileSketch(relative_accuracy)
+        """The distribution of the values added."""
+
+    def append(self, timestamp: float, value: float) -> None:
+        """
+        Add a point; points must be added in order of time.
+
+        :param timestamp: The time of the point, in seconds since the epoch
+        :param value: The value of the point
+        """
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.sum += value
+        self.sketch.add(value)
+
+        # Halving the points when they overflow spreads the cost of downsampling over many points.
+        if len(self.values) > self.max_points:
+            timestamps, values = _lttb(
+                self.timestamps, self.values, max(self.max_points // 2, 3)
+            )
+            self.timestamps = array.array("d", timestamps)
+            self.values = array.array("d", values)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean of the values added, or None if there are none."""
+        return self.sum / self.count if self.count > 0 else None
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile of the values added.
+
+        :param q: The percentile, between 0 and 100
+        :return: The estimated percentile, within the relative accuracy; clamped to the minimum and maximum
+        """
+        if self.min is None or self.max is None:
+            raise ValueError("Can't compute a percentile of an empty series.")
+        estimate = self.sketch.quantile(q / 100)
+        return min(max(estimate, self.min), self.max)
+
+    def serialize(self) -> Dict[str, Any]:
+        """
+        Serialize a TimeSeries to a JSON object; points are packed as base64-encoded arrays.
+
+        :return: The JSON object
+        """
+        return {
+            "max_points": self.max_points,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "sum": self.sum,
+            "sketch": self.sketch.serialize(),
+            "timestamps": _pack(self.timestamps),
+            "values": _pack(self.values),
+        }
+
+    @staticmethod
+    def deserialize(
+        evidence_metadata: EvidenceMetadata, data: Dict[str, Any]
+    ) -> TimeSeries:
+        """
+        Deserialize a TimeSeries from a JSON object.
+
+        :param evidence_metadata: The generating measurement's metadata
+        :param data: The JSON object
+
+        :return: The deserialized instance
+        """
+        series = TimeSeries(evidence_metadata, max_points=data["max_points"])
+        series.count = data["count"]
+        series.min = data["min"]
+        series.max = data["max"]
+        series.sum = data["sum"]
+        series.sketch = QuantileSketch.deserialize(data["sketch"])
+        series.timestamps = _unpack(data["timestamps"])
+        series.values = _unpack(data["values"])
+        return series
+
+    def __str__(self) -> str:
+        """Return a string representation of TimeSeries."""
+        if self.count == 0:
+            return "Empty time series"
+        s = ""
+        s += f"Points: {self.count} ({len(self.values)} kept)\n"
+        s += f"Average: {self.mean}\n"
+        s += f"Minimum: {self.min}\n"
+        s += f"Maximum: {self.max}\n"
+        s += f"P95: {self.percentile(95)}"
+        return s
+
+    @classmethod
+    def p95_less_than(cls, threshold: float) -> Condition:
+        """
+        Construct and invoke a condition for the 95th percentile of the values.
+
+        :param threshold: The threshold value for the 95th percentile
+
+        :return: The Condition that can be used to validate a Value.
+        """
+        condition: Condition = Condition.build_condition(
+            bool_exp=lambda series: series.count > 0
+            and series.percentile(95) < threshold,
+            success=f"95th percentile below threshold {threshold}",
+            failure=f"95th percentile exceeds threshold {threshold}, or there are no values",
+        )
+        return condition
+
+    @classmethod
+    def max_less_than(cls, threshold: float) -> Condition:
+        """
+        Construct and invoke a condition for the maximum of the values.
+
+        :param threshold: The threshold value for the maximum
+
+        :return: The Condition that can be used to validate a Value.
+        """
+        condition: Condition = Condition.build_condition(
+            bool_exp=lambda series: series.max is not None
+            and series.max < threshold,
+            success=f"Maximum below threshold {threshold}",
+            failure=f"Maximum exceeds threshold {threshold}, or there are no values",
+        )
+        return condition
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _lttb(
+    x: array.array[float], y: array.array[float], threshold: int
+) -> Tuple[List[float], List[float]]:
+    """
+    Downsample points with Largest-Triangle-Three-Buckets: the first and last points are kept,
+    and from each bucket in between, the point forming the largest triangle with the point kept
+    from the previous bucket and the average of the next one. Buckets span equal intervals of x,
+    not equal numbers of points, so downsampling points that were already downsampled keeps
+    them spread over the whole range instead of thinning out older points again.
+
+    :param x: The x coordinates of the points, in order
+    :param y: The y coordinates of the points
+    :param threshold: The maximum number of points to keep, at least 3
+    :return: The x and y coordinates of the points kept
+    """
+    n = len(x)
+    if threshold >= n:
+        return list(x), list(y)
+
+    # The index ranges of the non-empty buckets between the first and last points.
+    width = (x[n - 1] - x[0]) / (threshold - 2)
+    buckets: List[Tuple[int, int]] = []
+    start = 1
+    for i in range(1, threshold - 1):
+        end = (
+            n - 1
+            if i == threshold - 2
+            else bisect.bisect_left(x, x[0] + i * width, start, n - 1)
+        )
+        if end > start:
+            buckets.append((start, end))
+        start = max(start, end)
+
+    out_x, out_y = [x[0]], [y[0]]
+    a = 0
+    for i, (start, end) in enumerate(buckets):
+        # The average of the next bucket, the last point standing in for the last bucket.
+        if i + 1 < len(buckets):
+            next_start, next_end = buckets[i + 1]
+            count = next_end - next_start
+            avg_x = sum(x[next_start:next_end]) / count
+            avg_y = sum(y[next_start:next_end]) / count
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs(
+                (x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a])
+            )
+            if area > best_area:
+                best, best_area = j, area
+        out_x.append(x[best])
+        out_y.append(y[best])
+        a = best
+
+    out_x.append(x[n - 1])
+    out_y.append(y[n - 1])
+    return out_x, out_y
+
+
+def _pack(values: array.array[float]) -> str:
+    """Packs floats as base64-encoded little-endian doubles."""
+    if sys.byteorder != "little":
+        values = array.array("d", values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _unpack(data: str) -> array.array[float]:
+    """Unpacks floats packed by _pack()."""
+    values = array.array("d")
+    values.frombytes(base64.b64decode(data))
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
@@ -87,3 +87,28 @@ def test_load_all_models(
 
     assert len(models) == 2
     assert models[0].header.type == artifact_type
+
+
+def test_save_all(
+    store_with_context: Tuple[ArtifactStore, Context],  # noqa
+) -> None:
+    """Several artifacts can be saved at once."""
+    store, ctx = store_with_context
+
+    values = [
+        Integer(
+            EvidenceMetadata(
+                measurement_type="typename",
+                identifier=Identifier(name=f"id{i}"),
+            ),
+            i,
+        )
+        for i in range(3)
+    ]
+    Artifact.save_all_with(values, ctx, store)
+
+    for value in values:
+        assert (
+            Integer.load_with(value.identifier, context=ctx, store=store)
+            == value
+        )
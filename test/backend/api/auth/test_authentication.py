@@ -8,9 +8,11 @@ import pytest
 
 from mlte.backend.api.auth import authentication
 from mlte.backend.core import state_stores
+from mlte.backend.core.password_verifier import PasswordVerifier
 from mlte.backend.core.state import state
 from mlte.store.user.store import UserStore
 from mlte.store.user.store_session import UserStoreSession
+from mlte.user import passwords
 from mlte.user.model import UserWithPassword
 from test.store.user.fixture import (  # noqa
     fs_store,
@@ -120,3 +122,41 @@ def test_authenticate_wrong_password(
         )
 
         assert not success
+
+
+def test_password_verifier_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Checks that only successful verifications are remembered, and for the same credentials."""
+    hashed_password = passwords.hash_password("mypassword")
+    checks = []
+    verify_password = passwords.verify_password
+
+    def counting_verify_password(password: str, hashed: str) -> bool:
+        checks.append(password)
+        return verify_password(password, hashed)
+
+    monkeypatch.setattr(passwords, "verify_password", counting_verify_password)
+
+    verifier = PasswordVerifier(max_workers=2, cache_ttl=60)
+    try:
+        assert verifier.verify("myuser", "mypassword", hashed_password)
+        assert verifier.verify("myuser", "mypassword", hashed_password)
+        assert len(checks) == 1
+
+        assert not verifier.verify("myuser", "wrong", hashed_password)
+        assert not verifier.verify("myuser", "wrong", hashed_password)
+        assert len(checks) == 3
+
+        # A new hash, as when the password changes, is checked again.
+        new_hashed_password = passwords.hash_password("mypassword")
+        assert verifier.verify("myuser", "mypassword", new_hashed_password)
+        assert len(checks) == 4
+    finally:
+        verifier.shutdown()
+
+    verifier = PasswordVerifier(max_workers=1, cache_ttl=0)
+    try:
+        assert verifier.verify("myuser", "mypassword", hashed_password)
+        assert verifier.verify("myuser", "mypassword", hashed_password)
+        assert len(checks) == 6
+    finally:
+        verifier.shutdown()
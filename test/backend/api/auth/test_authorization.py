@@ -5,6 +5,8 @@ Test the authorization operations
 """
 
 from mlte.backend.api.auth import authorization, jwt
+from mlte.backend.core.user_cache import CachedUser, UserCache
+from mlte.user.model import Group, MethodType, Permission, ResourceType, User
 
 
 def test_get_username_from_token_success():
@@ -18,3 +20,71 @@ def test_get_username_from_token_success():
     )
 
     assert decoded_username == username
+
+
+def test_cached_user_grants_access():
+    """Checks that indexed permissions grant the same access as scanning them."""
+    user = User(
+        username="user1",
+        hashed_password="hash",
+        groups=[
+            Group(
+                name="group1",
+                permissions=[
+                    Permission(
+                        resource_type=ResourceType.MODEL,
+                        resource_id="model1",
+                        method=MethodType.GET,
+                    ),
+                    Permission(
+                        resource_type=ResourceType.MODEL,
+                        resource_id=None,
+                        method=MethodType.POST,
+                    ),
+                    Permission(
+                        resource_type=ResourceType.USER,
+                        resource_id="user1",
+                    ),
+                ],
+            )
+        ],
+    )
+    cached_user = CachedUser(user, expiration=0)
+
+    for resource_type in ResourceType:
+        for resource_id in [None, "model1", "model2", "user1"]:
+            for method in MethodType:
+                resource = Permission(
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                    method=method,
+                )
+                assert cached_user.grants_access(
+                    resource
+                ) == authorization.is_authorized(user, resource)
+
+
+def test_user_cache():
+    """Checks that cached users are returned until they expire or are invalidated."""
+    user = User(username="user1", hashed_password="hash")
+
+    cache = UserCache(ttl=60)
+    assert cache.get("user1", "token1") is None
+    cache.put("user1", "token1", user)
+    entry = cache.get("user1", "token1")
+    assert entry is not None
+    assert entry.user == user
+    assert cache.get("user1", "token2") is None
+
+    cache.invalidate()
+    assert cache.get("user1", "token1") is None
+
+    cache = UserCache(ttl=60, max_size=1)
+    cache.put("user1", "token1", user)
+    cache.put("user1", "token2", user)
+    assert cache.get("user1", "token1") is None
+    assert cache.get("user1", "token2") is not None
+
+    cache = UserCache(ttl=0)
+    cache.put("user1", "token1", user)
+    assert cache.get("user1", "token1") is None
@@ -11,10 +11,16 @@ from typing import Any
 
 import pytest
 
+from mlte._private.fixed_json import json
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.backend.api import codes
-from mlte.backend.api.models.artifact_model import WriteArtifactRequest
+from mlte.backend.api.models.artifact_model import (
+    NDJSON_MEDIA_TYPE,
+    NEXT_CURSOR_HEADER,
+    WriteArtifactRequest,
+    WriteArtifactsRequest,
+)
 from mlte.model.base_model import BaseModel
 from mlte.store.query import Query
 from mlte.user.model import ResourceType, UserWithPassword
@@ -163,6 +169,79 @@ def test_list(
     assert read == created
 
 
+def test_list_pages(test_api_fixture) -> None:
+    """Artifacts can be listed in pages, following the returned cursor."""
+    model = get_sample_model()
+    version = get_sample_version()
+    test_api: TestAPI = test_api_fixture(user_generator.build_admin_user())
+    create_context(test_api)
+    test_client = test_api.get_test_client()
+    url = ARTIFACT_URI.format(model.identifier, version.identifier)
+
+    for i in range(3):
+        create_artifact_using_admin(
+            ArtifactFactory.make(ArtifactType.VALUE, id=f"id{i}"), test_api
+        )
+
+    res = test_client.get(url, params={"limit": 2})
+    assert res.status_code == codes.OK
+    assert len(res.json()) == 2
+    cursor = res.headers[NEXT_CURSOR_HEADER]
+
+    res = test_client.get(url, params={"limit": 2, "cursor": cursor})
+    assert res.status_code == codes.OK
+    assert len(res.json()) == 1
+    assert NEXT_CURSOR_HEADER not in res.headers
+
+    res = test_client.get(url, params={"limit": 2, "cursor": "not-a-cursor"})
+    assert res.status_code == codes.BAD_REQUEST
+
+    # A cursor and an offset can't be combined.
+    res = test_client.get(
+        url, params={"limit": 2, "cursor": cursor, "offset": 1}
+    )
+    assert res.status_code == codes.BAD_REQUEST
+
+
+def test_list_stream(test_api_fixture) -> None:
+    """Artifacts can be streamed as NDJSON, from a listing or a search."""
+    model = get_sample_model()
+    version = get_sample_version()
+    test_api: TestAPI = test_api_fixture(user_generator.build_admin_user())
+    create_context(test_api)
+    test_client = test_api.get_test_client()
+    url = ARTIFACT_URI.format(model.identifier, version.identifier)
+
+    for i in range(3):
+        create_artifact_using_admin(
+            ArtifactFactory.make(ArtifactType.VALUE, id=f"id{i}"), test_api
+        )
+    headers = {"Accept": NDJSON_MEDIA_TYPE}
+
+    # Pagination parameters do not apply to streams.
+    with test_client.stream(
+        "GET", url, params={"limit": 2}, headers=headers
+    ) as res:
+        assert res.status_code == codes.OK
+        assert res.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+        identifiers = [
+            ArtifactModel(**json.loads(line)).header.identifier
+            for line in test_client.iter_lines(res)
+        ]
+    assert sorted(identifiers) == ["id0", "id1", "id2"]
+
+    with test_client.stream(
+        "POST", f"{url}/search", json=Query().to_json(), headers=headers
+    ) as res:
+        assert res.status_code == codes.OK
+        assert len(list(test_client.iter_lines(res))) == 3
+
+    with test_client.stream(
+        "GET", ARTIFACT_URI.format(model.identifier, "missing"), headers=headers
+    ) as res:
+        assert res.status_code == codes.NOT_FOUND
+
+
 @pytest.mark.parametrize(
     "api_user",
     user_generator.get_test_users_with_read_permissions(
@@ -234,3 +313,33 @@ def test_delete(
         f"{ARTIFACT_URI.format(model.identifier, version.identifier)}/{created.header.identifier}"
     )
     assert res.status_code == codes.NOT_FOUND
+
+
+def test_write_batch(test_api_fixture) -> None:
+    """Several artifacts can be written in one request, and read by identifier."""
+    model = get_sample_model()
+    version = get_sample_version()
+    test_api: TestAPI = test_api_fixture(user_generator.build_admin_user())
+    create_context(test_api)
+    test_client = test_api.get_test_client()
+    url = ARTIFACT_URI.format(model.identifier, version.identifier)
+
+    artifacts = [
+        ArtifactFactory.make(ArtifactType.VALUE, id=f"id{i}") for i in range(3)
+    ]
+    request = WriteArtifactsRequest(artifacts=artifacts)
+    res = test_client.post(f"{url}/batch", json=request.to_json())
+    assert res.status_code == codes.OK
+    assert len(res.json()["artifacts"]) == 3
+
+    res = test_client.post(f"{url}/batch", json=request.to_json())
+    assert res.status_code == codes.ALREADY_EXISTS
+
+    res = test_client.get(url, params={"ids": ["id2", "id0"]})
+    assert res.status_code == codes.OK
+    assert [
+        ArtifactModel(**artifact).header.identifier for artifact in res.json()
+    ] == ["id2", "id0"]
+
+    res = test_client.get(url, params={"ids": ["id0", "missing"]})
+    assert res.status_code == codes.NOT_FOUND
@@ -7,6 +7,7 @@ Test the API for model operations.
 import pytest
 
 from mlte.backend.api import codes
+from mlte.backend.api.etag import ETAG_HEADER, IF_NONE_MATCH_HEADER
 from mlte.backend.core.config import settings
 from mlte.backend.core.state import state
 from mlte.context.model import Model
@@ -154,6 +155,27 @@ def test_list(test_api_fixture, api_user: UserWithPassword) -> None:
     assert len(res.json()) == 2
 
 
+def test_list_not_modified(test_api_fixture) -> None:
+    """Listing models again with the tag of the previous list only returns 304 until it changes."""
+    test_api: TestAPI = test_api_fixture(user_generator.build_admin_user())
+    create_sample_model_using_admin(test_api)
+    test_client = test_api.get_test_client()
+
+    res = test_client.get(MODEL_URI)
+    assert res.status_code == codes.OK
+    etag = res.headers[ETAG_HEADER]
+
+    res = test_client.get(MODEL_URI, headers={IF_NONE_MATCH_HEADER: etag})
+    assert res.status_code == codes.NOT_MODIFIED
+    assert res.content == b""
+
+    create_fake_model_using_admin(test_api)
+    res = test_client.get(MODEL_URI, headers={IF_NONE_MATCH_HEADER: etag})
+    assert res.status_code == codes.OK
+    assert len(res.json()) == 2
+    assert res.headers[ETAG_HEADER] != etag
+
+
 @pytest.mark.parametrize(
     "api_user",
     user_generator.get_test_users_with_no_read_permissions(ResourceType.MODEL),
@@ -0,0 +1,105 @@
+"""
+test/backend/api/test_compression.py
+
+Test the compression of responses.
+"""
+
+from typing import Iterator, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from mlte.backend.api.compression import (
+    CompressionMiddleware,
+    choose_encoding,
+    get_encodings,
+)
+from mlte.backend.api.etag import ETAG_HEADER, etag_response
+from mlte.backend.api.models.artifact_model import NDJSON_MEDIA_TYPE
+
+ITEMS = [f"item{i}" for i in range(1000)]
+
+
+def create_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/large")
+    def large() -> List[str]:
+        return ITEMS
+
+    @app.get("/small")
+    def small() -> List[str]:
+        return ITEMS[:1]
+
+    @app.get("/tagged")
+    def tagged():
+        return etag_response(ITEMS, None)
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        def lines() -> Iterator[str]:
+            for item in ITEMS:
+                yield f'"{item}"\n'
+
+        return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
+    app.add_middleware(CompressionMiddleware, minimum_size=500, level=6)
+    return TestClient(app)
+
+
+def test_choose_encoding() -> None:
+    """The preferred encoding accepted by the client is chosen."""
+    assert choose_encoding(None) is None
+    assert choose_encoding("identity") is None
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0") is None
+    assert choose_encoding("*") == get_encodings()[0]
+    assert choose_encoding("zstd;q=0.5, gzip") == "gzip"
+
+
+def test_compression() -> None:
+    """Large and streamed JSON responses are compressed, and small ones are not."""
+    client = create_client()
+    headers = {"Accept-Encoding": "gzip"}
+
+    res = client.get("/large", headers=headers)
+    assert res.headers["content-encoding"] == "gzip"
+    assert int(res.headers["content-length"]) < len(res.content) / 2
+    assert res.json() == ITEMS
+
+    res = client.get("/small", headers=headers)
+    assert "content-encoding" not in res.headers
+    assert res.json() == ITEMS[:1]
+
+    res = client.get("/stream", headers=headers)
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.text.split() == [f'"{item}"' for item in ITEMS]
+
+    # Tags of compressed responses are weak, as their bytes differ from the original.
+    res = client.get("/tagged", headers=headers)
+    assert res.headers[ETAG_HEADER].startswith('W/"')
+
+    res = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in res.headers
+    assert res.json() == ITEMS
+
+
+@pytest.mark.skipif(
+    "zstd" not in get_encodings(), reason="zstandard is not installed"
+)
+def test_zstd_compression() -> None:
+    """Responses are compressed with zstd when the client accepts it, including streamed ones."""
+    client = create_client()
+    headers = {"Accept-Encoding": "gzip, zstd"}
+    assert choose_encoding(headers["Accept-Encoding"]) == "zstd"
+
+    res = client.get("/large", headers=headers)
+    assert res.headers["content-encoding"] == "zstd"
+    assert int(res.headers["content-length"]) < len(res.content) / 2
+    assert res.json() == ITEMS
+
+    res = client.get("/stream", headers=headers)
+    assert res.headers["content-encoding"] == "zstd"
+    assert res.text.split() == [f'"{item}"' for item in ITEMS]
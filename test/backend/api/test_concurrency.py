@@ -0,0 +1,65 @@
+"""
+test/backend/api/test_concurrency.py
+
+Test the thread limits for classes of endpoints.
+"""
+
+import inspect
+import threading
+from typing import List
+
+import anyio
+
+from mlte.backend.api.concurrency import (
+    EndpointClass,
+    get_limiter,
+    iterate_in,
+    run_in,
+)
+from mlte.backend.core.config import settings
+
+
+def test_run_in() -> None:
+    """Checks that a decorated endpoint runs in a worker thread, with its own limit."""
+
+    @run_in(EndpointClass.SEARCH)
+    def endpoint(value: int) -> List[int]:
+        return [value, threading.get_ident()]
+
+    assert inspect.signature(endpoint).return_annotation == List[int]
+
+    async def main() -> None:
+        search_limiter = get_limiter(EndpointClass.SEARCH)
+        assert search_limiter.total_tokens == settings.SEARCH_THREADS
+        assert get_limiter(EndpointClass.SEARCH) is search_limiter
+        assert get_limiter(EndpointClass.WRITE) is not search_limiter
+
+        value, thread_id = await endpoint(value=1)
+        assert value == 1
+        assert thread_id != threading.get_ident()
+
+        # While all search threads are taken, other classes still run.
+        for _ in range(int(search_limiter.total_tokens)):
+            await search_limiter.acquire_on_behalf_of(object())
+        with anyio.move_on_after(0.1) as scope:
+            await endpoint(value=2)
+        assert scope.cancelled_caught
+
+        write_endpoint = run_in(EndpointClass.WRITE)(
+            getattr(endpoint, "__wrapped__")
+        )
+        assert (await write_endpoint(value=3))[0] == 3
+
+    anyio.run(main)
+
+
+def test_iterate_in() -> None:
+    """Checks that a blocking iterator is consumed asynchronously."""
+
+    async def main() -> List[int]:
+        return [
+            item
+            async for item in iterate_in(EndpointClass.SEARCH, iter([1, 2]))
+        ]
+
+    assert anyio.run(main) == [1, 2]
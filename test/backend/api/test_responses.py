@@ -0,0 +1,35 @@
+"""
+test/backend/api/test_responses.py
+
+Test the response classes for large JSON bodies.
+"""
+
+import importlib.util
+import json
+import math
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from mlte.backend.api.responses import FastJSONResponse
+
+CONTENT = [
+    {"id": f"item{i}", "value": i / 3, "tags": ["a", "b"]} for i in range(100)
+]
+
+
+def test_render() -> None:
+    """Responses render the same JSON as the standard response class."""
+    assert json.loads(FastJSONResponse(CONTENT).body) == json.loads(
+        JSONResponse(CONTENT).body
+    )
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("orjson") is None, reason="orjson is not installed"
+)
+def test_render_orjson() -> None:
+    """With orjson, non-finite values are rendered as null instead of failing."""
+    with pytest.raises(ValueError):
+        JSONResponse([math.nan])
+    assert json.loads(FastJSONResponse([math.nan, 1.0]).body) == [None, 1.0]
@@ -7,7 +7,7 @@ Test API.
 from __future__ import annotations
 
 import typing
-from typing import Any, Dict, Optional
+from typing import Any, ContextManager, Dict, Optional
 
 import httpx
 from fastapi.testclient import TestClient
@@ -48,8 +48,12 @@ class FastAPITestHttpClient(OAuthHttpClient):
         self.client = client
         """The underlying client."""
 
-    def get(self, url: str, **kwargs) -> httpx.Response:
-        return self.client.get(url, headers=self.headers, **kwargs)
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs
+    ) -> httpx.Response:
+        return self.client.get(
+            url, headers={**self.headers, **(headers or {})}, **kwargs
+        )
 
     def post(
         self, url: str, data: Any = None, json: Any = None, **kwargs
@@ -68,6 +72,24 @@ class FastAPITestHttpClient(OAuthHttpClient):
     def delete(self, url: str, **kwargs) -> httpx.Response:
         return self.client.delete(url, headers=self.headers, **kwargs)
 
+    def send_token_request(
+        self, url: str, data: Dict[str, str]
+    ) -> httpx.Response:
+        return self.client.post(
+            url, headers=dict(self.TOKEN_REQ_HEADERS), data=data
+        )
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> ContextManager[httpx.Response]:
+        return self.client.stream(
+            method, url, headers={**self.headers, **(headers or {})}, **kwargs
+        )
+
 
 # -----------------------------------------------------------------------------
 # Test Api.
@@ -0,0 +1,75 @@
+"""
+test/backend/test_main.py
+
+Unit tests for setting up the backend state.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+import mlte.backend.main as main
+from mlte.backend.core.config import Settings
+from mlte.backend.core.state import state
+from mlte.backend.main import setup_state
+from mlte.store.base import StoreType, StoreURI
+from mlte.store.user.store import DEFAULT_USERNAME
+from mlte.store.user.store_session import ManagedUserSession
+
+
+def setup_fs_state(path: Path, seed: bool) -> None:
+    """Sets up the state from scratch, as a new process would."""
+    state.close_stores()
+    state.reset()
+    uri = f"{StoreURI.get_default_prefix(StoreType.LOCAL_FILESYSTEM)}{path}"
+    setup_state(uri, {}, "secret", seed=seed)
+
+
+def test_setup_state_seed(tmp_path: Path) -> None:
+    """Default data is only written when seeding, and stays for processes that set up later."""
+    try:
+        setup_fs_state(tmp_path, seed=False)
+        with ManagedUserSession(state.user_store.session()) as session:
+            assert DEFAULT_USERNAME not in session.user_mapper.list()
+
+        setup_fs_state(tmp_path, seed=True)
+        setup_fs_state(tmp_path, seed=False)
+        with ManagedUserSession(state.user_store.session()) as session:
+            assert DEFAULT_USERNAME in session.user_mapper.list()
+    finally:
+        state.close_stores()
+        state.reset()
+
+
+def test_run_workers_disables_caches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Workers can't share their caches of users and permissions, so they run without them."""
+    monkeypatch.setenv("AUTH_CACHE_TTL", "30")
+    monkeypatch.setenv("PASSWORD_CACHE_TTL", "30")
+    for name in [
+        "STORE_URI",
+        "CATALOG_URIS",
+        "ALLOWED_ORIGINS",
+        "JWT_SECRET_KEY",
+    ]:
+        monkeypatch.delenv(name, raising=False)
+    run_args: Dict[str, Any] = {}
+    monkeypatch.setattr(
+        "uvicorn.run", lambda *args, **kwargs: run_args.update(kwargs)
+    )
+
+    try:
+        uri = f"{StoreURI.get_default_prefix(StoreType.LOCAL_FILESYSTEM)}{tmp_path}"
+        main.run("localhost", 8080, uri, {}, [], "secret", workers=2)
+    finally:
+        state.close_stores()
+        state.reset()
+
+    assert run_args["workers"] == 2
+    assert os.environ["AUTH_CACHE_TTL"] == "0"
+    worker_settings = Settings()
+    assert worker_settings.AUTH_CACHE_TTL == 0
+    assert worker_settings.PASSWORD_CACHE_TTL == 0
@@ -9,6 +9,11 @@ import subprocess
 import sys
 from pathlib import Path
 
+from mlte.context.model import Model
+from mlte.store.artifact.factory import create_artifact_store
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.base import StoreType, StoreURI
+
 
 def python() -> Path:
     """Return the path to the current interpreter."""
@@ -22,12 +27,24 @@ def script() -> Path:
     return path.resolve()
 
 
-def execute_cli() -> int:
+def execute_cli(*args: str) -> int:
     """Execute the CLI script."""
-    command = [str(python()), str(script())]
+    command = [str(python()), str(script()), *args]
     p = subprocess.run(command)
     return p.returncode
 
 
 def test_cli():
     assert execute_cli() == 0
+
+
+def test_blobs(tmp_path: Path):
+    """Blobs that no artifact references are reported, and removed on request."""
+    uri = f"{StoreURI.get_default_prefix(StoreType.LOCAL_FILESYSTEM)}{tmp_path}"
+    with ManagedArtifactSession(create_artifact_store(uri).session()) as handle:
+        handle.create_model(Model(identifier="model0"))
+        handle.write_blob("model0", b"unreferenced")
+
+    assert execute_cli("blobs", "--store-uri", uri) == 1
+    assert execute_cli("blobs", "--store-uri", uri, "--remove") == 0
+    assert execute_cli("blobs", "--store-uri", uri) == 0
@@ -4,9 +4,6 @@ test/measurement/cpu/test_local_process_cpu_utilization.py
 Unit test for LocalProcessCPUUtilization measurement.
 """
 
-import os
-import subprocess
-import threading
 import time
 import typing
 from typing import Tuple
@@ -22,21 +19,12 @@ from mlte.store.artifact.store import ArtifactStore
 from mlte.validation.validator import Validator
 from test.store.artifact.fixture import store_with_context  # noqa
 
-from ...support.meta import path_to_support
+from ...support.process import spin_for, spin_tree_for
 
 # The spin duration, in seconds
 SPIN_DURATION = 3
 
 
-def spin_for(seconds: int):
-    """Run the spin.py program for `seconds`."""
-    path = os.path.join(path_to_support(), "spin.py")
-    prog = subprocess.Popen(["python", path, f"{seconds}"])
-    thread = threading.Thread(target=lambda: prog.wait())
-    thread.start()
-    return prog
-
-
 @pytest.mark.skipif(
     is_windows(), reason="LocalProcessCPUUtilization not supported on Windows."
 )
@@ -72,6 +60,44 @@ def test_cpu_nix_evaluate_async() -> None:
     assert int(time.time() - start) >= SPIN_DURATION
 
 
+@pytest.mark.skipif(
+    is_windows(), reason="LocalProcessCPUUtilization not supported on Windows."
+)
+def test_cpu_nix_evaluate_subsecond() -> None:
+    p = spin_for(SPIN_DURATION)
+    m = LocalProcessCPUUtilization("id")
+
+    # Capture CPU utilization at 20 Hz; blocks until process exit
+    stat = typing.cast(CPUStatistics, m.evaluate(p.pid, poll_interval=0.05))
+
+    assert stat.p50 is not None and stat.p95 is not None
+    assert stat.series is not None
+    assert stat.series.count == len(stat.series.values)
+    assert stat.min <= stat.p50 <= stat.p95 <= stat.max
+    # The spin process alternates work and sleep, so short intervals see both.
+    assert stat.min < stat.max
+
+
+@pytest.mark.skipif(
+    is_windows(), reason="LocalProcessCPUUtilization not supported on Windows."
+)
+def test_cpu_nix_evaluate_children() -> None:
+    p = spin_tree_for(SPIN_DURATION, 2)
+    m = LocalProcessCPUUtilization("id")
+
+    # Blocks until the parent process exits, once its children do
+    stat = typing.cast(
+        CPUStatistics,
+        m.evaluate(p.pid, poll_interval=0.2, include_children=True),
+    )
+
+    assert stat.children is not None
+    assert len(stat.children) == 2
+    assert all(child["max"] > 0 for child in stat.children)
+    assert stat.max >= max(child["max"] for child in stat.children)
+    assert "Child" in str(stat)
+
+
 @pytest.mark.skipif(
     is_windows(), reason="LocalProcessCPUUtilization not supported on Windows."
 )
@@ -126,7 +152,7 @@ def test_result_save_load(
     m = EvidenceMetadata(
         measurement_type="typename", identifier=Identifier(name="id")
     )
-    stats = CPUStatistics(m, 0.5, 0.1, 0.8)
+    stats = CPUStatistics(m, 0.5, 0.1, 0.8, p50=0.4, p95=0.7, p99=0.8)
     stats.save_with(ctx, store)
 
     r: CPUStatistics = typing.cast(
@@ -136,6 +162,42 @@ def test_result_save_load(
     assert r.avg == stats.avg
     assert r.min == stats.min
     assert r.max == stats.max
+    assert r.p95 == stats.p95
+
+
+def test_from_samples() -> None:
+    m = EvidenceMetadata(
+        measurement_type="typename", identifier=Identifier(name="id")
+    )
+
+    stats = CPUStatistics.from_samples(m, [0.4, 0.1, 0.3, 0.2, 0.5])
+    assert stats.avg == pytest.approx(0.3)
+    assert (stats.min, stats.max) == (0.1, 0.5)
+    assert stats.p50 == pytest.approx(0.3)
+    assert stats.p95 == pytest.approx(0.48)
+
+    assert stats.children is None
+
+    # Values stored without percentiles can still be read.
+    old = CPUStatistics.deserialize(m, {"avg": 0.3, "min": 0.1, "max": 0.5})
+    assert old.p95 is None
+
+
+def test_p95_utilization_less_than() -> None:
+    m = EvidenceMetadata(
+        measurement_type="typename", identifier=Identifier(name="id")
+    )
+
+    cond = CPUStatistics.p95_utilization_less_than(3)
+
+    res = cond(CPUStatistics(m, avg=2, max=4, min=1, p95=2))
+    assert bool(res)
+
+    res = cond(CPUStatistics(m, avg=2, max=4, min=1, p95=3))
+    assert not bool(res)
+
+    res = cond(CPUStatistics(m, avg=2, max=2, min=1))
+    assert not bool(res)
 
 
 def test_max_utilization_less_than() -> None:
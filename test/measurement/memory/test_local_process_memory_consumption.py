@@ -4,39 +4,32 @@ test/measurement/memory/test_local_process_memory_consumption.py
 Unit test for LocalProcessMemoryConsumption measurement.
 """
 
-import os
-import subprocess
-import threading
 import time
 import typing
 from typing import Tuple
 
+import psutil
+import pytest
+
 from mlte.context.context import Context
 from mlte.evidence.metadata import EvidenceMetadata, Identifier
 from mlte.measurement.memory import (
     LocalProcessMemoryConsumption,
     MemoryStatistics,
+    MemoryType,
 )
 from mlte.spec.condition import Condition
 from mlte.store.artifact.store import ArtifactStore
 from mlte.validation.validator import Validator
+from mlte.value.types.time_series import TimeSeries
 from test.store.artifact.fixture import store_with_context  # noqa
 
-from ...support.meta import path_to_support
+from ...support.process import spin_for, spin_tree_for
 
 # The spin duration, in seconds
 SPIN_DURATION = 5
 
 
-def spin_for(seconds: int):
-    """Run the spin.py program for `seconds`."""
-    path = os.path.join(path_to_support(), "spin.py")
-    prog = subprocess.Popen(["python", path, f"{seconds}"])
-    thread = threading.Thread(target=lambda: prog.wait())
-    thread.start()
-    return prog
-
-
 def test_memory_evaluate() -> None:
     start = time.time()
 
@@ -64,6 +57,68 @@ def test_memory_evaluate_async() -> None:
     assert int(time.time() - start) >= SPIN_DURATION
 
 
+def test_memory_evaluate_children() -> None:
+    p = spin_tree_for(3, 2)
+    m = LocalProcessMemoryConsumption("identifier")
+
+    # Blocks until the parent process exits, once its children do
+    stats = typing.cast(
+        MemoryStatistics,
+        m.evaluate(p.pid, poll_interval=0.2, include_children=True),
+    )
+
+    assert stats.memory_type == MemoryType.PSS
+    assert stats.children is not None
+    assert len(stats.children) == 2
+    # The total includes the parent and both children.
+    assert stats.max > sum(child["min"] for child in stats.children)
+    assert "Child" in str(stats)
+
+
+def test_memory_evaluate_children_denied(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Where PSS can't be read, RSS is counted, and reported as such."""
+    p = spin_tree_for(2, 2)
+    memory_full_info = psutil.Process.memory_full_info
+
+    def children_denied(process: psutil.Process) -> typing.Any:
+        if process.pid != p.pid:
+            raise psutil.AccessDenied(process.pid)
+        return memory_full_info(process)
+
+    monkeypatch.setattr(psutil.Process, "memory_full_info", children_denied)
+    m = LocalProcessMemoryConsumption("identifier")
+
+    stats = typing.cast(
+        MemoryStatistics,
+        m.evaluate(p.pid, poll_interval=0.2, include_children=True),
+    )
+
+    assert stats.memory_type == MemoryType.MIXED
+    assert stats.children is not None
+    assert len(stats.children) == 2
+    assert all(
+        child["memory_type"] == MemoryType.RSS for child in stats.children
+    )
+
+
+def test_memory_evaluate_uss() -> None:
+    p = spin_for(2)
+    m = LocalProcessMemoryConsumption("identifier")
+
+    stats = typing.cast(
+        MemoryStatistics,
+        m.evaluate(p.pid, poll_interval=0.2, memory_type=MemoryType.USS),
+    )
+
+    assert stats.memory_type == MemoryType.USS
+    assert stats.series is not None
+    assert stats.series.min == stats.min
+    assert stats.children is None
+    assert stats.min > 0
+
+
 def test_memory_validate_success() -> None:
     p = spin_for(5)
 
@@ -115,7 +170,15 @@ def test_result_save_load(
     m = EvidenceMetadata(
         measurement_type="typename", identifier=Identifier(name="id")
     )
-    stats = MemoryStatistics(m, 50, 10, 800)
+    stats = MemoryStatistics(
+        m,
+        50,
+        10,
+        800,
+        memory_type=MemoryType.PSS,
+        children=[{"pid": 1, "name": "worker", "avg": 5, "min": 2, "max": 8}],
+        series=TimeSeries(m),
+    )
     stats.save_with(ctx, store)
 
     r: MemoryStatistics = typing.cast(
@@ -125,6 +188,9 @@ def test_result_save_load(
     assert r.avg == stats.avg
     assert r.min == stats.min
     assert r.max == stats.max
+    assert r.memory_type == MemoryType.PSS
+    assert r.children == stats.children
+    assert r.series == stats.series
 
 
 def test_max_consumption_less_than() -> None:
@@ -4,13 +4,23 @@ test/measurement/test_process_measurement.py
 Unit test for ProcessMeasurement.
 """
 
+import concurrent.futures
 import os
+import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
+from mlte.measurement.cpu import LocalProcessCPUUtilization
+from mlte.measurement.memory import LocalProcessMemoryConsumption
 from mlte.measurement.process_measurement import ProcessMeasurement
+from mlte.measurement.utility.process_exit import ProcessExitWatcher
 
 from ..support.meta import path_to_support
+from ..support.process import spin_for
 
 # The spin duration, in seconds
 SPIN_DURATION = 5
@@ -34,3 +44,65 @@ def test_start_general_job():
     pid = ProcessMeasurement.start_process(spin, args)
 
     assert pid > 0
+
+
+def test_wait_for_futures():
+    """Measurements finish as soon as the process exits, not at their next poll."""
+    p = spin_for(2)
+    start = time.monotonic()
+
+    cpu = LocalProcessCPUUtilization("cpu")
+    memory = LocalProcessMemoryConsumption("memory")
+    futures = [
+        cpu.evaluate_async(p.pid, poll_interval=0.5),
+        memory.evaluate_async(p.pid, poll_interval=10),
+    ]
+    done, _ = concurrent.futures.wait(futures, timeout=30)
+
+    assert len(done) == 2
+    assert time.monotonic() - start < 5
+    assert memory.wait_for_output() is futures[1].result()
+
+
+def test_wait_for_output_timeout():
+    p = spin_for(2)
+    m = LocalProcessMemoryConsumption("memory")
+    m.evaluate_async(p.pid)
+
+    with pytest.raises(concurrent.futures.TimeoutError):
+        m.wait_for_output(timeout=0.1)
+    assert m.wait_for_output(timeout=30) is not None
+
+
+def test_cancel():
+    """Cancelling the future of a measurement stops it."""
+    p = spin_for(5)
+    m = LocalProcessMemoryConsumption("memory")
+    future = m.evaluate_async(p.pid)
+
+    start = time.monotonic()
+    assert future.cancel()
+    assert m.thread is not None
+    m.thread.join(timeout=30)
+    assert time.monotonic() - start < 2
+    with pytest.raises(concurrent.futures.CancelledError):
+        m.wait_for_output()
+    p.kill()
+
+
+def test_exit_watcher():
+    p = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.5)"])
+    with ProcessExitWatcher(p.pid) as watcher:
+        assert not watcher.wait(timeout=0.05)
+        assert watcher.wait(timeout=30)
+        assert watcher.exited
+    p.wait()
+
+    # The watcher can be woken before the process exits.
+    p = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    with ProcessExitWatcher(p.pid) as watcher:
+        threading.Timer(0.1, watcher.wake).start()
+        assert watcher.wait(timeout=30)
+        assert not watcher.exited
+    p.kill()
+    p.wait()
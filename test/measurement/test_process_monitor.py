@@ -0,0 +1,105 @@
+"""
+test/measurement/test_process_monitor.py
+
+Unit test for ProcessMonitor.
+"""
+
+import typing
+
+import pytest
+
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.measurement.cpu import CPUStatistics, LocalProcessCPUUtilization
+from mlte.measurement.memory import (
+    LocalProcessMemoryConsumption,
+    MemoryStatistics,
+    MemoryType,
+)
+from mlte.measurement.process_monitor import (
+    Metric,
+    ProcessMonitor,
+    ProcessSamples,
+)
+from mlte.value.types.opaque import Opaque
+from mlte.value.types.time_series import TimeSeries
+
+from ..support.process import spin_for
+
+# The spin duration, in seconds
+SPIN_DURATION = 2
+
+
+def test_monitor_evaluate_async() -> None:
+    p = spin_for(SPIN_DURATION)
+
+    monitor = ProcessMonitor("monitor", metrics=[Metric.THREADS])
+    cpu = LocalProcessCPUUtilization("cpu")
+    memory = LocalProcessMemoryConsumption("memory")
+    monitor.subscribe(cpu)
+    monitor.subscribe(memory)
+    assert monitor.metrics == [Metric.THREADS, Metric.CPU, Metric.RSS]
+
+    monitor.evaluate_async(p.pid, poll_interval=0.1)
+
+    cpu_stats = typing.cast(CPUStatistics, cpu.wait_for_output())
+    memory_stats = typing.cast(MemoryStatistics, memory.wait_for_output())
+    assert cpu_stats.max > 0
+    assert cpu_stats.p95 is not None
+    assert cpu_stats.series is not None
+    assert memory_stats.min > 0
+    assert memory_stats.memory_type == MemoryType.RSS
+    assert memory_stats.series is not None
+
+    opaque = typing.cast(Opaque, monitor.wait_for_output())
+    data = opaque.data
+    assert data["count"] > 1
+    threads = TimeSeries.deserialize(
+        opaque.metadata, data["metrics"]["threads"]
+    )
+    assert threads.count == data["count"]
+    assert threads.min is not None and threads.min >= 1
+
+
+def test_monitor_evaluate_all_metrics() -> None:
+    p = spin_for(SPIN_DURATION)
+    monitor = ProcessMonitor("monitor")
+    cpu = LocalProcessCPUUtilization("cpu")
+    monitor.subscribe(cpu)
+
+    # Blocks until process exit; subscribers get their value all the same
+    data = typing.cast(Opaque, monitor.evaluate(p.pid, poll_interval=0.2)).data
+
+    assert set(data["metrics"].keys()) == {str(m) for m in Metric}
+    assert isinstance(cpu.wait_for_output(), CPUStatistics)
+
+
+def test_subscribe_unsupported() -> None:
+    with pytest.raises(ValueError):
+        ProcessMonitor("monitor").subscribe(ProcessMonitor("other"))
+
+
+def test_samples() -> None:
+    m = EvidenceMetadata(
+        measurement_type="typename", identifier=Identifier(name="id")
+    )
+    samples = ProcessSamples(m, [Metric.CPU, Metric.FDS], max_points=10)
+    samples.append(1.0, {Metric.CPU: 0.5, Metric.FDS: None})
+    samples.append(2.0, {Metric.CPU: 0.25})
+
+    cpu = samples.get(Metric.CPU)
+    assert list(cpu.values) == [0.5, 0.25]
+    assert cpu.max == 0.5
+    data = samples.to_dict()
+    assert data["count"] == 2
+    assert set(data["metrics"].keys()) == {"cpu", "fds"}
+    with pytest.raises(RuntimeError):
+        samples.get(Metric.FDS)
+    with pytest.raises(RuntimeError):
+        samples.get(Metric.RSS)
+
+    # Only a bounded number of points are kept, however many samples are taken.
+    for i in range(3, 1000):
+        samples.append(float(i), {Metric.CPU: 0.1})
+    assert samples.count == 999
+    assert samples.get(Metric.CPU).count == 999
+    assert len(samples.get(Metric.CPU).values) <= 10
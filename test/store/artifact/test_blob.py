@@ -0,0 +1,296 @@
+"""
+test/store/artifact/test_blob.py
+
+Unit tests for storing large value payloads as blobs.
+"""
+
+import typing
+from typing import List, Tuple
+
+import pytest
+
+import mlte.store.error as errors
+from mlte.artifact.model import ArtifactModel
+from mlte.artifact.type import ArtifactType
+from mlte.context.context import Context
+from mlte.context.model import Model, Version
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.store.artifact.blob import BLOB_THRESHOLD, get_digest
+from mlte.store.artifact.store import ArtifactStore, ManagedArtifactSession
+from mlte.store.artifact.underlying.http import (
+    HttpArtifactStore,
+    HttpArtifactStoreSession,
+)
+from mlte.store.query import Query, TypeFilter
+from mlte.value.model import ImageValueModel, ValueModel
+from mlte.value.types.array import Array
+from mlte.value.types.image import Image
+
+from ...fixture.artifact import ArtifactFactory
+from .fixture import (  # noqa
+    artifact_stores,
+    fs_store,
+    http_store,
+    memory_store,
+    rdbs_store,
+    store_with_context,
+)
+
+MODEL_ID = "model0"
+VERSION_IDS = ["version0", "version1"]
+
+
+def make_image(name: str, size: int) -> Image:
+    return Image(
+        EvidenceMetadata(
+            measurement_type="typename", identifier=Identifier(name=name)
+        ),
+        bytes(range(256)) * (size // 256),
+    )
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_large_payload_round_trip(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """Large payloads are stored once per model as blobs, and small ones inline."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    large = make_image("large", 2 * BLOB_THRESHOLD)
+    small = make_image("small", 1024)
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(Model(identifier=MODEL_ID))
+        for version_id in VERSION_IDS:
+            handle.create_version(MODEL_ID, Version(identifier=version_id))
+            for image in [large, small]:
+                handle.write_artifact_with_header(
+                    MODEL_ID, version_id, image.to_model()
+                )
+
+        for version_id in VERSION_IDS:
+            for image in [large, small]:
+                assert (
+                    handle.read_artifact(
+                        MODEL_ID, version_id, image.identifier
+                    ).body
+                    == image.to_model().body
+                )
+
+            # Without resolving, only a reference to the blob is returned.
+            body = handle.read_artifact(
+                MODEL_ID, version_id, large.identifier, resolve_blobs=False
+            ).body
+            assert isinstance(body, ValueModel)
+            assert isinstance(body.value, ImageValueModel)
+            assert body.value.data == ""
+            assert body.value.blob == get_digest(large.image)
+            digest = body.value.blob
+
+        assert digest is not None
+        assert handle.read_blob(MODEL_ID, digest) == large.image
+        with pytest.raises(errors.ErrorNotFound):
+            handle.read_blob(MODEL_ID, get_digest(b"missing"))
+        with pytest.raises(errors.ErrorNotFound):
+            handle.read_blob(MODEL_ID, "../model0")
+
+
+def test_write_with_parents(
+    http_store: HttpArtifactStore,  # noqa
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Parents are created by the write itself, and ahead of it only when a blob has to be written."""
+    with ManagedArtifactSession(http_store.session()) as handle:
+        session = typing.cast(HttpArtifactStoreSession, handle)
+        session.list_models()
+
+        urls: List[str] = []
+        post = session.client.post
+
+        def counting_post(url: str, *args, **kwargs):
+            urls.append(url)
+            return post(url, *args, **kwargs)
+
+        monkeypatch.setattr(session.client, "post", counting_post)
+
+        small = make_image("small", 1024)
+        written = handle.write_artifact_with_header(
+            MODEL_ID, VERSION_IDS[0], small.to_model(), parents=True
+        )
+        assert written.body == small.to_model().body
+        assert len(urls) == 1
+
+        urls.clear()
+        large = make_image("large", 2 * BLOB_THRESHOLD)
+        written = handle.write_artifact_with_header(
+            "model1", VERSION_IDS[0], large.to_model(), parents=True
+        )
+        assert isinstance(written.body, ValueModel)
+        assert isinstance(written.body.value, ImageValueModel)
+        assert written.body.value.blob is not None
+        assert [url.rsplit("/", 1)[-1] for url in urls] == [
+            "model",
+            "version",
+            "blob",
+            "artifact",
+        ]
+        assert (
+            handle.read_artifact(
+                "model1", VERSION_IDS[0], written.header.identifier
+            ).body
+            == large.to_model().body
+        )
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_stream_blob(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """Blobs can be written and read in chunks."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    chunks = [bytes([i]) * 1000 for i in range(10)]
+    data = b"".join(chunks)
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(Model(identifier=MODEL_ID))
+
+        digest = handle.write_blob_stream(MODEL_ID, iter(chunks))
+        assert digest == get_digest(data)
+        assert handle.write_blob_stream(MODEL_ID, iter(chunks)) == digest
+
+        assert b"".join(handle.iter_blob(MODEL_ID, digest, 4096)) == data
+        assert handle.read_blob(MODEL_ID, digest) == data
+        with pytest.raises(errors.ErrorNotFound):
+            list(handle.iter_blob(MODEL_ID, get_digest(b"missing")))
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_iter_artifacts(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """Artifacts can be iterated over across pages, optionally filtered."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    version_id = VERSION_IDS[0]
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(Model(identifier=MODEL_ID))
+        handle.create_version(MODEL_ID, Version(identifier=version_id))
+        for i in range(5):
+            handle.write_artifact(
+                MODEL_ID,
+                version_id,
+                ArtifactFactory.make(ArtifactType.VALUE, f"value{i}"),
+            )
+        handle.write_artifact(
+            MODEL_ID,
+            version_id,
+            ArtifactFactory.make(ArtifactType.NEGOTIATION_CARD, "card0"),
+        )
+
+        assert (
+            len(list(handle.iter_artifacts(MODEL_ID, version_id, page_size=2)))
+            == 6
+        )
+        assert sorted(
+            a.header.identifier
+            for a in handle.iter_artifacts(
+                MODEL_ID,
+                version_id,
+                Query(filter=TypeFilter(item_type=ArtifactType.VALUE)),
+                page_size=2,
+            )
+        ) == [f"value{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize(
+    "store_fixture_name", ["memory_store", "fs_store", "rdbs_store"]
+)
+def test_sweep_blobs(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """Blobs left behind by deleted or overwritten artifacts are found and removed, and shared ones kept."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    shared = make_image("shared", 2 * BLOB_THRESHOLD)
+    deleted = make_image("deleted", 4 * BLOB_THRESHOLD)
+    overwritten = make_image("overwritten", 6 * BLOB_THRESHOLD)
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(Model(identifier=MODEL_ID))
+        for version_id in VERSION_IDS:
+            handle.create_version(MODEL_ID, Version(identifier=version_id))
+            handle.write_artifact_with_header(
+                MODEL_ID, version_id, shared.to_model()
+            )
+        for image in [deleted, overwritten]:
+            handle.write_artifact_with_header(
+                MODEL_ID, VERSION_IDS[0], image.to_model()
+            )
+        assert len(handle.list_blobs(MODEL_ID)) == 3
+        assert handle.sweep_blobs(MODEL_ID) == []
+
+        digests = {
+            get_blob_digest(
+                handle.read_artifact(
+                    MODEL_ID,
+                    VERSION_IDS[0],
+                    image.to_model().header.identifier,
+                    resolve_blobs=False,
+                )
+            ): image
+            for image in [shared, deleted, overwritten]
+        }
+        handle.delete_artifact(
+            MODEL_ID, VERSION_IDS[0], deleted.to_model().header.identifier
+        )
+        handle.delete_artifact(
+            MODEL_ID, VERSION_IDS[0], shared.to_model().header.identifier
+        )
+        replacement = make_image("overwritten", BLOB_THRESHOLD // 2)
+        handle.write_artifact_with_header(
+            MODEL_ID, VERSION_IDS[0], replacement.to_model(), force=True
+        )
+
+        unreferenced = handle.sweep_blobs(MODEL_ID)
+        assert {digests[digest].identifier for digest in unreferenced} == {
+            deleted.identifier,
+            overwritten.identifier,
+        }
+        assert len(handle.list_blobs(MODEL_ID)) == 3
+
+        assert handle.sweep_blobs(MODEL_ID, remove=True) == unreferenced
+        assert handle.sweep_blobs(MODEL_ID) == []
+        assert len(handle.list_blobs(MODEL_ID)) == 1
+        assert (
+            handle.read_artifact(
+                MODEL_ID, VERSION_IDS[1], shared.to_model().header.identifier
+            ).body
+            == shared.to_model().body
+        )
+
+
+def get_blob_digest(artifact: ArtifactModel) -> str:
+    assert isinstance(artifact.body, ValueModel)
+    assert isinstance(artifact.body.value, ImageValueModel)
+    assert artifact.body.value.blob is not None
+    return artifact.body.value.blob
+
+
+def test_lazy_load(
+    store_with_context: Tuple[ArtifactStore, Context]  # noqa
+) -> None:
+    """Values with large payloads are loaded without them, reading them on first access."""
+    store, ctx = store_with_context
+
+    values = list(range(BLOB_THRESHOLD))
+    Array(
+        EvidenceMetadata(
+            measurement_type="typename", identifier=Identifier(name="id")
+        ),
+        values,
+    ).save_with(ctx, store)
+
+    array = typing.cast(
+        Array, Array.load_with("id.value", context=ctx, store=store)
+    )
+    assert array.blob is not None
+    assert array.array == values
+    assert array.blob is None
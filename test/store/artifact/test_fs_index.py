@@ -0,0 +1,141 @@
+"""
+test/store/artifact/test_fs_index.py
+
+Unit tests for the artifact index of the local file system artifact store.
+"""
+
+from pathlib import Path
+
+from mlte.artifact.type import ArtifactType
+from mlte.context.model import Model, Version
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.fs import (
+    LocalFileSystemStore,
+    LocalFileSystemStoreSession,
+)
+from mlte.store.artifact.underlying.fs_index import (
+    ArtifactIndex,
+    ArtifactIndexModel,
+)
+from mlte.store.query import Query, TypeFilter
+from test.store.artifact import artifact_store_creators
+
+from ...fixture.artifact import ArtifactFactory
+
+MODEL_ID = "model0"
+VERSION_ID = "version0"
+
+
+def create_store(tmp_path: Path) -> LocalFileSystemStore:
+    """Creates a store with a model and version with one value and one negotiation card."""
+    store = artifact_store_creators.create_fs_store(tmp_path)
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(Model(identifier=MODEL_ID))
+        handle.create_version(MODEL_ID, Version(identifier=VERSION_ID))
+        for artifact_id, type in [
+            ("value0", ArtifactType.VALUE),
+            ("card0", ArtifactType.NEGOTIATION_CARD),
+        ]:
+            handle.write_artifact(
+                MODEL_ID, VERSION_ID, ArtifactFactory.make(type, artifact_id)
+            )
+    return store
+
+
+def version_index(store: LocalFileSystemStore) -> ArtifactIndex:
+    return ArtifactIndex(Path(store.storage.base_path, MODEL_ID, VERSION_ID))
+
+
+def test_index_updated_on_write_and_delete(tmp_path) -> None:
+    """Writes and deletes keep the index consistent."""
+    store = create_store(tmp_path)
+    index = version_index(store)
+
+    entries = index.entries()
+    assert [e.identifier for e in entries] == ["card0", "value0"]
+    assert entries[1].value_class is not None
+    assert index.check() == []
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.delete_artifact(MODEL_ID, VERSION_ID, "card0")
+        assert [
+            a.header.identifier
+            for a in handle.search_artifacts(
+                MODEL_ID,
+                VERSION_ID,
+                Query(filter=TypeFilter(item_type=ArtifactType.VALUE)),
+            )
+        ] == ["value0"]
+    assert [e.identifier for e in index.entries()] == ["value0"]
+    assert index.check() == []
+
+
+def test_index_written_once_per_change(tmp_path, monkeypatch) -> None:
+    """Each write and delete rewrites the index once, though they change the folder."""
+    store = create_store(tmp_path)
+    writes = []
+    write = ArtifactIndex._write
+
+    def counted_write(self: ArtifactIndex, index: ArtifactIndexModel) -> None:
+        writes.append(index)
+        write(self, index)
+
+    monkeypatch.setattr(ArtifactIndex, "_write", counted_write)
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.write_artifact(
+            MODEL_ID,
+            VERSION_ID,
+            ArtifactFactory.make(ArtifactType.VALUE, "value1"),
+        )
+        assert len(writes) == 1
+        handle.delete_artifact(MODEL_ID, VERSION_ID, "value1")
+        assert len(writes) == 2
+    assert version_index(store).check() == []
+
+
+def test_index_deleted_with_version(tmp_path) -> None:
+    """Deleting a version leaves neither its index nor the index lock behind."""
+    store = create_store(tmp_path)
+    model_path = Path(store.storage.base_path, MODEL_ID)
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.delete_version(MODEL_ID, VERSION_ID)
+    assert list(model_path.iterdir()) == []
+
+
+def test_index_rebuilt_when_corrupt(tmp_path) -> None:
+    """A corrupt index is detected and rebuilt from the artifact files."""
+    store = create_store(tmp_path)
+    index = version_index(store)
+    index.index_path.write_text("{not json")
+
+    session: LocalFileSystemStoreSession = store.session()
+    with ManagedArtifactSession(session) as handle:
+        problems = session.check_index(MODEL_ID, VERSION_ID)
+        assert len(problems) == 1
+
+        artifacts = handle.read_artifacts(MODEL_ID, VERSION_ID)
+        assert [a.header.identifier for a in artifacts] == ["card0", "value0"]
+    assert index.check() == []
+
+
+def test_index_detects_external_changes(tmp_path) -> None:
+    """Artifact files added or removed outside the store are picked up."""
+    store = create_store(tmp_path)
+    index = version_index(store)
+
+    Path(index.version_path, "card0.json").unlink()
+    store.storage.write_json_to_file(
+        Path(index.version_path, "value1.json"),
+        ArtifactFactory.make(ArtifactType.VALUE, "value1").to_json(),
+    )
+    assert len(index.check()) == 2
+
+    session: LocalFileSystemStoreSession = store.session()
+    with ManagedArtifactSession(session) as handle:
+        assert len(session.check_index(MODEL_ID, VERSION_ID, rebuild=True)) == 2
+        assert session.check_index(MODEL_ID, VERSION_ID) == []
+
+        artifacts = handle.read_artifacts(MODEL_ID, VERSION_ID)
+        assert [a.header.identifier for a in artifacts] == ["value0", "value1"]
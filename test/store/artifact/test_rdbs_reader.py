@@ -0,0 +1,86 @@
+"""
+test/store/artifact/test_rdbs_reader.py
+
+Unit tests for loading artifacts from the relational DB artifact store.
+"""
+
+from typing import List
+
+import pytest
+from sqlalchemy import event
+
+from mlte.artifact.model import ArtifactModel
+from mlte.artifact.type import ArtifactType
+from mlte.context.model import Model, Version
+from mlte.store.artifact.store import (
+    ArtifactStoreSession,
+    ManagedArtifactSession,
+)
+from mlte.store.artifact.underlying.rdbs.store import RelationalDBArtifactStore
+from test.store.artifact import artifact_store_creators
+
+from ...fixture.artifact import (
+    ArtifactFactory,
+    make_complete_validated_spec_model,
+)
+
+
+def count_read_queries(
+    store: RelationalDBArtifactStore,
+    handle: ArtifactStoreSession,
+    model_id: str,
+    version_id: str,
+) -> int:
+    """Reads all artifacts in the version and returns how many SQL statements were executed."""
+    statements: List[str] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(store.storage.engine, "before_cursor_execute", on_execute)
+    try:
+        _ = handle.read_artifacts(model_id, version_id)
+    finally:
+        event.remove(store.storage.engine, "before_cursor_execute", on_execute)
+    return len(statements)
+
+
+SPEC_ID = "spec"
+"""The identifier of the spec that validated specs are linked to."""
+
+
+def make_artifact(artifact_type: ArtifactType, id: str) -> ArtifactModel:
+    """Makes a complete artifact; validated specs are linked to the spec written before them."""
+    artifact = ArtifactFactory.make(artifact_type, id, complete=True)
+    if artifact_type == ArtifactType.VALIDATED_SPEC:
+        artifact.body = make_complete_validated_spec_model()
+        artifact.body.spec_identifier = SPEC_ID
+    return artifact
+
+
+@pytest.mark.parametrize("artifact_type", list(ArtifactType))
+def test_read_artifacts_query_count(artifact_type: ArtifactType) -> None:
+    """Reading artifacts of a type takes the same number of queries regardless of how many there are."""
+    store = artifact_store_creators.create_rdbs_store()
+    model_id = "model0"
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(Model(identifier=model_id))
+        for version_id, count in [("small", 1), ("large", 5)]:
+            handle.create_version(model_id, Version(identifier=version_id))
+            if artifact_type == ArtifactType.VALIDATED_SPEC:
+                handle.write_artifact(
+                    model_id,
+                    version_id,
+                    make_artifact(ArtifactType.SPEC, SPEC_ID),
+                )
+            for i in range(count):
+                handle.write_artifact(
+                    model_id,
+                    version_id,
+                    make_artifact(artifact_type, f"{artifact_type}{i}"),
+                )
+
+        small = count_read_queries(store, handle, model_id, "small")
+        large = count_read_queries(store, handle, model_id, "large")
+        assert small == large
@@ -0,0 +1,58 @@
+"""
+test/store/artifact/test_rdbs_replicas.py
+
+Unit tests for reading from replicas of the relational DB artifact store.
+"""
+
+from pathlib import Path
+
+from mlte.context.model import Model
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.rdbs.store import RelationalDBArtifactStore
+from mlte.store.base import StoreURI
+
+
+def create_db(path: Path) -> str:
+    """Creates an SQLite DB with the store tables, and returns its URI."""
+    uri = f"sqlite:///{path}"
+    RelationalDBArtifactStore(StoreURI.from_string(uri)).close()
+    return uri
+
+
+def test_reads_go_to_replicas(tmp_path: Path) -> None:
+    """Reads go to replicas, except for sessions that wrote, and writes go to the primary DB."""
+    primary_uri = create_db(tmp_path / "primary.db")
+    replica_uri = create_db(tmp_path / "replica.db")
+
+    store = RelationalDBArtifactStore(
+        StoreURI.from_string(primary_uri), read_uris=[replica_uri]
+    )
+    no_stickiness_store = RelationalDBArtifactStore(
+        StoreURI.from_string(primary_uri),
+        read_uris=[replica_uri],
+        read_your_writes=False,
+    )
+    primary = RelationalDBArtifactStore(StoreURI.from_string(primary_uri))
+    replica = RelationalDBArtifactStore(StoreURI.from_string(replica_uri))
+    try:
+        with ManagedArtifactSession(store.session()) as handle:
+            handle.create_model(Model(identifier="model0"))
+            assert handle.list_models() == ["model0"]
+        with ManagedArtifactSession(primary.session()) as handle:
+            assert handle.list_models() == ["model0"]
+
+        # The replica did not get the write yet.
+        with ManagedArtifactSession(store.session()) as handle:
+            assert handle.list_models() == []
+        with ManagedArtifactSession(no_stickiness_store.session()) as handle:
+            handle.create_model(Model(identifier="model1"))
+            assert handle.list_models() == []
+
+        # Once replicated, writes are read from the replica.
+        with ManagedArtifactSession(replica.session()) as handle:
+            handle.create_model(Model(identifier="model0"))
+        with ManagedArtifactSession(store.session()) as handle:
+            assert handle.read_model("model0").identifier == "model0"
+    finally:
+        for s in [store, no_stickiness_store, primary, replica]:
+            s.close()
@@ -4,6 +4,8 @@ test/store/test_underlying.py
 Unit tests for the underlying artifact store implementations.
 """
 
+from typing import List
+
 import pytest
 
 import mlte.store.error as errors
@@ -15,6 +17,14 @@ from mlte.store.artifact.store import (
     ArtifactStoreSession,
     ManagedArtifactSession,
 )
+from mlte.store.query import (
+    AndFilter,
+    IdentifierFilter,
+    NoneFilter,
+    OrFilter,
+    Query,
+    TypeFilter,
+)
 from test.backend.fixture.user_generator import TEST_API_USERNAME
 from test.store.artifact import artifact_store_creators
 
@@ -222,6 +232,111 @@ def test_search(
         assert len(artifacts) == 2
 
 
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_search_filters(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """An artifact store returns only the artifacts matching a query filter."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(Model(identifier=model_id))
+        handle.create_version(model_id, Version(identifier=version_id))
+
+        for artifact in [
+            ArtifactFactory.make(ArtifactType.NEGOTIATION_CARD, "card0"),
+            ArtifactFactory.make(ArtifactType.VALUE, "value0"),
+            ArtifactFactory.make(ArtifactType.VALUE, "value1"),
+        ]:
+            handle.write_artifact(model_id, version_id, artifact)
+
+        def search(query: Query):
+            return sorted(
+                a.header.identifier
+                for a in handle.search_artifacts(model_id, version_id, query)
+            )
+
+        assert search(Query(filter=IdentifierFilter(id="value1"))) == ["value1"]
+        assert search(
+            Query(filter=TypeFilter(item_type=ArtifactType.VALUE))
+        ) == ["value0", "value1"]
+        assert (
+            search(
+                Query(
+                    filter=AndFilter(
+                        filters=[
+                            TypeFilter(item_type=ArtifactType.VALUE),
+                            IdentifierFilter(id="card0"),
+                        ]
+                    )
+                )
+            )
+            == []
+        )
+        assert search(
+            Query(
+                filter=OrFilter(
+                    filters=[
+                        TypeFilter(item_type=ArtifactType.NEGOTIATION_CARD),
+                        IdentifierFilter(id="value0"),
+                    ]
+                )
+            )
+        ) == ["card0", "value0"]
+        assert search(Query(filter=NoneFilter())) == []
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_read_artifacts_pages(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """Artifacts can be paged through with offsets or cursors, in a stable order."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(Model(identifier=model_id))
+        handle.create_version(model_id, Version(identifier=version_id))
+
+        for i in range(5):
+            handle.write_artifact(
+                model_id,
+                version_id,
+                ArtifactFactory.make(ArtifactType.VALUE, f"value{i}"),
+            )
+
+        all_ids = [
+            a.header.identifier
+            for a in handle.read_artifacts(model_id, version_id)
+        ]
+        assert sorted(all_ids) == [f"value{i}" for i in range(5)]
+
+        offset_page = handle.read_artifacts(
+            model_id, version_id, limit=2, offset=2
+        )
+        assert [a.header.identifier for a in offset_page] == all_ids[2:4]
+
+        paged_ids: List[str] = []
+        cursor = None
+        while True:
+            page, cursor = handle.read_artifacts_page(
+                model_id, version_id, limit=2, cursor=cursor
+            )
+            paged_ids.extend(a.header.identifier for a in page)
+            if cursor is None:
+                break
+        assert paged_ids == all_ids
+
+        # Empty pages would never advance; the backend rejects them before the store.
+        with pytest.raises((ValueError, errors.InternalError)):
+            handle.read_artifacts_page(model_id, version_id, limit=0)
+
+
 @pytest.mark.parametrize(
     "store_fixture_name,artifact_type,complete", artifact_stores_and_types()
 )
@@ -364,3 +479,49 @@ def test_artifact_overwrite(
 
         # Attempt to write with `force` succeeds
         _ = handle.write_artifact(model_id, version_id, artifact, force=True)
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_artifacts_bulk(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """Several artifacts can be written and read at once, all or none."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+    artifacts = [
+        ArtifactFactory.make(ArtifactType(type), f"id{i}")
+        for i, type in enumerate(ArtifactType)
+    ]
+    artifact_ids = [artifact.header.identifier for artifact in artifacts]
+
+    with ManagedArtifactSession(store.session()) as handle:
+        _ = handle.write_artifacts(
+            model_id, version_id, artifacts[1:], parents=True
+        )
+
+        # A batch with an existing artifact, or with a repeated one, is not written at all.
+        with pytest.raises(errors.ErrorAlreadyExists):
+            _ = handle.write_artifacts(model_id, version_id, artifacts)
+        with pytest.raises(errors.ErrorAlreadyExists):
+            _ = handle.write_artifacts(
+                model_id, version_id, [artifacts[0], artifacts[0]]
+            )
+        with pytest.raises(errors.ErrorNotFound):
+            _ = handle.read_artifact(model_id, version_id, artifact_ids[0])
+
+        _ = handle.write_artifacts(model_id, version_id, artifacts, force=True)
+
+        # Over HTTP, the header is completed by the server, so compare bodies.
+        read = handle.read_artifacts_by_ids(
+            model_id, version_id, list(reversed(artifact_ids))
+        )
+        assert [a.header.identifier for a in read] == artifact_ids[::-1]
+        assert [a.body for a in read] == [a.body for a in artifacts[::-1]]
+        assert handle.read_artifacts_by_ids(model_id, version_id, []) == []
+
+        with pytest.raises(errors.ErrorNotFound):
+            _ = handle.read_artifacts_by_ids(
+                model_id, version_id, [artifact_ids[0], "missing"]
+            )
@@ -0,0 +1,174 @@
+"""
+test/store/test_fs_storage.py
+
+Unit tests for the common file system storage.
+"""
+
+import multiprocessing
+import threading
+from pathlib import Path
+
+import pytest
+
+from mlte.store.base import StoreURI
+from mlte.store.common.fs_codec import CODECS, get_codec
+from mlte.store.common.fs_storage import (
+    FileSystemStorage,
+    FsyncPolicy,
+    JsonFileStorage,
+    reencode_files,
+)
+
+OPTIONAL_PACKAGES = {
+    "orjson": "orjson",
+    "zstd": "zstandard",
+    "msgpack": "msgpack",
+}
+"""Packages needed by codecs that are not always installed."""
+
+
+def codecs():
+    """Yields the codec names, marking those that can't run here to be skipped."""
+    for name in CODECS:
+        package = OPTIONAL_PACKAGES.get(name)
+        try:
+            if package is not None:
+                __import__(package)
+            yield name
+        except ImportError:
+            yield pytest.param(
+                name, marks=pytest.mark.skip(f"{package} is not installed")
+            )
+
+
+def create_storage(tmp_path: Path, options: str = "") -> FileSystemStorage:
+    return FileSystemStorage(
+        StoreURI.from_string(f"fs://{tmp_path}{options}"), "resources"
+    )
+
+
+def increment(path: Path, times: int, remove: bool = False) -> None:
+    """Increments a counter stored in a file, doing a read-modify-write under the lock."""
+    for _ in range(times):
+        with JsonFileStorage.lock(path, remove):
+            data = JsonFileStorage.read_json_file(path)
+            JsonFileStorage.write_json_to_file(
+                path, {"count": data["count"] + 1}
+            )
+
+
+@pytest.mark.parametrize("fsync", list(FsyncPolicy))
+def test_write_replaces_atomically(tmp_path: Path, fsync: FsyncPolicy) -> None:
+    """Writes replace the previous file and leave no temporary files behind."""
+    storage = create_storage(tmp_path, f"?fsync={fsync}")
+    assert storage.root == tmp_path
+    assert storage.fsync == fsync
+
+    storage.write_resource("r0", {"a": 1})
+    storage.write_resource("r0", {"a": 2})
+    assert storage.read_resource("r0") == {"a": 2}
+    assert storage.list_resources() == ["r0"]
+
+    # A write that fails halfway keeps the previous contents.
+    with pytest.raises(TypeError):
+        storage.write_resource("r0", {"a": object()})
+    assert storage.read_resource("r0") == {"a": 2}
+    assert not list(storage.base_path.glob("*.tmp"))
+
+    storage.delete_resource("r0")
+    assert storage.list_resources() == []
+    assert list(storage.base_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("codec", codecs())
+def test_codecs(tmp_path: Path, codec: str) -> None:
+    """Files written with any codec are read back, whatever the codec configured for reading."""
+    data = {"a": [1, 2.5, None, True], "b": {"c": "text"}}
+    storage = create_storage(tmp_path, f"?codec={codec}&fsync=file")
+    assert storage.codec.name == codec
+
+    storage.write_resource("r0", data)
+    assert create_storage(tmp_path).read_resource("r0") == data
+    assert storage.list_resources() == ["r0"]
+
+
+@pytest.mark.parametrize("codec", codecs())
+def test_reencode_files(tmp_path: Path, codec: str) -> None:
+    """Existing files are re-encoded in place with a new codec."""
+    data = {"a": 1}
+    storage = create_storage(tmp_path)
+    storage.write_resource("r0", data)
+    storage.write_resource("r1", data)
+
+    target = get_codec(codec)
+    expected = 0 if codec == "json" else 2
+    assert reencode_files(tmp_path, target, FsyncPolicy.NONE) == expected
+    assert reencode_files(tmp_path, target, FsyncPolicy.NONE) == 0
+
+    assert storage.read_resource("r0") == data
+    assert Path(storage.base_path, "r1.json").read_bytes() == target.encode(
+        data
+    )
+
+
+def test_invalid_codec(tmp_path: Path) -> None:
+    """An unknown codec in the URI is rejected."""
+    with pytest.raises(RuntimeError):
+        _ = create_storage(tmp_path, "?codec=xml")
+
+
+def test_invalid_fsync_policy(tmp_path: Path) -> None:
+    """An unknown durability policy in the URI is rejected."""
+    with pytest.raises(RuntimeError):
+        _ = create_storage(tmp_path, "?fsync=always")
+
+
+def test_lock_threads(tmp_path: Path) -> None:
+    """The lock serializes threads of the same process."""
+    path = Path(tmp_path, "counter.json")
+    JsonFileStorage.write_json_to_file(path, {"count": 0})
+
+    threads = [
+        threading.Thread(target=increment, args=(path, 20)) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert JsonFileStorage.read_json_file(path) == {"count": 80}
+
+
+def test_lock_processes(tmp_path: Path) -> None:
+    """The lock serializes separate processes sharing the storage."""
+    path = Path(tmp_path, "counter.json")
+    JsonFileStorage.write_json_to_file(path, {"count": 0})
+
+    processes = [
+        multiprocessing.Process(target=increment, args=(path, 20))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert JsonFileStorage.read_json_file(path) == {"count": 80}
+
+
+def test_lock_processes_removed(tmp_path: Path) -> None:
+    """The lock still serializes processes when its sidecar file is removed on release."""
+    path = Path(tmp_path, "counter.json")
+    JsonFileStorage.write_json_to_file(path, {"count": 0})
+
+    processes = [
+        multiprocessing.Process(target=increment, args=(path, 20, True))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert JsonFileStorage.read_json_file(path) == {"count": 80}
+    assert list(tmp_path.iterdir()) == [path]
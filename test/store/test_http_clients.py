@@ -0,0 +1,143 @@
+"""
+test/store/test_http_clients.py
+
+Unit tests for the HTTP clients used by remote stores.
+"""
+
+import concurrent.futures
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mlte._private.fixed_json import json
+from mlte.backend.api import codes
+from mlte.backend.api.etag import ETAG_HEADER, IF_NONE_MATCH_HEADER
+from mlte.store.common.http_clients import RequestsClient
+
+API_URL = "http://localhost:8080/api"
+
+
+class TokenServerAdapter(HTTPAdapter):
+    """Answers requests locally: issues tokens, and rejects requests without a current one."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.issued = 0
+        """The number of tokens issued."""
+
+        self.valid: set[str] = set()
+        """The tokens that are currently accepted."""
+
+        self.token_delay = 0.0
+        """Seconds it takes to issue a token."""
+
+        self.unauthenticated = 0
+        """The number of requests, other than for tokens, sent without a token."""
+
+    def send(self, request, *args, **kwargs) -> requests.Response:
+        if request.url.endswith("/token"):
+            time.sleep(self.token_delay)
+            self.issued += 1
+            token = f"token{self.issued}"
+            self.valid = {token}
+            status = codes.OK
+            body = {
+                "access_token": token,
+                "token_type": "bearer",
+                "expires_in": 3600,
+            }
+        elif "Authorization" not in request.headers:
+            self.unauthenticated += 1
+            status, body = codes.UNAUTHORIZED, {"detail": "Not authenticated."}
+        elif request.headers.get(IF_NONE_MATCH_HEADER) == '"tag"':
+            status, body = codes.NOT_MODIFIED, None
+        elif request.headers.get("Authorization") in {
+            f"Bearer {token}" for token in self.valid
+        }:
+            status, body = codes.OK, {}
+        else:
+            status, body = codes.UNAUTHORIZED, {"detail": "Invalid token."}
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = status
+        response._content = (
+            b"" if body is None else json.dumps(body).encode("utf-8")
+        )
+        if request.url.endswith("/tagged"):
+            response.headers[ETAG_HEADER] = '"tag"'
+        return response
+
+
+def create_client() -> tuple[RequestsClient, TokenServerAdapter]:
+    client = RequestsClient(username="user", password="pass")
+    adapter = TokenServerAdapter()
+    client.session.mount("http://", adapter)
+    return client, adapter
+
+
+def test_token_reused() -> None:
+    """A token is reused across sessions until it is about to expire."""
+    client, adapter = create_client()
+
+    client.ensure_authenticated(API_URL)
+    client.ensure_authenticated(API_URL)
+    assert adapter.issued == 1
+
+    client.token_expiration = time.monotonic() - 1
+    client.ensure_authenticated(API_URL)
+    assert adapter.issued == 2
+
+
+def test_token_refreshed_on_unauthorized() -> None:
+    """A request rejected for its token is sent again with a new one."""
+    client, adapter = create_client()
+    client.ensure_authenticated(API_URL)
+
+    adapter.valid = set()
+    response = client.get(f"{API_URL}/model")
+    assert response.status_code == codes.OK
+    assert adapter.issued == 2
+
+    # Bodies read from iterators can't be sent again.
+    adapter.valid = set()
+    response = client.post(f"{API_URL}/model", data=iter([b"data"]))
+    assert response.status_code == codes.UNAUTHORIZED
+    assert adapter.issued == 2
+
+
+def test_token_refreshed_once_across_threads() -> None:
+    """While a token is refreshed, other threads keep sending one, and only one new token is requested."""
+    client, adapter = create_client()
+    client.ensure_authenticated(API_URL)
+
+    adapter.valid = set()
+    adapter.token_delay = 0.2
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        responses = list(
+            pool.map(lambda _: client.get(f"{API_URL}/model"), range(8))
+        )
+
+    assert all(response.status_code == codes.OK for response in responses)
+    assert adapter.issued == 2
+    assert adapter.unauthenticated == 0
+
+
+def test_get_cached() -> None:
+    """Tagged responses are revalidated, and reused while the server does not modify them."""
+    client, adapter = create_client()
+    client.ensure_authenticated(API_URL)
+
+    assert client.get_cached(f"{API_URL}/tagged").json() == {}
+    cached = client.response_cache.get(f"{API_URL}/tagged")
+    response = client.get_cached(f"{API_URL}/tagged")
+    assert response is cached
+    assert response.json() == {}
+    assert response.etag == '"tag"'
+
+    # Untagged responses are not kept.
+    client.get_cached(f"{API_URL}/model")
+    assert client.response_cache.get(f"{API_URL}/model") is None
@@ -9,6 +9,7 @@ from typing import List
 import pytest
 
 import mlte.store.error as errors
+from mlte.store.user.policy import Policy
 from mlte.store.user.store import UserStore
 from mlte.store.user.store_session import ManagedUserSession, UserStoreSession
 from mlte.user.model import (
@@ -248,3 +249,72 @@ def test_permission(
         user_store.permission_mapper.delete(test_permission1.to_str())
         with pytest.raises(errors.ErrorNotFound):
             user_store.permission_mapper.read(test_permission1.to_str())
+
+
+@pytest.mark.parametrize("store_fixture_name", user_stores())
+def test_policies(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """A user store supports checking, creating and deleting whole policies at once."""
+    store: UserStore = request.getfixturevalue(store_fixture_name)
+
+    with ManagedUserSession(store.session()) as user_store:
+        assert not Policy.is_stored(ResourceType.MODEL, TEST_MOD_ID, user_store)
+
+        Policy.create(ResourceType.MODEL, TEST_MOD_ID, user_store)
+        assert Policy.is_stored(ResourceType.MODEL, TEST_MOD_ID, user_store)
+        for group in Policy.build_groups(ResourceType.MODEL, TEST_MOD_ID):
+            assert {
+                permission.to_str()
+                for permission in user_store.group_mapper.read(
+                    group.name
+                ).permissions
+            } == {permission.to_str() for permission in group.permissions}
+
+        # Nothing is created if any part exists.
+        with pytest.raises(errors.ErrorAlreadyExists):
+            user_store.create_policies(
+                Policy.build_permissions(ResourceType.MODEL, "mod2"),
+                Policy.build_groups(ResourceType.MODEL, TEST_MOD_ID),
+            )
+        assert not Policy.is_stored(ResourceType.MODEL, "mod2", user_store)
+
+        # Nothing is created if a group refers to a missing permission.
+        missing = Permission(
+            resource_type=ResourceType.MODEL,
+            resource_id="mod3",
+            method=MethodType.GET,
+        )
+        with pytest.raises(errors.ErrorNotFound):
+            user_store.create_policies(
+                [], [Group(name="mod3-group", permissions=[missing])]
+            )
+        assert user_store.find_stored_policies([], ["mod3-group"])[1] == set()
+
+        # Nothing is deleted if any part is missing.
+        with pytest.raises(errors.ErrorNotFound):
+            user_store.delete_policies(
+                [
+                    permission.to_str()
+                    for permission in Policy.build_permissions(
+                        ResourceType.MODEL, TEST_MOD_ID
+                    )
+                ],
+                ["missing"],
+            )
+        assert Policy.is_stored(ResourceType.MODEL, TEST_MOD_ID, user_store)
+
+        Policy.remove(ResourceType.MODEL, TEST_MOD_ID, user_store)
+        assert not Policy.is_stored(ResourceType.MODEL, TEST_MOD_ID, user_store)
+        assert (
+            user_store.find_stored_policies(
+                [
+                    permission.to_str()
+                    for permission in Policy.build_permissions(
+                        ResourceType.MODEL, TEST_MOD_ID
+                    )
+                ],
+                [],
+            )[0]
+            == set()
+        )
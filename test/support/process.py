@@ -0,0 +1,40 @@
+"""
+test/support/process.py
+
+Helpers to run the spin.py program as a measured process.
+"""
+
+import os
+import subprocess
+import threading
+
+from .meta import path_to_support
+
+
+def spin_for(seconds: int) -> subprocess.Popen[bytes]:
+    """
+    Run the spin.py program for `seconds`.
+    :return The running process
+    """
+    path = os.path.join(path_to_support(), "spin.py")
+    prog = subprocess.Popen(["python", path, f"{seconds}"])
+    thread = threading.Thread(target=lambda: prog.wait())
+    thread.start()
+    return prog
+
+
+def spin_tree_for(seconds: int, children: int) -> subprocess.Popen[bytes]:
+    """
+    Run a program that runs spin.py for `seconds` in each of `children` subprocesses.
+    :return The running parent process
+    """
+    path = os.path.join(path_to_support(), "spin.py")
+    script = (
+        "import subprocess, sys\n"
+        f"ps = [subprocess.Popen([sys.executable, {path!r}, '{seconds}']) for _ in range({children})]\n"
+        "for p in ps: p.wait()\n"
+    )
+    prog = subprocess.Popen(["python", "-c", script])
+    thread = threading.Thread(target=lambda: prog.wait())
+    thread.start()
+    return prog
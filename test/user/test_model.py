@@ -6,7 +6,12 @@ Test the user and permission functions.
 
 import pytest
 
-from mlte.user.model import MethodType, Permission, ResourceType
+from mlte.user.model import (
+    MethodType,
+    Permission,
+    PermissionIndex,
+    ResourceType,
+)
 
 
 @pytest.mark.parametrize(
@@ -212,3 +217,52 @@ def test_permission_granted_id_method(
     permission_granted = permission.grants_access(requested)
 
     assert permission_granted
+
+
+def test_permission_index() -> None:
+    """Checks that indexed permissions grant the same access as each permission does."""
+    permissions = [
+        Permission(
+            resource_type=ResourceType.MODEL,
+            resource_id="1",
+            method=MethodType.GET,
+        ),
+        Permission(
+            resource_type=ResourceType.MODEL,
+            resource_id="2",
+            method=MethodType.ANY,
+        ),
+        Permission(
+            resource_type=ResourceType.USER,
+            resource_id=None,
+            method=MethodType.PUT,
+        ),
+    ]
+    index = PermissionIndex(permissions)
+
+    for resource_type in ResourceType:
+        for resource_id in [None, "1", "2", "3"]:
+            for method in MethodType:
+                requested = Permission(
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                    method=method,
+                )
+                assert index.grants_access(requested) == any(
+                    permission.grants_access(requested)
+                    for permission in permissions
+                )
+
+    ids = ["3", "2", "1"]
+    assert index.filter_resource_ids(
+        ResourceType.MODEL, MethodType.GET, ids
+    ) == ["2", "1"]
+    assert index.filter_resource_ids(
+        ResourceType.MODEL, MethodType.POST, ids
+    ) == ["2"]
+    assert (
+        index.filter_resource_ids(ResourceType.USER, MethodType.PUT, ids) == ids
+    )
+    assert (
+        index.filter_resource_ids(ResourceType.USER, MethodType.GET, ids) == []
+    )
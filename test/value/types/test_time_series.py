@@ -0,0 +1,126 @@
+"""
+test/value/types/test_time_series.py
+
+Unit tests for TimeSeries.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import typing
+from typing import Tuple
+
+import pytest
+
+from mlte.context.context import Context
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.measurement.utility import percentile
+from mlte.store.artifact.store import ArtifactStore
+from mlte.value.types.time_series import QuantileSketch, TimeSeries
+from test.store.artifact.fixture import store_with_context  # noqa
+
+
+def make_series(values, max_points: int = 64) -> TimeSeries:
+    m = EvidenceMetadata(
+        measurement_type="typename", identifier=Identifier(name="id")
+    )
+    series = TimeSeries(m, max_points=max_points)
+    for i, value in enumerate(values):
+        series.append(float(i), value)
+    return series
+
+
+def test_statistics():
+    """Statistics summarize all points, not only those kept."""
+    rng = random.Random(0)
+    values = [rng.uniform(0, 100) for _ in range(10000)]
+    series = make_series(values)
+
+    assert len(series.values) <= 64
+    assert series.count == len(values)
+    assert series.min == min(values)
+    assert series.max == max(values)
+    assert series.mean == pytest.approx(sum(values) / len(values))
+    for q in [50, 95, 99]:
+        assert series.percentile(q) == pytest.approx(
+            percentile(values, q), rel=0.02
+        )
+
+
+def test_downsampling_keeps_shape():
+    """Downsampling keeps the first and last points, and the peaks of the series."""
+    values = [math.sin(i / 100) for i in range(5000)]
+    values[2500] = 10.0
+    series = make_series(values)
+
+    assert series.timestamps[0] == 0.0
+    assert series.timestamps[-1] == len(values) - 1
+    assert list(series.timestamps) == sorted(series.timestamps)
+    assert 10.0 in series.values
+
+
+def test_downsampling_covers_whole_run():
+    """Repeated downsampling keeps points spread over the whole run, not only its end."""
+    n = 100000
+    series = make_series(
+        [math.sin(i / 1000) for i in range(n)], max_points=1024
+    )
+
+    assert len(series.values) <= 1024
+    deciles = [0] * 10
+    for timestamp in series.timestamps:
+        deciles[min(int(timestamp * 10 / n), 9)] += 1
+    for count in deciles:
+        assert count >= len(series.values) / 20
+
+
+def test_sketch():
+    """The sketch handles negative values and zeros."""
+    sketch = QuantileSketch(0.01)
+    for value in [-10.0, -1.0, 0.0, 0.0, 1.0, 10.0]:
+        sketch.add(value)
+
+    assert sketch.quantile(0) == pytest.approx(-10.0, rel=0.01)
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1) == pytest.approx(10.0, rel=0.01)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+
+
+def test_serde() -> None:
+    """TimeSeries can be converted to model and back."""
+    series = make_series([float(i % 7) for i in range(200)])
+
+    loaded = typing.cast(TimeSeries, TimeSeries.from_model(series.to_model()))
+
+    assert loaded == series
+    assert list(loaded.values) == list(series.values)
+    assert loaded.percentile(95) == series.percentile(95)
+
+
+def test_save_load(
+    store_with_context: Tuple[ArtifactStore, Context]  # noqa
+) -> None:
+    """TimeSeries can be saved to and loaded from artifact store."""
+    store, ctx = store_with_context
+    series = make_series([1.0, 2.0, 3.0])
+    series.save_with(ctx, store)
+
+    loaded = TimeSeries.load_with("id.value", context=ctx, store=store)
+    assert loaded == series
+
+
+def test_p95_less_than() -> None:
+    series = make_series([float(i) for i in range(100)])
+
+    assert bool(TimeSeries.p95_less_than(100)(series))
+    assert not bool(TimeSeries.p95_less_than(90)(series))
+    assert not bool(TimeSeries.p95_less_than(100)(make_series([])))
+
+
+def test_max_less_than() -> None:
+    series = make_series([1.0, 5.0, 2.0])
+
+    assert bool(TimeSeries.max_less_than(6)(series))
+    assert not bool(TimeSeries.max_less_than(5)(series))